@@ -0,0 +1,455 @@
+"""
+Benchmarks for the hot paths of ResourceManager.
+
+Run from the repository root:
+
+    python benchmarks/bench_resource_manager.py
+    python benchmarks/bench_resource_manager.py --quick --compare
+
+Results are written as JSON to benchmarks/results/latest.json, or the path given
+with --output. --save-baseline also stores them as the baseline, and --compare checks
+them against the stored baseline, exiting with an error if any benchmark is slower
+than the allowed threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+# Headless, so the benchmarks can run on machines without a display or sound card.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import resource_manager as rm  # noqa: E402
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+RESULTS_DIR = pathlib.Path(__file__).parent / "results"
+
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], dict[str, float]]] = {}
+
+
+def benchmark(function: Callable[[argparse.Namespace], dict[str, float]]):
+    """
+    Registers a benchmark. Each benchmark returns a dictionary of measurement names
+    and the time per operation in seconds.
+    """
+    BENCHMARKS[function.__name__.removeprefix("bench_")] = function
+    return function
+
+
+def measure(operation: Callable[[], object], number: int, repeat: int) -> float:
+    """
+    Times the operation, returning the best time per call over several repeats.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def identity_loader(resource_location: int) -> int:
+    return resource_location
+
+
+@benchmark
+def bench_get_hit(args: argparse.Namespace) -> dict[str, float]:
+    manager = rm.ResourceManager[int]("bench")
+    manager.config(loader_helper=identity_loader)
+    manager.force_load("asset", 1)
+    results = {"plain": measure(lambda: manager.get("asset"), 100_000, args.repeat)}
+
+    from src.resourceful.cache_policy import LRUPolicy
+
+    manager.config(cache_policy=LRUPolicy(max_items=1024))
+    results["lru"] = measure(lambda: manager.get("asset"), 100_000, args.repeat)
+    return results
+
+
+@benchmark
+def bench_miss_load(args: argparse.Namespace) -> dict[str, float]:
+    count = 10_000
+    manager = rm.ResourceManager[int]("bench")
+    manager.config(loader_helper=identity_loader)
+    handles = [f"asset{i}" for i in range(count)]
+    for i, asset_handle in enumerate(handles):
+        manager.import_asset(asset_handle, i)
+
+    def load_all():
+        manager.cache.clear()
+        for asset_handle in handles:
+            manager.get(asset_handle)
+
+    return {"per_asset": measure(load_all, 1, args.repeat) / count}
+
+
+@benchmark
+def bench_import_directory(args: argparse.Namespace) -> dict[str, float]:
+    sizes = [1_000, 10_000] if args.quick else [1_000, 10_000, 100_000]
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in sizes:
+            root = pathlib.Path(temp_dir) / str(size)
+            make_tree(root, size)
+            manager = rm.ResourceManager[int]("bench")
+
+            def import_tree():
+                manager.resource_locations.clear()
+                manager.import_directory(root, recursive=True)
+
+            results[f"{size}_files"] = measure(import_tree, 1, args.repeat)
+    return results
+
+
+def make_tree(root: pathlib.Path, size: int, per_folder: int = 100) -> None:
+    """
+    Creates a tree of empty files, spread over nested folders.
+    """
+    for i in range(size):
+        folder = root / f"group{i // (per_folder * 10)}" / f"set{i // per_folder}"
+        if i % per_folder == 0:
+            folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"sprite_{i}.png").touch()
+
+
+@benchmark
+def bench_suggestion(args: argparse.Namespace) -> dict[str, float]:
+    sizes = [1_000, 10_000] if args.quick else [1_000, 10_000, 100_000]
+    results: dict[str, float] = {}
+    for size in sizes:
+        manager = rm.ResourceManager[int]("bench")
+        for i in range(size):
+            manager.import_asset(f"tiles/grass/grass_{i:06d}", i)
+
+        def miss():
+            try:
+                manager.get("tiles/grass/grass_00042x")
+            except KeyError:
+                pass
+
+        number = max(1, 10_000 // size)
+        results[f"{size}_handles"] = measure(miss, number, args.repeat)
+    return results
+
+
+@benchmark
+def bench_get_resource_manager(args: argparse.Namespace) -> dict[str, float]:
+    class Asset:
+        pass
+
+    rm.getResourceManager(Asset, "bench")
+    return {
+        "lookup": measure(
+            lambda: rm.getResourceManager(Asset, "bench"), 100_000, args.repeat
+        )
+    }
+
+
+def import_time(statement: str, repeat: int) -> float:
+    """
+    Times the imports done by the statement in fresh interpreters, returning the
+    best result. Interpreter startup itself is left out.
+    """
+    best = float("inf")
+    # The first run may also write the bytecode caches, so it isn't counted.
+    for _ in range(repeat + 1):
+        report = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        total = 0
+        for line in report.splitlines():
+            # Top level imports are the ones without indentation before their name.
+            fields = line.split("|")
+            if (
+                len(fields) == 3
+                and fields[1].strip().isdigit()
+                and not fields[2].startswith("  ")
+            ):
+                total += int(fields[1])
+        best = min(best, total / 1_000_000)
+    return best
+
+
+@benchmark
+def bench_import_time(args: argparse.Namespace) -> dict[str, float]:
+    site = import_time("pass", args.repeat)
+    results = {"package": import_time("import src.resourceful", args.repeat) - site}
+    if pygame is not None:
+        results["image_manager"] = (
+            import_time(
+                "import src.resourceful; src.resourceful.getImageManager()",
+                args.repeat,
+            )
+            - site
+        )
+    return results
+
+
+@benchmark
+def bench_pygame_loaders(args: argparse.Namespace) -> dict[str, float]:
+    if pygame is None:
+        return {}
+    from src.resourceful.pygame import pygame_prebuilt
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = pathlib.Path(temp_dir)
+        surface = pygame.Surface((256, 256), pygame.SRCALPHA)
+        for x in range(0, 256, 16):
+            pygame.draw.line(surface, (x, 255 - x, 128, 200), (x, 0), (255 - x, 255))
+        pygame.image.save(surface, str(root / "sample.png"))
+        pygame.image.save(surface, str(root / "sample.bmp"))
+        results["png_256"] = measure(
+            lambda: pygame_prebuilt._convert_image(
+                pygame_prebuilt._load_pygame_images(root / "sample.png")
+            ),
+            20,
+            args.repeat,
+        )
+        results["bmp_256"] = measure(
+            lambda: pygame_prebuilt._convert_image(
+                pygame_prebuilt._load_pygame_images(root / "sample.bmp")
+            ),
+            20,
+            args.repeat,
+        )
+
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            return results
+        with wave.open(str(root / "sample.wav"), "wb") as sample:
+            sample.setnchannels(2)
+            sample.setsampwidth(2)
+            sample.setframerate(44100)
+            sample.writeframes(bytes(44100 * 4))
+        results["wav_1s"] = measure(
+            lambda: pygame_prebuilt._load_pygame_sounds(root / "sample.wav"),
+            10,
+            args.repeat,
+        )
+    return results
+
+
+@benchmark
+def bench_process_loader(args: argparse.Namespace) -> dict[str, float]:
+    if pygame is None:
+        return {}
+    from src.resourceful.pygame import pygame_codecs, pygame_prebuilt
+    from src.resourceful.process_loader import ProcessLoader
+
+    count = 16 if args.quick else 64
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = pathlib.Path(temp_dir)
+        surface = pygame.Surface((512, 512), pygame.SRCALPHA)
+        for x in range(0, 512, 8):
+            pygame.draw.line(surface, (x % 256, 128, 255 - x % 256), (x, 0), (0, x))
+        for i in range(count):
+            pygame.image.save(surface, str(root / f"image_{i}.png"))
+
+        process_loader = ProcessLoader(pygame_codecs.SurfaceCodec())
+        for mode, pool in (("threads", None), ("processes", process_loader)):
+            manager = rm.ResourceManager[pygame.Surface](f"bench_{mode}")
+            manager.config(
+                loader_helper=pygame_prebuilt._load_pygame_images,
+                process_loader=pool,
+            )
+            for i in range(count):
+                manager.import_asset(f"image_{i}", str(root / f"image_{i}.png"))
+
+            def preload_all():
+                for asset_handle in manager.resource_locations:
+                    manager.uncache(asset_handle)
+                manager.preload(manager.resource_locations).wait()
+
+            preload_all()  # Starts the worker pools.
+            results[f"png_512_{mode}"] = measure(preload_all, 1, args.repeat) / count
+        process_loader.shutdown()
+    return results
+
+
+@benchmark
+def bench_warm_cache(args: argparse.Namespace) -> dict[str, float]:
+    if pygame is None:
+        return {}
+    from src.resourceful.pygame import pygame_codecs, pygame_prebuilt
+    from src.resourceful.warm_cache import WarmCache
+
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = pathlib.Path(temp_dir)
+        surface = pygame.Surface((512, 512), pygame.SRCALPHA)
+        for x in range(0, 512, 8):
+            pygame.draw.line(surface, (x % 256, 128, 255 - x % 256), (x, 0), (0, x))
+        pygame.image.save(surface, str(root / "image.png"))
+        results["png_512_reload"] = measure(
+            lambda: pygame_prebuilt._load_pygame_images(root / "image.png"),
+            10,
+            args.repeat,
+        )
+
+    warm_cache = WarmCache(pygame_codecs.SurfaceCodec())
+    results["png_512_demote"] = measure(
+        lambda: warm_cache.store("image", surface), 10, args.repeat
+    )
+
+    def promote():
+        warm_cache.store("image", surface)
+        warm_cache.take("image")
+
+    results["png_512_promote"] = (
+        measure(promote, 10, args.repeat) - results["png_512_demote"]
+    )
+    return results
+
+
+@benchmark
+def bench_prefetch(args: argparse.Namespace) -> dict[str, float]:
+    from src.resourceful.access_trace import PrefetchPlanner
+
+    count = 10 if args.quick else 20
+
+    def slow_loader(resource_location: int) -> int:
+        time.sleep(0.005)
+        return resource_location
+
+    def run(manager: rm.ResourceManager, planner: PrefetchPlanner | None) -> float:
+        """
+        Requests each asset in turn, as a game would over several frames.
+
+        :return: Average time spent waiting per request.
+        """
+        waited = 0.0
+        if planner is not None:
+            planner.start()
+        for i in range(count):
+            time.sleep(0.01)
+            if planner is not None:
+                planner.update()
+            start = time.perf_counter()
+            manager.get(f"asset{i}")
+            waited += time.perf_counter() - start
+        return waited / count
+
+    results: dict[str, float] = {}
+    for mode in ("first_run", "planned"):
+        manager = rm.ResourceManager[int](f"bench_{mode}")
+        manager.config(loader_helper=slow_loader, record_trace=mode == "first_run")
+        for i in range(count):
+            manager.import_asset(f"asset{i}", i)
+        if mode == "first_run":
+            results[mode] = run(manager, None)
+            trace = manager.trace
+        else:
+            results[mode] = run(manager, PrefetchPlanner(manager, trace))
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """
+    :return: Descriptions of every measurement slower than the baseline by more than
+    the threshold.
+    """
+    regressions: list[str] = []
+    for name, measurements in results.items():
+        for key, seconds in measurements.items():
+            expected = baseline.get(name, {}).get(key)
+            if expected and seconds > expected * threshold:
+                regressions.append(
+                    f"{name}.{key}: {format_time(seconds)} "
+                    f"(baseline {format_time(expected)}, x{seconds / expected:.2f})"
+                )
+    return regressions
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("names", nargs="*", help="Benchmarks to run, defaults to all.")
+    parser.add_argument("--quick", action="store_true", help="Skip the largest sizes.")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Repeats per measurement."
+    )
+    parser.add_argument("--output", type=pathlib.Path, default=None)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Slowdown factor counted as a regression, defaults to 1.25.",
+    )
+    args = parser.parse_args(argv)
+
+    names = args.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    results: dict[str, dict[str, float]] = {}
+    for name in names:
+        results[name] = BENCHMARKS[name](args)
+        for key, seconds in results[name].items():
+            print(f"{name}.{key}: {format_time(seconds)}")
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / "latest.json"
+    output.write_text(json.dumps(report, indent=2))
+    baseline_path = RESULTS_DIR / "baseline.json"
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        if not baseline_path.exists():
+            print("No baseline saved; run with --save-baseline first.")
+            return 1
+        baseline = json.loads(baseline_path.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,71 @@
+import importlib
+from typing import Any
+
 from .resource_manager import (  # noqa: F401
     getResourceManager,
     ResourceManager,
     NoDefault,
+    LoadFailure,
 )
+from .weak_cache import WeakCache  # noqa: F401
+
+# Everything else is imported the first time it's used, so programs only pay for the
+# parts they need. Names from .pygame need pygame installed.
+_LAZY_IMPORTS: dict[str, str] = {
+    "CachePolicy": ".cache_policy",
+    "LRUPolicy": ".cache_policy",
+    "LFUPolicy": ".cache_policy",
+    "PreloadProgress": ".preload",
+    "ResourceGroup": ".groups",
+    "GroupProgress": ".groups",
+    "getResourceGroup": ".groups",
+    "FileWatcher": ".watcher",
+    "ManagerStats": ".stats",
+    "HandleStats": ".stats",
+    "AccessTrace": ".access_trace",
+    "PrefetchPlanner": ".access_trace",
+    "AssetCodec": ".codec",
+    "PickleCodec": ".codec",
+    "DiskCache": ".disk_cache",
+    "WarmCache": ".warm_cache",
+    "ProcessLoader": ".process_loader",
+    "ArchiveEntry": ".archive",
+    "AssetArchive": ".archive",
+    "pack_assets": ".archive",
+    "pack_directory": ".archive",
+    "getImageManager": ".pygame",
+    "getSoundManager": ".pygame",
+    "DEFAULT_SURFACE": ".pygame",
+    "SurfaceCodec": ".pygame",
+    "SoundCodec": ".pygame",
+    "TextureAtlas": ".pygame",
+    "setImageAtlas": ".pygame",
+    "getImageVariant": ".pygame",
+    "convertImages": ".pygame",
+    "setStreamThreshold": ".pygame",
+    "StreamedSound": ".pygame",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ModuleNotFoundError as error:
+        if error.name != "pygame":
+            raise
+        # No pygame installed, no bonus functions for you.
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} (pygame is not installed)"
+        ) from error
+    value = getattr(module, name)
+    if name != "DEFAULT_SURFACE":
+        # Cached so later lookups skip this function entirely.
+        globals()[name] = value
+    return value
 
-try:
-    import pygame  # noqa: F401
-    from .pygame import getImageManager, getSoundManager, DEFAULT_SURFACE  # noqa: F401
 
-except ImportError:
-    # No pygame installed, no bonus functions for you.
-    pass
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
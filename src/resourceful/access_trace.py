@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from array import array
+import json
+import math
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .preload import PreloadProgress
+    from .resource_manager import ResourceManager
+
+
+class AccessTrace:
+    """
+    A record of the requests made to a resource manager: when each handle was
+    requested, whether it was cached, and how long it took to load if it wasn't.
+
+    Events are kept in flat arrays, about 21 bytes each, and recording stops once
+    max_events is reached. Since the beginning of a run is what a PrefetchPlanner
+    needs, later events are simply counted as dropped.
+    """
+
+    def __init__(self, max_events: int | None = 1_000_000) -> None:
+        """
+        Create an empty trace, with its clock starting now.
+
+        :param max_events: Most events recorded, or None for no limit, defaults to
+        1,000,000
+        """
+        self.max_events = max_events
+        self.dropped: int = 0
+        """
+        Number of events not recorded because the trace was full.
+        """
+        self.load_times: dict[str, float] = {}
+        """
+        Duration of the most recent successful load of each handle, in seconds,
+        including loads that weren't requested, such as preloads.
+        """
+        self.start_time: float = time.perf_counter()
+        self._handles: list[str] = []
+        self._handle_ids: dict[str, int] = {}
+        self._times = array("d")
+        self._ids = array("I")
+        self._hits = bytearray()
+        self._event_load_times = array("d")
+        """
+        Load time of each miss, or NaN for hits, and misses with no load of their own.
+        """
+        self._open_misses: dict[str, int] = {}
+        """
+        Misses waiting for their load to finish, by handle, and their event index.
+        """
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __iter__(self) -> Iterator[tuple[float, str, bool, float | None]]:
+        """
+        :return: Each recorded event, as the seconds since the trace started, the
+        handle, whether it was a cache hit, and the load time of a miss, or None.
+        """
+        handles = self._handles
+        for index in range(len(self._times)):
+            load_time = self._event_load_times[index]
+            yield (
+                self._times[index],
+                handles[self._ids[index]],
+                bool(self._hits[index]),
+                None if math.isnan(load_time) else load_time,
+            )
+
+    def restart(self) -> None:
+        """
+        Discards every event, and starts the trace's clock again.
+        """
+        with self._lock:
+            self.dropped = 0
+            self.load_times = {}
+            self.start_time = time.perf_counter()
+            self._handles = []
+            self._handle_ids = {}
+            self._times = array("d")
+            self._ids = array("I")
+            self._hits = bytearray()
+            self._event_load_times = array("d")
+            self._open_misses = {}
+
+    def record_hit(self, asset_handle: str) -> None:
+        """
+        Records a request answered from the cache.
+        """
+        with self._lock:
+            self._append(asset_handle, True)
+
+    def record_miss(self, asset_handle: str) -> None:
+        """
+        Records a request that required a load. The load time is filled in once the
+        load finishes.
+        """
+        with self._lock:
+            index = self._append(asset_handle, False)
+            if index is not None:
+                self._open_misses[asset_handle] = index
+
+    def record_load(self, asset_handle: str, seconds: float, success: bool) -> None:
+        """
+        Records the duration of a load.
+        """
+        with self._lock:
+            index = self._open_misses.pop(asset_handle, None)
+            if index is not None:
+                self._event_load_times[index] = seconds
+            if success:
+                self.load_times[asset_handle] = seconds
+
+    def save(self, path: os.PathLike | str) -> None:
+        """
+        Writes the trace to a JSON file, to plan preloads in later runs.
+
+        :param path: Location of the file to write.
+        """
+        with self._lock:
+            data = {
+                "version": 1,
+                "handles": self._handles,
+                "times": [round(timestamp, 6) for timestamp in self._times],
+                "ids": self._ids.tolist(),
+                "hits": list(self._hits),
+                "event_load_times": [
+                    None if math.isnan(seconds) else round(seconds, 6)
+                    for seconds in self._event_load_times
+                ],
+                "load_times": self.load_times,
+                "dropped": self.dropped,
+            }
+            text = json.dumps(data, separators=(",", ":"))
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    @classmethod
+    def read(cls, path: os.PathLike | str) -> AccessTrace:
+        """
+        Reads a trace written by save().
+
+        :param path: Location of the file to read.
+        :raises ValueError: If the file is not a trace this version can read.
+        :return: The trace.
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != 1:
+            raise ValueError(f"Unsupported trace version: {data.get('version')!r}")
+        trace = cls(max_events=None)
+        trace._handles = list(data["handles"])
+        trace._handle_ids = {handle: i for i, handle in enumerate(trace._handles)}
+        trace._times = array("d", data["times"])
+        trace._ids = array("I", data["ids"])
+        trace._hits = bytearray(data["hits"])
+        trace._event_load_times = array(
+            "d",
+            (
+                math.nan if seconds is None else seconds
+                for seconds in data["event_load_times"]
+            ),
+        )
+        trace.load_times = dict(data["load_times"])
+        trace.dropped = data["dropped"]
+        return trace
+
+    def _append(self, asset_handle: str, hit: bool) -> int | None:
+        index = len(self._times)
+        if self.max_events is not None and index >= self.max_events:
+            self.dropped += 1
+            return None
+        handle_id = self._handle_ids.get(asset_handle)
+        if handle_id is None:
+            handle_id = self._handle_ids[asset_handle] = len(self._handles)
+            self._handles.append(asset_handle)
+        self._times.append(time.perf_counter() - self.start_time)
+        self._ids.append(handle_id)
+        self._hits.append(hit)
+        self._event_load_times.append(math.nan)
+        return index
+
+
+class PrefetchPlanner:
+    """
+    Preloads assets ahead of when a previous run's trace shows they were needed, so
+    that requests which missed last time find them cached.
+
+    Each handle is planned for its first request in the trace, and for every later
+    request that missed, such as after being evicted. It is preloaded early enough
+    for its recorded load time, plus the lead time, to pass before it is needed.
+    """
+
+    def __init__(
+        self,
+        manager: ResourceManager,
+        trace: AccessTrace,
+        lead: float = 0.25,
+        default_load_time: float = 0.0,
+    ) -> None:
+        """
+        Plans the preloads for a manager from a trace.
+
+        :param manager: The manager to preload the assets of.
+        :param trace: A trace of a previous run, such as one read with
+        AccessTrace.read().
+        :param lead: Extra seconds to preload each asset ahead of its recorded load
+        time, defaults to 0.25
+        :param default_load_time: Load time assumed for handles with no load in the
+        trace, defaults to 0.0
+        """
+        self.manager = manager
+        self.lead = lead
+        seen: set[str] = set()
+        plan: list[tuple[float, str]] = []
+        for timestamp, asset_handle, hit, _ in trace:
+            if hit and asset_handle in seen:
+                continue
+            seen.add(asset_handle)
+            load_time = trace.load_times.get(asset_handle, default_load_time)
+            plan.append((max(timestamp - load_time - lead, 0.0), asset_handle))
+        plan.sort()
+        self.plan: list[tuple[float, str]] = plan
+        """
+        The seconds after start() when each handle is preloaded, in order.
+        """
+        self._next: int = 0
+        self._start_time: float | None = None
+
+    @property
+    def remaining(self) -> int:
+        """
+        Number of planned preloads not yet started.
+        """
+        return len(self.plan) - self._next
+
+    def done(self) -> bool:
+        """
+        :return: True if every planned preload has been started.
+        """
+        return self._next >= len(self.plan)
+
+    def start(self) -> PreloadProgress | None:
+        """
+        Starts following the plan, with its clock starting now. Call it at the same
+        point of the run that the trace started recording at, then call update()
+        regularly, such as once per frame.
+
+        :return: Progress of the preloads due right away, or None if there are none.
+        """
+        self._next = 0
+        self._start_time = time.perf_counter()
+        return self.update(0.0)
+
+    def update(self, elapsed: float | None = None) -> PreloadProgress | None:
+        """
+        Preloads every asset whose planned time has come.
+
+        :param elapsed: Seconds since the plan started, defaults to None, measuring
+        them from when start() was called.
+        :raises RuntimeError: If elapsed is not given, and the planner hasn't been
+        started.
+        :return: Progress of the preloads started, or None if there were none.
+        """
+        if elapsed is None:
+            if self._start_time is None:
+                raise RuntimeError("PrefetchPlanner.update() called before start().")
+            elapsed = time.perf_counter() - self._start_time
+        plan = self.plan
+        first = self._next
+        end = first
+        while end < len(plan) and plan[end][0] <= elapsed:
+            end += 1
+        if end == first:
+            return None
+        self._next = end
+        asset_handles = [
+            asset_handle
+            for _, asset_handle in plan[first:end]
+            if asset_handle in self.manager.resource_locations
+        ]
+        return self.manager.preload(asset_handles)
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+import io
+import json
+import mmap
+import os
+from pathlib import Path
+import struct
+import zlib
+
+from .directory_scan import default_handle, scan_directory
+
+
+_MAGIC = b"RSFA"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBxxxQQ")
+"""
+Magic, format version, index offset, index length.
+"""
+_DATA_ALIGNMENT = 16
+
+CODECS = ("raw", "zlib")
+"""
+Ways an entry's data can be stored in an archive.
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveEntry:
+    """
+    Location data for a single file stored in an asset archive.
+    """
+
+    archive: AssetArchive
+    """
+    The archive holding the file.
+    """
+    handle: str
+    """
+    The name of the entry in the archive.
+    """
+    name: str
+    """
+    The original file name, useful as a hint of the file's type.
+    """
+    offset: int
+    """
+    Position of the entry's data in the archive.
+    """
+    length: int
+    """
+    Size of the entry's data in the archive.
+    """
+    codec: str
+    """
+    How the entry's data is stored, one of CODECS.
+    """
+
+    def read(self) -> memoryview:
+        """
+        :return: The contents of the file. Uncompressed entries are a view directly
+        into the archive's memory map, without copying.
+        """
+        data = self.archive._view[self.offset : self.offset + self.length]
+        if self.codec == "zlib":
+            return memoryview(zlib.decompress(data))
+        return data
+
+    def open(self) -> MemoryViewReader:
+        """
+        :return: A read-only file-like object over the contents of the file.
+        """
+        return MemoryViewReader(self.read(), self.name)
+
+
+class MemoryViewReader(io.RawIOBase):
+    """
+    A read-only, seekable file-like object over a memoryview, reading directly from the
+    underlying buffer.
+    """
+
+    def __init__(self, view: memoryview, name: str = "") -> None:
+        super().__init__()
+        self._view = view.cast("B")
+        self._position = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}.")
+        self._position = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._position
+        end = len(self._view) if size < 0 else min(start + size, len(self._view))
+        if end <= start:
+            return b""
+        self._position = end
+        return self._view[start:end].tobytes()
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, buffer) -> int:
+        data = self._view[self._position : self._position + len(buffer)]
+        length = len(data)
+        memoryview(buffer).cast("B")[:length] = data
+        self._position += length
+        return length
+
+    def getbuffer(self) -> memoryview:
+        """
+        :return: The full underlying buffer, without copying.
+        """
+        return self._view
+
+
+class AssetArchive:
+    """
+    A single file holding many packed assets, read through one memory map.
+
+    Archives are created with pack_assets or pack_directory, and can be imported into a
+    resource manager with ResourceManager.import_archive, which uses ArchiveEntry
+    objects as location data.
+    """
+
+    def __init__(self, path: os.PathLike | str) -> None:
+        """
+        Open an existing archive.
+
+        :param path: Location of the archive file.
+        :raises ValueError: If the file is not a valid archive.
+        """
+        self.path = Path(path)
+        """
+        Location of the archive file.
+        """
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        try:
+            magic, version, index_offset, index_length = _HEADER.unpack_from(
+                self._map, 0
+            )
+        except struct.error as error:
+            raise ValueError(f"'{path}' is not an asset archive.") from error
+        if magic != _MAGIC:
+            raise ValueError(f"'{path}' is not an asset archive.")
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"'{path}' has unsupported archive version {version}.")
+        index = json.loads(
+            self._map[index_offset : index_offset + index_length].decode("utf-8")
+        )
+        self.entries: dict[str, ArchiveEntry] = {
+            handle: ArchiveEntry(self, handle, name, offset, length, codec)
+            for handle, (name, offset, length, codec) in index.items()
+        }
+        """
+        Dictionary of all entries in the archive, by handle.
+        """
+
+    def __repr__(self) -> str:
+        return f"<AssetArchive '{self.path}' ({len(self.entries)} entries)>"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __getitem__(self, handle: str) -> ArchiveEntry:
+        return self.entries[handle]
+
+    def __enter__(self) -> AssetArchive:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def read(self, handle: str) -> memoryview:
+        """
+        :param handle: The name of the entry.
+        :return: The contents of the entry.
+        """
+        return self.entries[handle].read()
+
+    def open(self, handle: str) -> MemoryViewReader:
+        """
+        :param handle: The name of the entry.
+        :return: A read-only file-like object over the contents of the entry.
+        """
+        return self.entries[handle].open()
+
+    def close(self) -> None:
+        """
+        Closes the archive's memory map. Fails with BufferError while any views into
+        the archive are still in use.
+        """
+        self._view.release()
+        self._map.close()
+
+
+def pack_assets(
+    assets: Mapping[str, os.PathLike | str],
+    archive_path: os.PathLike | str,
+    compress: bool | Callable[[Path], bool] = False,
+) -> AssetArchive:
+    """
+    Packs the given files into a single archive.
+
+    :param assets: Dictionary of handles and the paths of the files to pack for them.
+    :param archive_path: Location of the archive to create. Any existing file is
+    replaced.
+    :param compress: Whether to compress entries with zlib, or a function taking a
+    file path and returning whether to compress it. Compressed entries must be copied
+    when read, so compression is best saved for large, compressible files. Defaults to
+    False.
+    :return: The newly created archive, opened for reading.
+    """
+    index: dict[str, tuple[str, int, int, str]] = {}
+    archive_path = Path(archive_path)
+    temp_path = archive_path.with_name(archive_path.name + ".tmp")
+    with open(temp_path, "wb") as archive:
+        archive.write(bytes(_HEADER.size))
+        for handle, file_path in assets.items():
+            file_path = Path(file_path)
+            data = file_path.read_bytes()
+            codec = "raw"
+            if compress is True or (callable(compress) and compress(file_path)):
+                data = zlib.compress(data)
+                codec = "zlib"
+            archive.write(bytes(-archive.tell() % _DATA_ALIGNMENT))
+            index[handle] = (file_path.name, archive.tell(), len(data), codec)
+            archive.write(data)
+        index_data = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        index_offset = archive.tell()
+        archive.write(index_data)
+        archive.seek(0)
+        archive.write(
+            _HEADER.pack(_MAGIC, _FORMAT_VERSION, index_offset, len(index_data))
+        )
+    os.replace(temp_path, archive_path)
+    return AssetArchive(archive_path)
+
+
+def pack_directory(
+    folder: os.PathLike | str,
+    archive_path: os.PathLike | str,
+    recursive: bool = True,
+    file_filter: Callable | None = None,
+    name_generator: Callable | None = None,
+    compress: bool | Callable[[Path], bool] = False,
+) -> AssetArchive:
+    """
+    Packs the files of a directory into a single archive. Files are selected and named
+    the same way as with ResourceManager.import_directory.
+
+    :param folder: Target directory
+    :param archive_path: Location of the archive to create.
+    :param recursive: Whether to include subdirectories, defaults to True
+    :param file_filter: A function for choosing files to pack, defaults all files.
+    :param name_generator: A function for creating handles from files, defaults to the
+    relative path to the directory plus the name of the file, without suffixes.
+    :param compress: Whether to compress entries, as with pack_assets.
+    :return: The newly created archive, opened for reading.
+    """
+    root = os.fspath(folder)
+    if not os.path.isdir(root):
+        raise NotADirectoryError(f"'{folder}' is not a valid directory.")
+    root_length = len(root) if root.endswith(os.sep) else len(root) + 1
+    assets: dict[str, str] = {}
+    for entry in scan_directory(root, recursive, file_filter):
+        if name_generator is None:
+            assets[default_handle(entry.path, root_length)] = entry.path
+        else:
+            assets[name_generator(Path(entry.path))] = entry.path
+    return pack_assets(assets, archive_path, compress)
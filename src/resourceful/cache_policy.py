@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+import sys
+from typing import Any
+
+
+class CachePolicy:
+    """
+    Base class for cache eviction policies. A policy tracks the handles held in a
+    resource manager's cache, and decides which of them should be dropped once the
+    cache grows beyond its budget.
+
+    Evicted assets keep their resource location, so they will be lazily reloaded the
+    next time they are requested.
+    """
+
+    def __init__(
+        self,
+        max_items: int | None = None,
+        max_size: int | None = None,
+        sizer: Callable[[Any], int] | None = None,
+    ) -> None:
+        """
+        Create a policy with the given budget. If no limits are given, the policy
+        tracks usage but never evicts.
+
+        :param max_items: Maximum number of assets to keep cached, defaults to None
+        (unlimited).
+        :param max_size: Maximum total size of the cached assets, as measured by
+        sizer, defaults to None (unlimited).
+        :param sizer: Function taking an asset and returning its cost, typically in
+        bytes. Defaults to sys.getsizeof, which is shallow and will badly
+        underestimate most real assets, so supplying one is strongly recommended.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be at least 1.")
+        if max_size is not None and max_size < 0:
+            raise ValueError("max_size cannot be negative.")
+        self.max_items = max_items
+        """
+        Maximum number of cached assets, or None for no limit.
+        """
+        self.max_size = max_size
+        """
+        Maximum total cost of cached assets, or None for no limit.
+        """
+        self.sizer: Callable[[Any], int] = sizer if sizer is not None else sys.getsizeof
+        """
+        Function used to measure the cost of an asset.
+        """
+        self.current_size: int = 0
+        """
+        The total cost of all tracked assets.
+        """
+        self._sizes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, asset_handle: str) -> bool:
+        return asset_handle in self._sizes
+
+    def insert(self, asset_handle: str, asset: Any) -> None:
+        """
+        Begins tracking a newly cached asset, or refreshes the record of a replaced one.
+
+        :param asset_handle: The name of the cached asset.
+        :param asset: The asset now held in the cache.
+        """
+        size = self.sizer(asset) if self.max_size is not None else 0
+        old_size = self._sizes.get(asset_handle)
+        if old_size is not None:
+            self.current_size -= old_size
+            self.access(asset_handle)
+        else:
+            self._track(asset_handle)
+        self._sizes[asset_handle] = size
+        self.current_size += size
+
+    def access(self, asset_handle: str) -> None:
+        """
+        Records a cache hit on the given handle.
+
+        :param asset_handle: The name of the requested asset.
+        """
+        raise NotImplementedError
+
+    def remove(self, asset_handle: str) -> None:
+        """
+        Stops tracking the given handle. Safe to call with untracked handles.
+
+        :param asset_handle: The name of the asset leaving the cache.
+        """
+        size = self._sizes.pop(asset_handle, None)
+        if size is None:
+            return
+        self.current_size -= size
+        self._untrack(asset_handle)
+
+    def over_budget(self) -> bool:
+        """
+        :return: True if the tracked assets exceed either limit.
+        """
+        if self.max_items is not None and len(self._sizes) > self.max_items:
+            return True
+        return self.max_size is not None and self.current_size > self.max_size
+
+    def pop_victim(self, protected: str | None = None) -> str | None:
+        """
+        Chooses the next asset to evict and stops tracking it.
+
+        :param protected: A handle that must not be chosen, typically the asset that
+        was just loaded.
+        :return: The handle to evict, or None if there is nothing left to evict.
+        """
+        victim = self._select_victim(protected)
+        if victim is not None:
+            self.remove(victim)
+        return victim
+
+    def clear(self) -> None:
+        """
+        Forgets all tracked handles.
+        """
+        for asset_handle in list(self._sizes):
+            self.remove(asset_handle)
+
+    def _track(self, asset_handle: str) -> None:
+        raise NotImplementedError
+
+    def _untrack(self, asset_handle: str) -> None:
+        raise NotImplementedError
+
+    def _select_victim(self, protected: str | None) -> str | None:
+        raise NotImplementedError
+
+
+class LRUPolicy(CachePolicy):
+    """
+    Evicts the least recently used asset first.
+    """
+
+    def __init__(
+        self,
+        max_items: int | None = None,
+        max_size: int | None = None,
+        sizer: Callable[[Any], int] | None = None,
+    ) -> None:
+        super().__init__(max_items, max_size, sizer)
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def access(self, asset_handle: str) -> None:
+        try:
+            self._order.move_to_end(asset_handle)
+        except KeyError:
+            pass
+
+    def _track(self, asset_handle: str) -> None:
+        self._order[asset_handle] = None
+
+    def _untrack(self, asset_handle: str) -> None:
+        self._order.pop(asset_handle, None)
+
+    def _select_victim(self, protected: str | None) -> str | None:
+        for asset_handle in self._order:
+            if asset_handle != protected:
+                return asset_handle
+        return None
+
+
+class LFUPolicy(CachePolicy):
+    """
+    Evicts the least frequently used asset first. Ties are broken by evicting the
+    least recently used of the tied assets.
+    """
+
+    def __init__(
+        self,
+        max_items: int | None = None,
+        max_size: int | None = None,
+        sizer: Callable[[Any], int] | None = None,
+    ) -> None:
+        super().__init__(max_items, max_size, sizer)
+        self._counts: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+
+    def access(self, asset_handle: str) -> None:
+        count = self._counts.get(asset_handle)
+        if count is None:
+            return
+        self._leave_bucket(asset_handle, count)
+        self._counts[asset_handle] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[asset_handle] = None
+
+    def _track(self, asset_handle: str) -> None:
+        self._counts[asset_handle] = 1
+        self._buckets.setdefault(1, OrderedDict())[asset_handle] = None
+
+    def _untrack(self, asset_handle: str) -> None:
+        count = self._counts.pop(asset_handle, None)
+        if count is not None:
+            self._leave_bucket(asset_handle, count)
+
+    def _leave_bucket(self, asset_handle: str, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[asset_handle]
+        if not bucket:
+            del self._buckets[count]
+
+    def _select_victim(self, protected: str | None) -> str | None:
+        for count in sorted(self._buckets):
+            for asset_handle in self._buckets[count]:
+                if asset_handle != protected:
+                    return asset_handle
+        return None
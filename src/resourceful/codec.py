@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+
+class AssetCodec:
+    """
+    Base class for converting assets to and from raw bytes, so they can be stored
+    outside of the running program and rebuilt later without running their loader.
+
+    Subclasses should store the asset's decoded data, such as pixel or sample buffers,
+    so that rebuilding the asset is cheaper than loading it from scratch.
+    """
+
+    def encode(self, asset: Any) -> tuple[dict[str, Any], bytes]:
+        """
+        Converts the asset into metadata and a raw data buffer.
+
+        :param asset: The asset to be encoded.
+        :raises TypeError: If the codec can't encode this kind of asset.
+        :return: A tuple of JSON-compatible metadata needed to rebuild the asset, and
+        a bytes-like object holding the asset's data.
+        """
+        raise NotImplementedError
+
+    def decode(self, metadata: dict[str, Any], data: memoryview) -> Any | None:
+        """
+        Rebuilds an asset from the output of encode.
+
+        The data buffer may be backed by a memory-mapped file. Codecs are free to
+        create assets that reference the buffer directly instead of copying it.
+
+        :param metadata: The metadata produced by encode.
+        :param data: The data buffer produced by encode.
+        :return: The rebuilt asset, or None if it can't be rebuilt in the current
+        environment, in which case the asset is loaded normally instead.
+        """
+        raise NotImplementedError
+
+
+class PickleCodec(AssetCodec):
+    """
+    Encodes assets with pickle. Works for any picklable asset, but does not avoid any
+    work for assets whose pickled form must be decoded again.
+
+    Only decode data from sources you trust.
+    """
+
+    def encode(self, asset: Any) -> tuple[dict[str, Any], bytes]:
+        return {}, pickle.dumps(asset, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, metadata: dict[str, Any], data: memoryview) -> Any | None:
+        return pickle.loads(data)
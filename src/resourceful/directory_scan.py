@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+from pathlib import Path
+
+
+def scan_directory(
+    folder: os.PathLike | str,
+    recursive: bool = False,
+    file_filter: Callable | None = None,
+    workers: int | None = None,
+) -> list[os.DirEntry]:
+    """
+    Lists the files of a directory using os.scandir, reusing the file type information
+    the directory listing already holds instead of checking each entry separately.
+
+    Results are in the same order regardless of the number of workers.
+
+    :param folder: Target directory
+    :param recursive: Whether to recursively search through subdirectories,
+    defaults to False
+    :param file_filter: A function taking a Path and returning a falsy value for
+    entries to skip, defaults to None. Called for subdirectories as well.
+    :param workers: Number of threads used to scan subdirectories in parallel. Defaults
+    to None, which scans everything in the calling thread.
+    :return: List of the directory entries of all accepted files.
+    """
+    files: list[os.DirEntry] = []
+    level = [os.fspath(folder)]
+    executor = None
+    if workers and workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(workers)
+    try:
+        while level:
+            if executor is not None and len(level) > 1:
+                results = executor.map(_scan_one, level, [file_filter] * len(level))
+            else:
+                results = (_scan_one(directory, file_filter) for directory in level)
+            level = []
+            for directory_files, subdirectories in results:
+                files.extend(directory_files)
+                if recursive:
+                    level.extend(subdirectories)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return files
+
+
+def _scan_one(
+    directory: str, file_filter: Callable | None
+) -> tuple[list[os.DirEntry], list[str]]:
+    """
+    Lists a single directory.
+
+    :return: A tuple of the accepted files and the paths of accepted subdirectories.
+    """
+    files: list[os.DirEntry] = []
+    subdirectories: list[str] = []
+    with os.scandir(directory) as entries:
+        # Sorted so results don't depend on the file system's listing order.
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            if file_filter is not None and not file_filter(Path(entry.path)):
+                # Filter first so the filter can be used to exclude specific folders.
+                continue
+            if entry.is_dir():
+                subdirectories.append(entry.path)
+            else:
+                files.append(entry)
+    return files, subdirectories
+
+
+def default_handle(file_path: str, root_length: int) -> str:
+    """
+    Creates the default asset handle for a file: its path relative to the imported
+    directory, using forward slashes, without any suffixes.
+
+    :param file_path: The path of the file, as given by scan_directory.
+    :param root_length: Length of the imported directory's path, including the
+    trailing separator.
+    :return: The handle for the file.
+    """
+    relative = file_path[root_length:]
+    if os.sep != "/":
+        relative = relative.replace(os.sep, "/")
+    head, _, name = relative.rpartition("/")
+    # Strip suffixes the way pathlib defines them: a dot that is neither the first
+    # nor the last character of the name.
+    while True:
+        dot = name.rfind(".")
+        if 0 < dot < len(name) - 1:
+            name = name[:dot]
+        else:
+            break
+    return f"{head}/{name}" if head else name
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+import pickle
+import stat
+import struct
+import tempfile
+from typing import Any
+
+from .codec import AssetCodec, PickleCodec
+
+
+_MAGIC = b"RSFC"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBxxxIQ")
+"""
+Magic, format version, metadata length, data offset.
+"""
+_DATA_ALIGNMENT = 64
+
+
+class DiskCache:
+    """
+    A persistent cache of decoded assets, stored as files in a directory.
+
+    Entries are keyed by the path of the source file, and are only used while the
+    source file's modification time and size (and optionally its contents) are
+    unchanged. Entries are read back through a memory map, so codecs can rebuild
+    assets directly from the mapped data.
+
+    Only locations that are paths to existing files can be cached. Other location
+    data is always loaded normally.
+    """
+
+    def __init__(
+        self,
+        directory: os.PathLike | str,
+        codec: AssetCodec | None = None,
+        version: str = "",
+        hash_contents: bool = False,
+    ) -> None:
+        """
+        Create a disk cache in the given directory, creating the directory if needed.
+
+        :param directory: Folder to store the cache entries in.
+        :param codec: Codec used to convert assets to and from bytes, defaults to
+        PickleCodec.
+        :param version: Any string describing how the assets are produced, such as a
+        version number for the loader. Changing it invalidates all existing entries.
+        :param hash_contents: Whether to also compare a hash of the source file's
+        contents before using an entry, defaults to False. Safer, but requires reading
+        every source file in full.
+        """
+        self.directory = Path(directory)
+        """
+        Folder holding the cache entries.
+        """
+        self.codec: AssetCodec = codec if codec is not None else PickleCodec()
+        """
+        Codec used to convert assets to and from bytes.
+        """
+        self.version = version
+        """
+        Version string mixed into every entry's key.
+        """
+        self.hash_contents = hash_contents
+        """
+        Whether source file contents are hashed when validating entries.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def load(self, resource_location: Any) -> Any | None:
+        """
+        Rebuilds the asset for the given location from the cache, if a valid entry
+        exists.
+
+        :param resource_location: The location data of the asset.
+        :return: The rebuilt asset, or None if there is no usable entry.
+        """
+        entry = self._entry_path(resource_location)
+        if entry is None:
+            return None
+        signature = self._signature(resource_location)
+        if signature is None:
+            return None
+        try:
+            with open(entry, "rb") as file:
+                # Copy-on-write, so codecs can hand the buffer to writable assets
+                # without ever changing the file.
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, version, metadata_length, offset = _HEADER.unpack_from(mapped, 0)
+            if magic != _MAGIC or version != _FORMAT_VERSION:
+                return None
+            header = json.loads(
+                mapped[_HEADER.size : _HEADER.size + metadata_length].decode("utf-8")
+            )
+            if header["signature"] != signature:
+                return None
+            metadata = header["metadata"]
+        except (struct.error, ValueError, KeyError, TypeError):
+            # Damaged or incompatible entry, so treat it as missing.
+            return None
+        try:
+            # The mapping is left for the garbage collector to close, as the asset
+            # may still be using it.
+            return self.codec.decode(metadata, memoryview(mapped)[offset:])
+        except Exception:
+            # Codecs raise all sorts of errors on damaged data, such as
+            # pickle.UnpicklingError or pygame.error, so treat it as missing too.
+            return None
+
+    def store(self, resource_location: Any, asset: Any) -> bool:
+        """
+        Writes the asset to the cache for the given location.
+
+        :param resource_location: The location data of the asset.
+        :param asset: The asset, as produced by the loader.
+        :return: True if the entry was written, False if the location or asset can't
+        be cached, or the entry could not be written.
+        """
+        entry = self._entry_path(resource_location)
+        if entry is None:
+            return False
+        signature = self._signature(resource_location)
+        if signature is None:
+            return False
+        try:
+            metadata, data = self.codec.encode(asset)
+        except (TypeError, AttributeError, pickle.PicklingError):
+            # The asset is still cached by the manager, just not on disk.
+            return False
+        header = json.dumps({"signature": signature, "metadata": metadata}).encode(
+            "utf-8"
+        )
+        offset = _HEADER.size + len(header)
+        padding = -offset % _DATA_ALIGNMENT
+        offset += padding
+        try:
+            descriptor, temp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return False
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(header), offset))
+                file.write(header)
+                file.write(bytes(padding))
+                file.write(data)
+            # Replace in one step, so readers never see a partial entry.
+            os.replace(temp_name, entry)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            return False
+        return True
+
+    def invalidate(self, resource_location: Any) -> None:
+        """
+        Removes the entry for the given location, if there is one.
+
+        :param resource_location: The location data of the asset.
+        """
+        entry = self._entry_path(resource_location)
+        if entry is None:
+            return
+        with contextlib.suppress(FileNotFoundError):
+            entry.unlink()
+
+    def clear(self) -> None:
+        """
+        Removes every entry in the cache.
+        """
+        for entry in self.directory.glob("*.rsfc"):
+            with contextlib.suppress(FileNotFoundError):
+                entry.unlink()
+
+    def _entry_path(self, resource_location: Any) -> Path | None:
+        if not isinstance(resource_location, (str, os.PathLike)):
+            return None
+        source = os.path.abspath(os.fspath(resource_location))
+        key = hashlib.sha1(f"{self.version}\0{source}".encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.rsfc"
+
+    def _signature(self, resource_location: Any) -> str | None:
+        """
+        Describes the current state of the source file, so stale entries can be
+        detected.
+        """
+        try:
+            source_stat = os.stat(resource_location)
+        except (OSError, TypeError, ValueError):
+            return None
+        if not stat.S_ISREG(source_stat.st_mode):
+            return None
+        signature = f"{source_stat.st_mtime_ns}:{source_stat.st_size}"
+        if self.hash_contents:
+            try:
+                with open(resource_location, "rb") as file:
+                    digest = hashlib.file_digest(file, "sha256").hexdigest()
+            except OSError:
+                # Deleted or unreadable since it was checked.
+                return None
+            signature += ":" + digest
+        return signature
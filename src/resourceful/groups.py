@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .preload import PreloadProgress
+    from .resource_manager import ResourceManager
+
+
+_groups: dict[str, ResourceGroup] = {}
+_references: dict[tuple[ResourceManager, str], int] = {}
+"""
+Number of live groups holding each asset, by its manager and handle.
+"""
+_lock = threading.RLock()
+
+
+class ResourceGroup:
+    """
+    A named set of assets, possibly spread over several managers, that are loaded and
+    released together, such as everything a level or scene needs.
+
+    Groups are reference counted per asset: releasing a group only uncaches the assets
+    that no other live group holds. To switch scenes without reloading the assets they
+    share, load the new scene's group before releasing the old one.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Create an empty group. Use getResourceGroup to share groups by name.
+
+        :param name: Name of the group.
+        """
+        self.name = name
+        self.handles: dict[ResourceManager, set[str]] = {}
+        """
+        The handles in the group, by the manager they belong to.
+        """
+        self.live: bool = False
+        """
+        Whether the group is loaded, and holds its assets in their caches.
+        """
+        self._progress: GroupProgress | None = None
+
+    def __repr__(self) -> str:
+        count = sum(len(asset_handles) for asset_handles in self.handles.values())
+        state = "live" if self.live else "released"
+        return f"<ResourceGroup {self.name!r}, {count} assets, {state}>"
+
+    def __enter__(self) -> ResourceGroup:
+        self.load().wait()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    def add(self, manager: ResourceManager, asset_handles: Iterable[str]) -> None:
+        """
+        Adds assets to the group. If the group is live, they are held right away, but
+        not loaded until the group is loaded again or they are requested.
+
+        :param manager: The manager the assets belong to.
+        :param asset_handles: The names of the resources.
+        """
+        with _lock:
+            group_handles = self.handles.setdefault(manager, set())
+            for asset_handle in asset_handles:
+                if asset_handle in group_handles:
+                    continue
+                group_handles.add(asset_handle)
+                if self.live:
+                    _hold(manager, asset_handle)
+
+    def remove(self, manager: ResourceManager, asset_handles: Iterable[str]) -> None:
+        """
+        Takes assets out of the group. If the group is live, they are uncached unless
+        another live group holds them.
+
+        :param manager: The manager the assets belong to.
+        :param asset_handles: The names of the resources.
+        """
+        with _lock:
+            group_handles = self.handles.get(manager)
+            if group_handles is None:
+                return
+            for asset_handle in asset_handles:
+                if asset_handle not in group_handles:
+                    continue
+                group_handles.discard(asset_handle)
+                if self.live:
+                    _drop(manager, asset_handle)
+            if not group_handles:
+                del self.handles[manager]
+
+    def load(self) -> GroupProgress:
+        """
+        Makes the group live, and begins loading all of its assets on their managers'
+        worker threads.
+
+        :return: A progress object for tracking or waiting on the loads.
+        """
+        with _lock:
+            if not self.live:
+                self.live = True
+                for manager, asset_handles in self.handles.items():
+                    for asset_handle in asset_handles:
+                        _hold(manager, asset_handle)
+            self._progress = GroupProgress(
+                {
+                    manager: manager.preload(asset_handles)
+                    for manager, asset_handles in self.handles.items()
+                }
+            )
+            return self._progress
+
+    def release(self) -> int:
+        """
+        Lets go of the group's assets, uncaching those no other live group holds.
+        Loads started by load() that haven't begun are cancelled, and those in
+        progress are finished first, so they don't end up cached afterwards.
+
+        :return: Number of assets that were uncached.
+        """
+        with _lock:
+            if not self.live:
+                return 0
+            self.live = False
+            progress, self._progress = self._progress, None
+        if progress is not None:
+            progress.cancel()
+            progress.wait()
+        released = 0
+        with _lock:
+            for manager, asset_handles in self.handles.items():
+                for asset_handle in asset_handles:
+                    released += _drop(manager, asset_handle)
+        return released
+
+
+class GroupProgress:
+    """
+    Tracks the progress of loading a group, made of the progress of each of its
+    managers.
+    """
+
+    def __init__(self, parts: dict[ResourceManager, PreloadProgress]) -> None:
+        """
+        :param parts: Dictionary of each manager, and the progress of its share of
+        the group.
+        """
+        self.parts = parts
+        """
+        Dictionary of each manager, and the progress of its share of the group.
+        """
+
+    def __repr__(self) -> str:
+        return (
+            f"<GroupProgress {self.loaded}/{self.total} loaded, "
+            f"{len(self.failures)} failed>"
+        )
+
+    @property
+    def total(self) -> int:
+        """
+        Total number of assets in the group.
+        """
+        return sum(part.total for part in self.parts.values())
+
+    @property
+    def loaded(self) -> int:
+        """
+        Number of assets successfully loaded so far.
+        """
+        return sum(part.loaded for part in self.parts.values())
+
+    @property
+    def completed(self) -> int:
+        """
+        Number of assets that have finished, successfully or not.
+        """
+        return sum(part.completed for part in self.parts.values())
+
+    @property
+    def fraction(self) -> float:
+        """
+        Portion of the group that has finished, from 0.0 to 1.0.
+        """
+        total = self.total
+        if total == 0:
+            return 1.0
+        return self.completed / total
+
+    @property
+    def failures(self) -> dict[tuple[ResourceManager, str], BaseException]:
+        """
+        Dictionary of the assets that failed to load, by manager and handle, and the
+        exception that caused it.
+        """
+        return {
+            (manager, asset_handle): error
+            for manager, part in self.parts.items()
+            for asset_handle, error in list(part.failures.items())
+        }
+
+    def done(self) -> bool:
+        """
+        :return: True if every load in the group has finished.
+        """
+        return all(part.done() for part in self.parts.values())
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until every load in the group has finished.
+
+        :param timeout: Maximum number of seconds to wait, defaults to None (forever).
+        :return: True if the group finished, False if the timeout expired first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for part in self.parts.values():
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+            if not part.wait(remaining):
+                return False
+        return True
+
+    def cancel(self) -> int:
+        """
+        Cancels every load in the group that has not yet started.
+
+        :return: The number of loads cancelled.
+        """
+        return sum(part.cancel() for part in self.parts.values())
+
+    def add_done_callback(self, callback: Callable[[GroupProgress], None]) -> None:
+        """
+        Calls the callback with this progress object once the group has finished.
+        If the group is already finished, the callback is called immediately.
+
+        :param callback: Function taking the progress object.
+        """
+        remaining = [len(self.parts)]
+        lock = threading.Lock()
+
+        def on_part_done(_: PreloadProgress) -> None:
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] > 0:
+                    return
+            callback(self)
+
+        if not self.parts:
+            callback(self)
+        for part in self.parts.values():
+            part.add_done_callback(on_part_done)
+
+
+def getResourceGroup(name: str) -> ResourceGroup:
+    """
+    Provides the resource group of the given name, creating it if it doesn't exist.
+
+    :param name: The name of the group.
+    :return: The group of that name.
+    """
+    with _lock:
+        group = _groups.get(name)
+        if group is None:
+            group = _groups[name] = ResourceGroup(name)
+        return group
+
+
+def _hold(manager: ResourceManager, asset_handle: str) -> None:
+    key = (manager, asset_handle)
+    _references[key] = _references.get(key, 0) + 1
+
+
+def _drop(manager: ResourceManager, asset_handle: str) -> int:
+    """
+    Lets go of one hold on an asset, uncaching it if that was the last.
+
+    :return: 1 if the asset was uncached, otherwise 0.
+    """
+    key = (manager, asset_handle)
+    count = _references.get(key, 0) - 1
+    if count > 0:
+        _references[key] = count
+        return 0
+    _references.pop(key, None)
+    return int(manager.uncache(asset_handle) is not None)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, wait as wait_futures
+import threading
+
+
+class PreloadProgress:
+    """
+    Tracks the progress of a batch of assets being loaded in the background.
+    """
+
+    def __init__(
+        self,
+        futures: dict[str, Future],
+        failures: dict[str, BaseException] | None = None,
+        already_loaded: Iterable[str] = (),
+    ) -> None:
+        """
+        Begin tracking a set of background loads.
+
+        :param futures: Dictionary of asset handles and the futures loading them.
+        :param failures: Dictionary of handles that failed before they could be
+        scheduled, and the exception explaining why.
+        :param already_loaded: Handles that were already cached, and count as loaded.
+        """
+        self._lock = threading.Lock()
+        self._futures = futures
+        self._callbacks: list[Callable[[PreloadProgress], None]] = []
+        self._done_event = threading.Event()
+        self.failures: dict[str, BaseException] = dict(failures or {})
+        """
+        Dictionary of handles that failed to load, and the exception that caused it.
+        """
+        already_loaded = list(already_loaded)
+        self.total: int = len(futures) + len(self.failures) + len(already_loaded)
+        """
+        Total number of handles in the batch.
+        """
+        self.loaded: int = len(already_loaded)
+        """
+        Number of handles successfully loaded so far.
+        """
+        self._remaining = len(futures)
+        if self._remaining == 0:
+            self._done_event.set()
+        for asset_handle, future in futures.items():
+            future.add_done_callback(
+                lambda future, asset_handle=asset_handle: self._on_done(
+                    asset_handle, future
+                )
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PreloadProgress {self.loaded}/{self.total} loaded, "
+            f"{len(self.failures)} failed>"
+        )
+
+    @property
+    def completed(self) -> int:
+        """
+        Number of handles that have finished, successfully or not.
+        """
+        return self.loaded + len(self.failures)
+
+    @property
+    def fraction(self) -> float:
+        """
+        Portion of the batch that has finished, from 0.0 to 1.0.
+        """
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+
+    def done(self) -> bool:
+        """
+        :return: True if every load in the batch has finished.
+        """
+        return self._done_event.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until every load in the batch has finished.
+
+        :param timeout: Maximum number of seconds to wait, defaults to None (forever).
+        :return: True if the batch finished, False if the timeout expired first.
+        """
+        return self._done_event.wait(timeout)
+
+    def wait_for(self, asset_handle: str, timeout: float | None = None) -> bool:
+        """
+        Blocks until the specified handle has finished loading.
+
+        :param asset_handle: The name of the resource being waited on.
+        :param timeout: Maximum number of seconds to wait, defaults to None (forever).
+        :return: True if the load finished, False if the timeout expired first.
+        """
+        future = self._futures.get(asset_handle)
+        if future is None:
+            return True
+        done, _ = wait_futures([future], timeout)
+        return bool(done)
+
+    def cancel(self) -> int:
+        """
+        Cancels every load in the batch that has not yet started.
+
+        :return: The number of loads cancelled.
+        """
+        return sum(future.cancel() for future in self._futures.values())
+
+    def add_done_callback(self, callback: Callable[[PreloadProgress], None]) -> None:
+        """
+        Calls the callback with this progress object once the batch has finished.
+        If the batch is already finished, the callback is called immediately.
+
+        :param callback: Function taking the progress object.
+        """
+        with self._lock:
+            if not self._done_event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _on_done(self, asset_handle: str, future: Future) -> None:
+        if future.cancelled():
+            error: BaseException | None = KeyError(
+                f"Resource '{asset_handle}' was cancelled."
+            )
+        else:
+            error = future.exception()
+            if error is None and future.result() is None:
+                error = KeyError(f"Resource '{asset_handle}' failed to load.")
+        with self._lock:
+            if error is None:
+                self.loaded += 1
+            else:
+                self.failures[asset_handle] = error
+            self._remaining -= 1
+            if self._remaining > 0:
+                return
+            self._done_event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
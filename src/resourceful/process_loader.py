@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from .codec import AssetCodec, PickleCodec
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.context import BaseContext
+
+# Windows frees a shared memory block as soon as no process has it open, so the
+# worker can't let go of it before the main process has attached. The data is
+# returned through the pool's own pipe there instead.
+_SHARED_HANDOFF = os.name != "nt"
+
+
+class ProcessLoader:
+    """
+    Runs loaders in a pool of worker processes, so CPU-bound decoding, such as of
+    images and audio, scales with the number of cores instead of being held back by
+    the GIL.
+
+    Each worker encodes the loaded asset with a codec and hands the encoded data back
+    through shared memory rather than pickling it. The main process takes a single
+    copy of the data, and rebuilds the asset from it with the codec.
+
+    Loaders and location data are sent to the workers, so they must be picklable;
+    loaders should be functions defined at the top level of a module.
+    """
+
+    def __init__(
+        self,
+        codec: AssetCodec | None = None,
+        max_workers: int | None = None,
+        mp_context: BaseContext | None = None,
+        initializer: Callable | None = None,
+        initargs: tuple = (),
+    ) -> None:
+        """
+        Create a process loader. Worker processes are started when first needed.
+
+        :param codec: Codec used to hand assets back from the workers, such as
+        SurfaceCodec or SoundCodec. Defaults to a PickleCodec.
+        :param max_workers: Number of worker processes, defaults to None, for one per
+        core.
+        :param mp_context: The multiprocessing context used to start workers.
+        Defaults to None, for the "spawn" context, which is safe to use while other
+        threads are running.
+        :param initializer: Function called in each worker as it starts, such as to
+        initialize pygame's mixer before loading sounds. Defaults to None.
+        :param initargs: Arguments passed to the initializer.
+        """
+        self.codec: AssetCodec = codec if codec is not None else PickleCodec()
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def load(self, loader: Callable, resource_location: Any) -> Any | None:
+        """
+        Runs the loader in a worker process, and rebuilds its result in this one.
+        Blocks until the asset is loaded.
+
+        Exceptions raised by the loader are raised here as well.
+
+        :param loader: The loader function. Asynchronous loaders are run to
+        completion in the worker.
+        :param resource_location: The location data passed to the loader.
+        :return: The loaded asset, or None if the loader returned None.
+        """
+        handoff = (
+            self._get_executor()
+            .submit(_load_in_worker, loader, self.codec, resource_location)
+            .result()
+        )
+        if handoff is None:
+            return None
+        metadata, data = handoff
+        if isinstance(data, tuple):
+            data = _receive(*data)
+        asset = self.codec.decode(metadata, memoryview(data))
+        if asset is None:
+            # The codec can't rebuild it in this process, so load it here instead.
+            return _run_loader(loader, resource_location)
+        return asset
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the worker processes. They are started again if anything else is
+        loaded.
+
+        :param wait: Whether to wait for loads in progress to finish, defaults to
+        True
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Gives the worker pool, creating it if needed.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    self.max_workers,
+                    mp_context=self.mp_context or multiprocessing.get_context("spawn"),
+                    initializer=self.initializer,
+                    initargs=self.initargs,
+                )
+            return self._executor
+
+
+def _run_loader(loader: Callable, resource_location: Any) -> Any | None:
+    import inspect
+
+    asset = loader(resource_location)
+    if inspect.isawaitable(asset):
+        from .resource_manager import _run_awaitable
+
+        asset = _run_awaitable(asset)
+    return asset
+
+
+def _load_in_worker(
+    loader: Callable, codec: AssetCodec, resource_location: Any
+) -> tuple[dict[str, Any], tuple[str, int] | bytes] | None:
+    """
+    Loads and encodes an asset in a worker process.
+
+    :return: The codec's metadata, and either the name and size of the shared memory
+    block holding the encoded data, or the data itself. None if the loader returned
+    None.
+    """
+    asset = _run_loader(loader, resource_location)
+    if asset is None:
+        return None
+    metadata, data = codec.encode(asset)
+    data = memoryview(data).cast("B")
+    if not _SHARED_HANDOFF or not data.nbytes:
+        return metadata, bytes(data)
+    return metadata, _send(data)
+
+
+def _send(data: memoryview) -> tuple[str, int]:
+    """
+    Copies data into a new shared memory block, handing ownership of the block to
+    the process that receives it.
+
+    :return: The name of the block and the size of the data.
+    """
+    from multiprocessing import resource_tracker, shared_memory
+
+    block = shared_memory.SharedMemory(create=True, size=data.nbytes)
+    try:
+        block.buf[: data.nbytes] = data
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    block.close()
+    # The receiver unlinks the block once it has read it, so this process must not
+    # clean it up on exit. The tracker knows the block by its full, private name.
+    resource_tracker.unregister(block._name, "shared_memory")
+    return block.name, data.nbytes
+
+
+def _receive(name: str, size: int) -> bytearray:
+    """
+    Copies the data out of a shared memory block made by _send, and frees the block.
+    """
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name)
+    view = block.buf[:size]
+    try:
+        return bytearray(view)
+    finally:
+        view.release()
+        block.close()
+        block.unlink()
@@ -1,5 +1,22 @@
+from typing import Any
+
 from .pygame_prebuilt import (  # noqa:F401
     getImageManager,
     getSoundManager,
-    DEFAULT_SURFACE,
+    getImageVariant,
+    setImageAtlas,
+    convertImages,
+    setStreamThreshold,
 )
+from .pygame_atlas import TextureAtlas  # noqa:F401
+from .pygame_stream import StreamedSound  # noqa:F401
+from .pygame_codecs import SurfaceCodec, SoundCodec  # noqa:F401
+
+
+def __getattr__(name: str) -> Any:
+    if name == "DEFAULT_SURFACE":
+        # Made on first use, see pygame_prebuilt.
+        from . import pygame_prebuilt
+
+        return pygame_prebuilt.DEFAULT_SURFACE
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
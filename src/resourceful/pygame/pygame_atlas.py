@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+from ..archive import ArchiveEntry
+
+import pygame
+
+_LAYOUT_VERSION = 1
+
+
+class SkylinePacker:
+    """
+    Packs rectangles into a fixed area using the skyline bottom-left method, which
+    tracks the top edge of the packed rectangles as a list of horizontal segments
+    and places each new rectangle as low as possible.
+    """
+
+    def __init__(
+        self, width: int, height: int, skyline: list[list[int]] | None = None
+    ) -> None:
+        """
+        :param width: Width of the packing area.
+        :param height: Height of the packing area.
+        :param skyline: A skyline saved from another packer, to continue packing
+        where it left off. Defaults to None, for an empty area.
+        """
+        self.width = width
+        self.height = height
+        self.skyline: list[list[int]] = (
+            [list(segment) for segment in skyline] if skyline else [[0, 0, width]]
+        )
+        """
+        Segments of the top edge, as [x, y, width], from left to right.
+        """
+
+    def insert(self, width: int, height: int) -> tuple[int, int] | None:
+        """
+        Finds a place for a rectangle, and marks it as taken.
+
+        :param width: Width of the rectangle.
+        :param height: Height of the rectangle.
+        :return: The position of the rectangle's top left corner, or None if it does
+        not fit.
+        """
+        best: tuple[tuple[int, int], int, int, int] | None = None
+        for index, (x, _, segment_width) in enumerate(self.skyline):
+            y = self._fit(index, width, height)
+            if y is None:
+                continue
+            # Lowest top edge first, then the tightest segment.
+            score = (y + height, segment_width)
+            if best is None or score < best[0]:
+                best = (score, index, x, y)
+        if best is None:
+            return None
+        _, index, x, y = best
+        self._raise(index, x, y + height, width)
+        return x, y
+
+    def _fit(self, index: int, width: int, height: int) -> int | None:
+        """
+        :return: The lowest y at which the rectangle fits with its left edge at the
+        start of the given segment, or None if it does not fit there.
+        """
+        x = self.skyline[index][0]
+        if x + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        while remaining > 0:
+            _, segment_y, segment_width = self.skyline[index]
+            y = max(y, segment_y)
+            if y + height > self.height:
+                return None
+            remaining -= segment_width
+            index += 1
+        return y
+
+    def _raise(self, index: int, x: int, y: int, width: int) -> None:
+        """
+        Adds a segment to the skyline, trimming the segments it covers.
+        """
+        skyline = self.skyline
+        skyline.insert(index, [x, y, width])
+        end = x + width
+        following = index + 1
+        while following < len(skyline):
+            segment = skyline[following]
+            if segment[0] >= end:
+                break
+            overlap = end - segment[0]
+            if segment[2] <= overlap:
+                del skyline[following]
+                continue
+            segment[0] += overlap
+            segment[2] -= overlap
+            break
+        # Merge neighbors of the same height.
+        merged = [skyline[0]]
+        for segment in skyline[1:]:
+            if segment[1] == merged[-1][1]:
+                merged[-1][2] += segment[2]
+            else:
+                merged.append(segment)
+        self.skyline = merged
+
+
+class TextureAtlas:
+    """
+    Packs small images into a few large shared Surfaces, handing out subsurfaces of
+    them in place of the individual images.
+
+    Images are looked up by their location data, so an atlas saved with save() and
+    reopened with load() supplies the images it holds without reading their files.
+    Images whose files have changed since they were packed are loaded and packed
+    again.
+    """
+
+    def __init__(
+        self,
+        page_size: tuple[int, int] = (2048, 2048),
+        max_image_size: tuple[int, int] = (256, 256),
+        padding: int = 1,
+    ) -> None:
+        """
+        Create an empty atlas.
+
+        :param page_size: Size of each shared Surface, defaults to (2048, 2048)
+        :param max_image_size: Largest image that will be packed. Bigger images are
+        left as they are. Defaults to (256, 256)
+        :param padding: Empty pixels kept between images, so scaling or rotating one
+        doesn't blend in its neighbors, defaults to 1
+        """
+        self.page_size = page_size
+        self.max_image_size = max_image_size
+        self.padding = padding
+        self.pages: list[pygame.Surface] = []
+        """
+        The shared Surfaces the images are packed into.
+        """
+        self.regions: dict[str, tuple[int, pygame.Rect, str | None]] = {}
+        """
+        Dictionary of each packed image's key, and its page index, area, and source
+        file signature.
+        """
+        self._packers: list[SkylinePacker] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def __contains__(self, resource_location: Any) -> bool:
+        return _location_key(resource_location) in self.regions
+
+    def get(self, resource_location: Any) -> pygame.Surface | None:
+        """
+        Finds an image packed from the given location.
+
+        :param resource_location: The location data the image was loaded from.
+        :return: A subsurface of the atlas holding the image, or None if it isn't
+        packed, or its file has changed since.
+        """
+        key = _location_key(resource_location)
+        region = self.regions.get(key)
+        if region is None:
+            return None
+        page, rect, signature = region
+        if signature is not None:
+            current = _signature(resource_location)
+            if current is not None and current != signature:
+                return None
+        return self.pages[page].subsurface(rect)
+
+    def add(self, resource_location: Any, image: pygame.Surface) -> pygame.Surface:
+        """
+        Packs an image into the atlas.
+
+        :param resource_location: The location data the image was loaded from.
+        :param image: The loaded image.
+        :return: A subsurface of the atlas holding the image, or the image itself if
+        it is too large to pack.
+        """
+        width, height = image.get_size()
+        if (
+            width > self.max_image_size[0]
+            or height > self.max_image_size[1]
+            or width > self.page_size[0]
+            or height > self.page_size[1]
+        ):
+            return image
+        with self._lock:
+            page, position = self._place(width, height)
+            rect = pygame.Rect(position, (width, height))
+            self.pages[page].blit(image, rect)
+            self.regions[_location_key(resource_location)] = (
+                page,
+                rect,
+                _signature(resource_location),
+            )
+            return self.pages[page].subsurface(rect)
+
+    def wrap_loader(self, loader: Callable[[Any], pygame.Surface | None]) -> Callable:
+        """
+        Creates a loader that takes images from the atlas when possible, and packs
+        newly loaded images into it.
+
+        :param loader: The loader used for images the atlas doesn't hold.
+        :return: The new loader.
+        """
+
+        def atlas_loader(resource_location: Any) -> pygame.Surface | None:
+            image = self.get(resource_location)
+            if image is not None:
+                return image
+            image = loader(resource_location)
+            if image is None:
+                return None
+            return self.add(resource_location, image)
+
+        return atlas_loader
+
+    def save(self, path: os.PathLike | str) -> None:
+        """
+        Saves the atlas as a JSON layout file, with a PNG image of each page beside
+        it.
+
+        :param path: Location of the layout file.
+        """
+        path = Path(path)
+        with self._lock:
+            pages = []
+            for index, (page, packer) in enumerate(zip(self.pages, self._packers)):
+                image_name = f"{path.stem}_{index}.png"
+                pygame.image.save(page, path.with_name(image_name))
+                pages.append({"image": image_name, "skyline": packer.skyline})
+            layout = {
+                "version": _LAYOUT_VERSION,
+                "page_size": list(self.page_size),
+                "max_image_size": list(self.max_image_size),
+                "padding": self.padding,
+                "pages": pages,
+                "regions": {
+                    key: [page, list(rect), signature]
+                    for key, (page, rect, signature) in self.regions.items()
+                },
+            }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(layout, file)
+
+    @classmethod
+    def load(cls, path: os.PathLike | str) -> TextureAtlas:
+        """
+        Opens an atlas saved with save(). New images can still be packed into it.
+
+        :param path: Location of the layout file.
+        :raises ValueError: If the layout was saved by an incompatible version.
+        :return: The loaded atlas.
+        """
+        path = Path(path)
+        with open(path, encoding="utf-8") as file:
+            layout = json.load(file)
+        if layout.get("version") != _LAYOUT_VERSION:
+            raise ValueError(f"'{path}' has unsupported atlas version.")
+        atlas = cls(
+            tuple(layout["page_size"]),
+            tuple(layout["max_image_size"]),
+            layout["padding"],
+        )
+        for page in layout["pages"]:
+            image = pygame.image.load(path.with_name(page["image"]))
+            atlas.pages.append(_prepare_page(image))
+            atlas._packers.append(SkylinePacker(*atlas.page_size, page["skyline"]))
+        atlas.regions = {
+            key: (page, pygame.Rect(rect), signature)
+            for key, (page, rect, signature) in layout["regions"].items()
+        }
+        return atlas
+
+    def _place(self, width: int, height: int) -> tuple[int, tuple[int, int]]:
+        """
+        Finds room for an image, adding a page if none of the existing ones has any.
+
+        :return: The page index and position for the image.
+        """
+        padded_width = min(width + self.padding, self.page_size[0])
+        padded_height = min(height + self.padding, self.page_size[1])
+        for page, packer in enumerate(self._packers):
+            position = packer.insert(padded_width, padded_height)
+            if position is not None:
+                return page, position
+        packer = SkylinePacker(*self.page_size)
+        self._packers.append(packer)
+        self.pages.append(
+            _prepare_page(pygame.Surface(self.page_size, pygame.SRCALPHA))
+        )
+        position = packer.insert(padded_width, padded_height)
+        assert position is not None
+        return len(self.pages) - 1, position
+
+
+def _prepare_page(page: pygame.Surface) -> pygame.Surface:
+    """
+    Converts a page to the display's pixel format, when there is a display.
+    """
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return page.convert_alpha()
+    return page
+
+
+def _location_key(resource_location: Any) -> str:
+    if isinstance(resource_location, ArchiveEntry):
+        return f"{resource_location.archive.path}::{resource_location.handle}"
+    if isinstance(resource_location, (str, os.PathLike)):
+        return os.path.normpath(os.fspath(resource_location))
+    return str(resource_location)
+
+
+def _signature(resource_location: Any) -> str | None:
+    """
+    Describes the current state of the image's file, so stale regions can be
+    detected.
+    """
+    if isinstance(resource_location, ArchiveEntry):
+        return None
+    try:
+        stat = os.stat(resource_location)
+    except (OSError, TypeError, ValueError):
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
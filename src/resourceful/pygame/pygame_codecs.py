@@ -0,0 +1,106 @@
+import sys
+from typing import Any
+
+from ..codec import AssetCodec
+
+import pygame
+
+
+def _channel_masks(byte_order: str) -> tuple[int, int, int, int]:
+    """
+    :return: The red, green, blue and alpha masks of 32 bit pixels whose bytes are in
+    the given order.
+    """
+    shifts = {
+        channel: 8 * (index if sys.byteorder == "little" else 3 - index)
+        for index, channel in enumerate(byte_order)
+    }
+    return tuple(0xFF << shifts[channel] for channel in "RGBA")
+
+
+_RAW_FORMATS: dict[tuple[int, ...], str] = {
+    _channel_masks(byte_order): byte_order for byte_order in ("RGBA", "BGRA")
+}
+"""
+Pixel layouts that frombuffer can read as they are, by their channel masks.
+"""
+
+
+class SurfaceCodec(AssetCodec):
+    """
+    Stores Surfaces as raw pixel data, so they can be rebuilt without decoding their
+    image file. Rebuilt Surfaces keep their original pixel format, such as the
+    display's after being converted. Those in a layout frombuffer can read share the
+    cache's memory-mapped buffer instead of copying it.
+    """
+
+    def encode(self, asset: pygame.Surface) -> tuple[dict[str, Any], Any]:
+        per_pixel_alpha = bool(asset.get_flags() & pygame.SRCALPHA)
+        pixel_format = "RGBA" if per_pixel_alpha else "RGB"
+        data = None
+        if (
+            per_pixel_alpha
+            and asset.get_bytesize() == 4
+            and asset.get_pitch() == asset.get_width() * 4
+        ):
+            # Already in a layout frombuffer can read, so the pixels are used as they
+            # are instead of being converted.
+            raw_format = _RAW_FORMATS.get(asset.get_masks())
+            if raw_format is not None:
+                pixel_format = raw_format
+                data = asset.get_buffer()
+        if data is None:
+            data = pygame.image.tobytes(asset, pixel_format)
+        colorkey = asset.get_colorkey()
+        metadata = {
+            "format": pixel_format,
+            "size": list(asset.get_size()),
+            "colorkey": list(colorkey) if colorkey is not None else None,
+            "alpha": None if per_pixel_alpha else asset.get_alpha(),
+            "depth": asset.get_bitsize(),
+            "masks": list(asset.get_masks()),
+        }
+        return metadata, data
+
+    def decode(self, metadata: dict[str, Any], data: memoryview) -> pygame.Surface:
+        surface = pygame.image.frombuffer(
+            data, tuple(metadata["size"]), metadata["format"]
+        )
+        depth = metadata.get("depth")
+        if depth is not None and depth > 8 and surface.get_bitsize() != depth:
+            # Such as opaque images converted to the display's 32 bit format, which
+            # frombuffer can't make. Palette images are left as they are, as their
+            # palette isn't stored.
+            template = pygame.Surface(
+                (1, 1), surface.get_flags() & pygame.SRCALPHA, depth, metadata["masks"]
+            )
+            surface = surface.convert(template)
+        if metadata["colorkey"] is not None:
+            surface.set_colorkey(metadata["colorkey"])
+        if metadata["alpha"] is not None:
+            surface.set_alpha(metadata["alpha"])
+        return surface
+
+
+class SoundCodec(AssetCodec):
+    """
+    Stores Sounds as raw PCM samples, so they can be rebuilt without decoding their
+    audio file.
+
+    Samples are stored in the mixer's format at the time they were encoded, so they
+    can only be rebuilt while the mixer is initialized with the same settings.
+    """
+
+    def encode(self, asset: pygame.mixer.Sound) -> tuple[dict[str, Any], bytes]:
+        if not isinstance(asset, pygame.mixer.Sound):
+            # Such as StreamedSounds, which have no samples to store.
+            raise TypeError(f"Can't encode {type(asset).__name__} as a Sound.")
+        return {"mixer": list(pygame.mixer.get_init())}, asset.get_raw()
+
+    def decode(
+        self, metadata: dict[str, Any], data: memoryview
+    ) -> pygame.mixer.Sound | None:
+        mixer_settings = pygame.mixer.get_init()
+        if mixer_settings is None or list(mixer_settings) != metadata["mixer"]:
+            return None
+        return pygame.mixer.Sound(buffer=data)
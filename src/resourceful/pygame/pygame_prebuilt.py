@@ -1,72 +1,292 @@
 import os
 from pathlib import Path
+import threading
+from typing import Any
+import weakref
 
-from ..resource_manager import ResourceManager
+from ..archive import ArchiveEntry
+from ..resource_manager import NoDefault, ResourceManager
+from .pygame_atlas import TextureAtlas
+from .pygame_stream import StreamedSound
 
 import pygame
 
-_image_manager = ResourceManager[pygame.Surface]("pygame_images")
-_sound_manager = ResourceManager[pygame.mixer.Sound]("pygame_sounds")
-_has_transparency: list[str] = [".png", ".gif", ".lbm", ".webp", ".tga", ".xcf", ".qoi"]
-# I think that's all of them that can have alpha. I'll adjust as needed.
+# The managers and the default image are only made when first asked for, so that
+# importing the package stays cheap.
+_image_manager: ResourceManager[pygame.Surface] | None = None
+_sound_manager: ResourceManager[pygame.mixer.Sound | StreamedSound] | None = None
+_default_surface: pygame.Surface | None = None
+_setup_lock = threading.Lock()
+_converted: weakref.WeakSet[pygame.Surface] = weakref.WeakSet()
+"""
+Images already converted to the display's pixel format.
+"""
+_conversion_pending = False
+"""
+Whether images have been loaded without a display to convert them for.
+"""
+_stream_threshold: int | None = None
+"""
+Size in bytes above which sound files are streamed instead of decoded in full, or
+None to never stream them.
+"""
 
 
 _default_scale_factor = 8
-DEFAULT_SURFACE = pygame.Surface((_default_scale_factor * 4, _default_scale_factor * 4))
-"""
-A 16x16 black and fuchsia checkerboard pattern to serve as a default image.
-"""
-DEFAULT_SURFACE.fill(pygame.Color("black"))
-for i in range(4):
-    for j in range(4):
-        if i % 2 == j % 2:
-            # This creates a checkerboard pattern
-            pygame.draw.rect(
-                DEFAULT_SURFACE,
-                pygame.Color("fuchsia"),
-                pygame.Rect(
-                    _default_scale_factor * i,
-                    _default_scale_factor * j,
-                    _default_scale_factor,
-                    _default_scale_factor,
-                ),
-            )
-
-
-def _load_pygame_images(resource_location: os.PathLike | str) -> pygame.Surface:
-    location = Path(resource_location)
-    file_type = location.suffix
-    image = pygame.image.load(location)
-    if file_type.lower() in _has_transparency:
+
+
+def _make_default_surface() -> pygame.Surface:
+    """
+    Draws a 16x16 black and fuchsia checkerboard pattern to serve as a default image.
+    """
+    surface = pygame.Surface((_default_scale_factor * 4, _default_scale_factor * 4))
+    surface.fill(pygame.Color("black"))
+    for i in range(4):
+        for j in range(4):
+            if i % 2 == j % 2:
+                # This creates a checkerboard pattern
+                pygame.draw.rect(
+                    surface,
+                    pygame.Color("fuchsia"),
+                    pygame.Rect(
+                        _default_scale_factor * i,
+                        _default_scale_factor * j,
+                        _default_scale_factor,
+                        _default_scale_factor,
+                    ),
+                )
+    return surface
+
+
+def _get_default_surface() -> pygame.Surface:
+    global _default_surface
+    with _setup_lock:
+        if _default_surface is None:
+            _default_surface = _make_default_surface()
+        return _default_surface
+
+
+def __getattr__(name: str) -> Any:
+    if name == "DEFAULT_SURFACE":
+        # A 16x16 black and fuchsia checkerboard pattern to serve as a default image.
+        return _get_default_surface()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_pygame_images(
+    resource_location: os.PathLike | str | ArchiveEntry,
+) -> pygame.Surface:
+    # Converting to the display's format is left to _convert_image, so images can be
+    # loaded before the display exists, and in worker processes that have none.
+    if isinstance(resource_location, ArchiveEntry):
+        return pygame.image.load(resource_location.open(), resource_location.name)
+    return pygame.image.load(Path(resource_location))
+
+
+def _convert_image(image: pygame.Surface) -> pygame.Surface:
+    """
+    Converts a loaded image to the display's pixel format, so it's fast to blit.
+    Images loaded while there is no display are kept as they are, and converted all
+    together once there is one.
+    """
+    global _conversion_pending
+    if pygame.display.get_surface() is None:
+        _conversion_pending = True
+        return image
+    if _conversion_pending:
+        convertImages()
+    return _to_display_format(image)
+
+
+def _to_display_format(image: pygame.Surface) -> pygame.Surface:
+    if image in _converted or image.get_parent() is not None:
+        # Subsurfaces, like those of an atlas, share their parent's pixels, which
+        # converting would copy.
+        return image
+    if image.get_flags() & pygame.SRCALPHA:
         # Only want to call this on things that have alpha channels.
-        image.convert_alpha()
+        converted = image.convert_alpha()
     else:
-        image.convert()
-    return image
+        converted = image.convert()
+    _converted.add(converted)
+    return converted
 
 
-def _load_pygame_sounds(resource_location: os.PathLike | str) -> pygame.mixer.Sound:
-    location = Path(resource_location)
-    return pygame.mixer.Sound(location)
+def convertImages() -> list[str]:
+    """
+    Converts the images cached by the pre-built image manager to the display's pixel
+    format, if they aren't already. Images loaded before the display was created are
+    converted automatically with the next image loaded afterwards, so this only needs
+    calling to convert them sooner, such as right after opening the window.
 
+    :raises pygame.error: If there is no display yet.
+    :return: List of the handles of the images that were converted.
+    """
+    global _conversion_pending
+    if pygame.display.get_surface() is None:
+        raise pygame.error("Images can't be converted before the display is set.")
+    _conversion_pending = False
+    return getImageManager().apply_transform(_to_display_format)
 
-_image_manager.config(loader_helper=_load_pygame_images, default_asset=DEFAULT_SURFACE)
-_sound_manager.config(loader_helper=_load_pygame_sounds)
+
+def _load_pygame_sounds(
+    resource_location: os.PathLike | str | ArchiveEntry,
+) -> pygame.mixer.Sound | StreamedSound:
+    if _stream_threshold is not None:
+        if isinstance(resource_location, ArchiveEntry):
+            size = resource_location.length
+        else:
+            try:
+                size = os.path.getsize(resource_location)
+            except OSError:
+                # Left for the Sound to report.
+                size = 0
+        if size > _stream_threshold:
+            return StreamedSound(resource_location)
+    if isinstance(resource_location, ArchiveEntry):
+        return pygame.mixer.Sound(file=resource_location.open())
+    location = Path(resource_location)
+    return pygame.mixer.Sound(location)
 
 
-def getImageManager():
+def getImageManager() -> ResourceManager[pygame.Surface]:
     """
     Provides a pre-built resource manager specifically for loading images into
     pygame Surfaces.
     It is not managed by getResourceManager.
     """
+    global _image_manager
+    if _image_manager is None:
+        default_surface = _get_default_surface()
+        with _setup_lock:
+            if _image_manager is None:
+                manager = ResourceManager[pygame.Surface]("pygame_images")
+                manager.config(
+                    loader_helper=_load_pygame_images,
+                    default_asset=default_surface,
+                    transforms=[_convert_image],
+                )
+                _image_manager = manager
     return _image_manager
 
 
-def getSoundManager():
+def _transform_surface(
+    surface: pygame.Surface,
+    scale: tuple[int, int] | float | None,
+    flip_x: bool,
+    flip_y: bool,
+    rotate: float,
+    smooth: bool,
+) -> pygame.Surface:
+    if flip_x or flip_y:
+        surface = pygame.transform.flip(surface, flip_x, flip_y)
+    if rotate % 360:
+        surface = pygame.transform.rotate(surface, rotate)
+    if scale is not None:
+        if isinstance(scale, tuple):
+            size = scale
+        else:
+            width, height = surface.get_size()
+            size = (round(width * scale), round(height * scale))
+        if smooth:
+            surface = pygame.transform.smoothscale(surface, size)
+        else:
+            surface = pygame.transform.scale(surface, size)
+    return surface
+
+
+def getImageVariant(
+    asset_handle: str,
+    scale: tuple[int, int] | float | None = None,
+    flip_x: bool = False,
+    flip_y: bool = False,
+    rotate: float = 0,
+    smooth: bool = False,
+    default: pygame.Surface | None | NoDefault = NoDefault,
+) -> pygame.Surface | None:
+    """
+    Gets a transformed copy of an image from the pre-built image manager. Each
+    combination of transforms is only computed once, and is kept until the original
+    image is updated, uncached or evicted, or until it is among the least recently
+    used beyond the manager's max_variants.
+
+    Transforms are applied in the order of flipping, rotating, then scaling.
+
+    :param asset_handle: Name of the image
+    :param scale: Either a size in pixels, or a factor to multiply the size by,
+    defaults to None (unscaled)
+    :param flip_x: Whether to flip the image horizontally, defaults to False
+    :param flip_y: Whether to flip the image vertically, defaults to False
+    :param rotate: Degrees to rotate the image counterclockwise, defaults to 0
+    :param smooth: Whether to scale with smoothscale instead of scale, defaults to
+    False
+    :param default: Item returned if the image is unavailable. Defaults are not
+    transformed.
+    :raises KeyError: Raised if handle is not found or fails to load,
+    and no default is given or otherwise available.
+    :return: The transformed image.
+    """
+    if scale is None and not (flip_x or flip_y or rotate % 360):
+        return getImageManager().get(asset_handle, default)
+    return getImageManager().get_variant(
+        asset_handle,
+        _transform_surface,
+        scale,
+        flip_x,
+        flip_y,
+        rotate,
+        smooth,
+        default=default,
+    )
+
+
+def setImageAtlas(atlas: TextureAtlas | None) -> None:
+    """
+    Switches the pre-built image manager to atlas mode, where small images are packed
+    into the atlas's shared Surfaces and supplied as subsurfaces of them.
+    Images already loaded are unaffected until they are reloaded.
+
+    :param atlas: The atlas to pack images into, or None to go back to loading each
+    image as its own Surface.
+    """
+    image_manager = getImageManager()
+    if atlas is None:
+        image_manager.config(loader_helper=_load_pygame_images)
+    else:
+        image_manager.config(loader_helper=atlas.wrap_loader(_load_pygame_images))
+
+
+def getSoundManager() -> ResourceManager[pygame.mixer.Sound | StreamedSound]:
     """
     Provides a pre-built resource manager specifically for loading sounds for use in
     pygame's mixer.
     It is not managed by getResourceManager.
+
+    Sound files larger than the stream threshold are supplied as StreamedSounds,
+    which play from the file instead of holding all of their samples in memory. See
+    setStreamThreshold.
     """
+    global _sound_manager
+    if _sound_manager is None:
+        with _setup_lock:
+            if _sound_manager is None:
+                manager = ResourceManager[pygame.mixer.Sound | StreamedSound](
+                    "pygame_sounds"
+                )
+                manager.config(loader_helper=_load_pygame_sounds)
+                _sound_manager = manager
     return _sound_manager
+
+
+def setStreamThreshold(size: int | None) -> None:
+    """
+    Sets the file size above which the pre-built sound manager streams sounds
+    instead of decoding them in full. The manager then supplies StreamedSounds rather
+    than Sounds for those files. Sounds already loaded are unaffected until they are
+    reloaded.
+
+    :param size: Size in bytes, or None to always decode sounds in full. Defaults to
+    None.
+    """
+    global _stream_threshold
+    _stream_threshold = size
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+from collections import deque
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import IO, Any
+import wave
+
+from ..archive import ArchiveEntry
+
+import pygame
+
+_MIXER_SIZES: dict[int, int] = {1: 8, 2: -16}
+"""
+The mixer sample format matching each WAV sample width that can be fed to it as is.
+"""
+
+
+class StreamedSound:
+    """
+    A sound played from its file a few chunks at a time, instead of being decoded
+    into memory in full. Meant for music and long ambience, which would take many
+    megabytes each as a Sound.
+
+    Uncompressed WAV files already in the mixer's sample format are fed to a mixer
+    Channel from a background thread, keeping only a small ring of decoded chunks,
+    so several can play at once like Sounds. Anything else is played with
+    pygame.mixer.music, which streams every format the mixer supports, but only
+    plays one file at a time.
+    """
+
+    def __init__(
+        self,
+        resource_location: os.PathLike | str | ArchiveEntry,
+        chunk_seconds: float = 0.25,
+        ring_size: int = 4,
+    ) -> None:
+        """
+        Create a streamed sound. Nothing is read until it is played.
+
+        :param resource_location: The sound file, or an archive entry holding it.
+        :param chunk_seconds: Length of each decoded chunk, defaults to 0.25
+        :param ring_size: Number of chunks decoded ahead of the one playing,
+        defaults to 4
+        """
+        self.resource_location = resource_location
+        self.chunk_seconds = chunk_seconds
+        self.ring_size = max(ring_size, 1)
+        self._volume = 1.0
+        self._loops = 0
+        self._length: float | None = None
+        self._file: IO[bytes] | None = None
+        self._reader: wave.Wave_read | None = None
+        self._ring: deque[pygame.mixer.Sound] = deque()
+        """
+        Chunks decoded and waiting to be queued.
+        """
+        self._sent: deque[pygame.mixer.Sound] = deque(maxlen=2)
+        """
+        The chunks last handed to the channel, one playing and one queued.
+        """
+        self._channel: pygame.mixer.Channel | None = None
+        self._lock = threading.RLock()
+
+    def play(self, loops: int = 0) -> pygame.mixer.Channel | None:
+        """
+        Starts playing the sound from the beginning, stopping it first if it is
+        already playing.
+
+        :param loops: Number of extra times to play the sound, or -1 to repeat it
+        until stopped, defaults to 0
+        :raises pygame.error: If the mixer isn't initialized.
+        :return: The Channel playing the sound, or None if it is played with
+        pygame.mixer.music.
+        """
+        with self._lock:
+            self.stop()
+            if not self._open_wave():
+                self._play_music(loops)
+                return None
+            self._loops = loops
+            self._fill()
+            if not self._ring:
+                self._close()
+                return None
+            channel = pygame.mixer.find_channel(True)
+            self._channel = channel
+            self._send(channel.play)
+            self._feed()
+        _feeder.add(self)
+        return channel
+
+    def stop(self) -> None:
+        """
+        Stops playing the sound, and frees its decoder and chunks.
+        """
+        global _music_owner
+        with self._lock:
+            channel = self._channel
+            if channel is not None and channel.get_sound() in self._sent:
+                channel.stop()
+                if channel.get_sound() in self._sent:
+                    # Stopping a channel starts its queued sound, so stop that too.
+                    channel.stop()
+            if _music_owner is self:
+                pygame.mixer.music.stop()
+                pygame.mixer.music.unload()
+                _music_owner = None
+            self._close()
+
+    def get_busy(self) -> bool:
+        """
+        :return: Whether the sound is playing.
+        """
+        if _music_owner is self:
+            return pygame.mixer.music.get_busy()
+        return self._channel is not None
+
+    def get_length(self) -> float | None:
+        """
+        :return: Length of the sound in seconds, or None if it can't be known without
+        decoding the whole file.
+        """
+        if self._length is None and _wave_suffix(self.resource_location):
+            file = _open_file(self.resource_location)
+            try:
+                with wave.open(file) as reader:
+                    self._length = reader.getnframes() / reader.getframerate()
+            except (wave.Error, EOFError):
+                pass
+            finally:
+                file.close()
+        return self._length
+
+    def get_volume(self) -> float:
+        return self._volume
+
+    def set_volume(self, value: float) -> None:
+        """
+        :param value: Volume from 0.0 to 1.0.
+        """
+        with self._lock:
+            self._volume = value
+            for chunk in (*self._ring, *self._sent):
+                chunk.set_volume(value)
+            if _music_owner is self:
+                pygame.mixer.music.set_volume(value)
+
+    def _open_wave(self) -> bool:
+        """
+        Opens the file for feeding to a Channel, if it is a WAV file in the mixer's
+        sample format.
+
+        :return: Whether the file was opened.
+        """
+        mixer = pygame.mixer.get_init()
+        if mixer is None:
+            raise pygame.error("mixer not initialized")
+        if not _wave_suffix(self.resource_location):
+            return False
+        file = _open_file(self.resource_location)
+        try:
+            reader = wave.open(file)
+        except (wave.Error, EOFError):
+            file.close()
+            return False
+        sample_size = _MIXER_SIZES.get(reader.getsampwidth())
+        file_format = (reader.getframerate(), sample_size, reader.getnchannels())
+        if (
+            file_format != tuple(mixer)
+            or reader.getnframes() == 0
+            or (sample_size == -16 and sys.byteorder != "little")
+        ):
+            reader.close()
+            file.close()
+            return False
+        self._file = file
+        self._reader = reader
+        self._length = reader.getnframes() / reader.getframerate()
+        return True
+
+    def _play_music(self, loops: int) -> None:
+        global _music_owner
+        location = self.resource_location
+        if isinstance(location, ArchiveEntry):
+            # The music player reads from the file as it plays, so it is kept open.
+            self._file = location.open()
+            pygame.mixer.music.load(self._file, location.name)
+        else:
+            pygame.mixer.music.load(os.fspath(location))
+        if _music_owner is not None and _music_owner is not self:
+            _music_owner._close()
+        _music_owner = self
+        pygame.mixer.music.set_volume(self._volume)
+        pygame.mixer.music.play(loops)
+
+    def _fill(self) -> None:
+        """
+        Decodes chunks until the ring is full, or the sound has run out.
+        """
+        reader = self._reader
+        if reader is None:
+            return
+        frames = max(int(reader.getframerate() * self.chunk_seconds), 1)
+        while len(self._ring) < self.ring_size:
+            data = reader.readframes(frames)
+            if not data:
+                if self._loops == 0:
+                    return
+                if self._loops > 0:
+                    self._loops -= 1
+                reader.rewind()
+                continue
+            chunk = pygame.mixer.Sound(buffer=data)
+            chunk.set_volume(self._volume)
+            self._ring.append(chunk)
+
+    def _send(self, method: Any) -> None:
+        chunk = self._ring.popleft()
+        method(chunk)
+        self._sent.append(chunk)
+
+    def _feed(self) -> bool:
+        """
+        Queues the next chunk once the channel has room for it, and decodes more.
+
+        :return: Whether the sound is still playing.
+        """
+        with self._lock:
+            channel = self._channel
+            if channel is None:
+                return False
+            busy = channel.get_busy()
+            if busy and channel.get_sound() not in self._sent:
+                # Something else took over the channel.
+                self._close()
+                return False
+            if channel.get_queue() is None:
+                if not self._ring:
+                    if not busy:
+                        self._close()
+                        return False
+                    return True
+                self._send(channel.queue)
+                self._fill()
+            return True
+
+    def _close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._ring.clear()
+        self._sent.clear()
+        self._channel = None
+
+
+class _Feeder:
+    """
+    Background thread keeping the channels of playing streamed sounds supplied.
+    Runs only while any are playing.
+    """
+
+    def __init__(self) -> None:
+        self._streams: set[StreamedSound] = set()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def add(self, stream: StreamedSound) -> None:
+        with self._lock:
+            self._streams.add(stream)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="resourceful-sound-feeder", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                streams = list(self._streams)
+                if not streams:
+                    self._thread = None
+                    return
+            for stream in streams:
+                try:
+                    active = stream._feed()
+                except pygame.error:
+                    # The mixer was shut down.
+                    stream._close()
+                    active = False
+                if not active:
+                    with self._lock:
+                        self._streams.discard(stream)
+            # Checked several times per chunk, so the next is always queued in time.
+            time.sleep(min(stream.chunk_seconds for stream in streams) / 4)
+
+
+_feeder = _Feeder()
+_music_owner: StreamedSound | None = None
+"""
+The streamed sound loaded into pygame.mixer.music, if any.
+"""
+
+
+def _wave_suffix(resource_location: Any) -> bool:
+    if isinstance(resource_location, ArchiveEntry):
+        name = resource_location.name
+    else:
+        name = os.fspath(resource_location)
+    return Path(name).suffix.lower() in (".wav", ".wave")
+
+
+def _open_file(resource_location: os.PathLike | str | ArchiveEntry) -> IO[bytes]:
+    if isinstance(resource_location, ArchiveEntry):
+        return resource_location.open()
+    return open(resource_location, "rb")
@@ -1,14 +1,36 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-import difflib
+from collections.abc import Awaitable, Callable, Iterable, MutableMapping
 import os
 from pathlib import Path
-from typing import Any, Literal, TypeVar
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from .suggest import IndexedLocations
+from .weak_cache import WeakCache
+
+# Everything else is imported where it is first needed, so importing the package
+# stays cheap for programs that only use the basics.
+if TYPE_CHECKING:
+    from .access_trace import AccessTrace
+    import asyncio
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from .archive import AssetArchive
+    from .cache_policy import CachePolicy
+    from .disk_cache import DiskCache
+    from .preload import PreloadProgress
+    from .process_loader import ProcessLoader
+    from .stats import ManagerStats
+    from .warm_cache import WarmCache
+    from .watcher import FileWatcher
 
 
 T = TypeVar("T")
 
+_INDEX_VERSION = 1
+
 
 class SentinelMeta(type):
 
@@ -28,6 +50,45 @@ class NoDefault(metaclass=SentinelMeta):
     pass
 
 
+class LoadFailure:
+    """
+    Record of an asset that failed to load, kept so it isn't loaded again on every
+    request.
+    """
+
+    __slots__ = ("asset_handle", "error", "attempts", "retry_at")
+
+    def __init__(
+        self,
+        asset_handle: str,
+        error: Exception | None,
+        attempts: int,
+        retry_at: float,
+    ) -> None:
+        self.asset_handle = asset_handle
+        """
+        The name of the resource that failed to load.
+        """
+        self.error = error
+        """
+        The exception raised by the loader, or None if it returned None.
+        """
+        self.attempts = attempts
+        """
+        Number of failed loads in a row.
+        """
+        self.retry_at = retry_at
+        """
+        Time, per time.monotonic(), before which requests fail without loading again.
+        """
+
+    def __repr__(self) -> str:
+        return (
+            f"LoadFailure({self.asset_handle!r}, error={self.error!r}, "
+            f"attempts={self.attempts})"
+        )
+
+
 class ResourceManager[T]:
     """
     A class for that tracks resources of a given type, ascribing handles to them for
@@ -48,11 +109,12 @@ class ResourceManager[T]:
         """
         Name of the Resource Manager
         """
-        self.cache: dict[str, T] = {}
+        self.cache: MutableMapping[str, T] = {}
         """
         Dictionary caching all of the loaded assets with their handles.
+        A WeakCache when the manager is configured with weak_cache.
         """
-        self.resource_locations: dict[str, Any] = {}
+        self.resource_locations: IndexedLocations = IndexedLocations()
         """
         Dictionary holding needed loading data for each asset.
         """
@@ -60,24 +122,208 @@ class ResourceManager[T]:
         """
         Default asset to be supplied if requested asset cannot be loaded.
         """
+        self.cache_policy: CachePolicy | None = None
+        """
+        Eviction policy limiting the size of the cache. If None, the cache is unbounded.
+        """
+        self.max_workers: int | None = None
+        """
+        Number of worker threads used for preloading. If None, the default of
+        ThreadPoolExecutor is used.
+        """
+        self.disk_cache: DiskCache | None = None
+        """
+        Persistent cache of decoded assets, checked before running the loader.
+        """
+        self.process_loader: ProcessLoader | None = None
+        """
+        Pool of worker processes the loader is run in, or None to run it in the thread
+        requesting the asset.
+        """
+        self.transforms: list[Callable[[T], T]] = []
+        """
+        Functions applied in order to each newly loaded asset before it is cached.
+        """
+        self.warm_cache: WarmCache | None = None
+        """
+        Compressed tier holding assets evicted by the cache policy, or None to drop
+        evicted assets entirely.
+        """
+        self.trace: AccessTrace | None = None
+        """
+        Record of the manager's requests, or None if they are not being recorded.
+        """
+        self.stats: ManagerStats | None = None
+        """
+        Usage statistics of the manager, or None if they are not being collected.
+        """
+        self.thread_safe: bool = False
+        """
+        Whether concurrent requests for the same unloaded asset share a single load.
+        """
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: dict[str, Future] = {}
+        self._async_pending: dict[str, asyncio.Task] = {}
+        self._batch_loader: Callable | None = None
+        self._variants: dict[str, dict[tuple, T]] = {}
+        """
+        Variants of each cached asset, by transform and arguments, least recently used
+        first.
+        """
+        self.max_variants: int | None = 16
+        """
+        Most variants kept for each asset, or None for no limit.
+        """
+        self.failure_ttl: float = 1.0
+        """
+        Seconds after a failed load before the asset is loaded again. Doubles with
+        each further failure in a row.
+        """
+        self.max_failure_ttl: float = 60.0
+        """
+        Longest wait between attempts to load a failing asset, in seconds.
+        """
+        self._failures: dict[str, LoadFailure] = {}
+        self._hooks: dict[str, list[Callable]] = {"pre_load": [], "post_load": []}
+        self._lock = threading.RLock()
 
     def config(
         self,
         loader_helper: Callable | None = None,
         default_asset: T | None | NoDefault = NoDefault,
+        cache_policy: CachePolicy | None = None,
+        max_workers: int | None = None,
+        thread_safe: bool | None = None,
+        disk_cache: DiskCache | None = None,
+        collect_stats: bool | None = None,
+        batch_loader: Callable | None = None,
+        weak_cache: bool | None = None,
+        grace_period: float | None = None,
+        failure_ttl: float | None = None,
+        max_failure_ttl: float | None = None,
+        process_loader: ProcessLoader | None | NoDefault = NoDefault,
+        transforms: Iterable[Callable[[T], T]] | None = None,
+        warm_cache: WarmCache | None | NoDefault = NoDefault,
+        record_trace: bool | None = None,
+        max_variants: int | None | NoDefault = NoDefault,
     ) -> None:
         """
         Modifies the resource manager's behavior per the specified parameters.
 
         :param loader_helper: Loader function for the resource. Must take the location
-        data its parameter, and return an instance of the resource.
+        data its parameter, and return an instance of the resource. May be an async
+        function, in which case aget() awaits it directly.
         :param default_asset: An asset matching the manager's managed type, or None.
         Defaults to No_Default.
+        :param cache_policy: An eviction policy, such as LRUPolicy or LFUPolicy, used to
+        keep the cache within a budget. Evicted assets are reloaded on demand.
+        Any assets already cached are handed to the new policy, and may be evicted
+        immediately if they exceed its budget.
+        :param max_workers: Number of worker threads used by preload(). Changing it
+        replaces the worker pool once any running loads are finished.
+        :param thread_safe: If True, get() may be safely called from many threads at
+        once. Threads that miss on the same asset at the same time will share one
+        load rather than each loading it. Cache hits do not take a lock unless a cache
+        policy is in use.
+        :param disk_cache: A persistent cache of decoded assets. Assets found in it are
+        rebuilt from their stored data instead of being loaded, and newly loaded assets
+        are written to it.
+        :param collect_stats: Whether to count hits, misses, loads and load times in
+        the manager's stats. Turning it off discards the collected stats.
+        :param batch_loader: Loader function used by get_many() to load several assets
+        at once. Must take a list of location data, and return a list of the same
+        length holding the resource, or None, for each. May be an async function.
+        :param weak_cache: If True, the cache holds assets weakly, so assets are
+        released once nothing outside the manager uses them, and reloaded on demand.
+        Assets that don't support weak references are still held normally.
+        :param grace_period: Seconds a weakly cached asset is kept after it was last
+        requested, even if nothing is using it, to avoid releasing and reloading
+        assets that are only briefly unused.
+        :param failure_ttl: Seconds after a failed load during which requests for the
+        asset fail immediately instead of loading it again. Doubles with each further
+        failure, up to max_failure_ttl. 0 loads failed assets again on every request.
+        :param max_failure_ttl: Longest wait between attempts to load a failing asset.
+        :param process_loader: A pool of worker processes to run the loader in, so
+        CPU-bound loaders can use every core. The loader and location data must be
+        picklable. None goes back to running the loader in the requesting thread.
+        :param transforms: Functions applied in order to each loaded asset, each taking
+        the asset and returning the asset to use in its place. They run once per load,
+        including for assets rebuilt from the disk cache, which stores the assets as
+        they were before being transformed. Replaces any previous transforms. Assets
+        already cached are unaffected, see apply_transform().
+        :param warm_cache: A second cache tier. Assets evicted by the cache policy are
+        compressed into it, and rebuilt from it when requested again instead of being
+        loaded. None goes back to dropping evicted assets.
+        :param record_trace: Whether to record each request, and any load it caused,
+        in the manager's trace, for planning preloads in later runs with a
+        PrefetchPlanner. Turning it on starts a new trace, and turning it off discards
+        the trace.
+        :param max_variants: Most variants made by get_variant() kept for each asset,
+        dropping the least recently used. None keeps every variant until its asset is
+        updated, uncached or evicted.
         """
+        from .access_trace import AccessTrace
+        from .stats import ManagerStats
+
         if loader_helper:
             self._asset_loader = loader_helper
+            # Failures of the previous loader say nothing about the new one.
+            self._forget_failures(list(self._failures))
         if default_asset is not NoDefault:
             self.default_asset = default_asset
+        if cache_policy is not None:
+            with self._lock:
+                self.cache_policy = cache_policy
+                cache_policy.clear()
+                for asset_handle, asset in self.cache.items():
+                    cache_policy.insert(asset_handle, asset)
+                self._enforce_budget()
+        if max_workers is not None and max_workers != self.max_workers:
+            self.max_workers = max_workers
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        if thread_safe is not None:
+            self.thread_safe = thread_safe
+        if disk_cache is not None:
+            self.disk_cache = disk_cache
+        if batch_loader:
+            self._batch_loader = batch_loader
+            self._forget_failures(list(self._failures))
+        if weak_cache is not None:
+            with self._lock:
+                if weak_cache and not isinstance(self.cache, WeakCache):
+                    cache = WeakCache(on_release=self._on_release)
+                    if grace_period is not None:
+                        cache.grace_period = grace_period
+                    cache.update(self.cache)
+                    self.cache = cache
+                elif not weak_cache and isinstance(self.cache, WeakCache):
+                    self.cache = dict(self.cache.items())
+        if grace_period is not None and isinstance(self.cache, WeakCache):
+            self.cache.grace_period = grace_period
+        if failure_ttl is not None:
+            self.failure_ttl = failure_ttl
+        if max_failure_ttl is not None:
+            self.max_failure_ttl = max_failure_ttl
+        if process_loader is not NoDefault:
+            self.process_loader = process_loader
+        if transforms is not None:
+            self.transforms = list(transforms)
+        if warm_cache is not NoDefault:
+            self.warm_cache = warm_cache
+        if record_trace is not None:
+            self.trace = AccessTrace() if record_trace else None
+        if max_variants is not NoDefault:
+            with self._lock:
+                self.max_variants = max_variants
+                for variants in self._variants.values():
+                    self._trim_variants(variants)
+        if collect_stats is not None:
+            if not collect_stats:
+                self.stats = None
+            elif self.stats is None:
+                self.stats = ManagerStats()
 
     def import_asset(self, asset_handle: str, resource_location: Any) -> None:
         """
@@ -90,6 +336,7 @@ class ResourceManager[T]:
         as the asset loader can handle the parameters.
         """
         self.resource_locations.update({asset_handle: resource_location})
+        self._forget_failures((asset_handle,))
 
     def import_directory(
         self,
@@ -98,7 +345,8 @@ class ResourceManager[T]:
         file_filter: Callable | None = None,
         name_generator: Callable | None = None,
         location_data_generator: Callable | None = None,
-    ):
+        workers: int | None = None,
+    ) -> list[str]:
         """
         Parse a directory, importing all of the files inside into the resource manager.
 
@@ -113,53 +361,185 @@ class ResourceManager[T]:
         to the relative path to the directory plus the name of the file.
         :param location_data_generator: Function for generating the location data
         required for the asset loader, defaults to the file's path.
+        :param workers: Number of threads used to scan subdirectories in parallel,
+        defaults to None (no extra threads). Mainly useful for very large trees or
+        slow file systems.
+        :return: List of the handles that were imported.
         """
-        directory = Path(folder)
+        from .directory_scan import default_handle, scan_directory
+
+        root = os.fspath(folder)
 
-        if not directory.is_dir():
+        if not os.path.isdir(root):
             raise NotADirectoryError(f"'{folder}' is not a valid directory.")
 
-        if file_filter is None:
+        root_length = len(root) if root.endswith(os.sep) else len(root) + 1
+        new_locations: dict[str, Any] = {}
+        for entry in scan_directory(root, recursive, file_filter, workers):
+            # Paths are only built when something needs one.
+            if name_generator is None:
+                asset_handle = default_handle(entry.path, root_length)
+            else:
+                asset_handle = name_generator(Path(entry.path))
+            if location_data_generator is None:
+                new_locations[asset_handle] = Path(entry.path)
+            else:
+                new_locations[asset_handle] = location_data_generator(Path(entry.path))
+        self.resource_locations.update(new_locations)
+        self._forget_failures(new_locations)
+        return list(new_locations)
 
-            def file_filter(file: Path) -> Path | None:
-                return file
+    def save_index(self, path: os.PathLike | str) -> None:
+        """
+        Saves the handles and location data of every imported asset to a file, so a
+        later run can restore them with load_index instead of importing them again.
 
-        if name_generator is None:
+        Supports location data that is a path, an archive entry, or any value that can
+        be stored as JSON.
 
-            def name_generator(file: Path) -> str:
-                """
-                Uses the relative path and filename, without suffixes,
-                as the default asset handle.
-                """
-                file = file.relative_to(folder)
-                while file.suffix != "":
-                    file = file.with_suffix("")
-                return str(file.as_posix())
+        :param path: Location of the index file to write.
+        :raises TypeError: If any location data is of an unsupported type.
+        """
+        import json
 
-        if location_data_generator is None:
+        from .archive import ArchiveEntry
 
-            def location_data_generator(file: Path) -> Path:
-                """
-                Gives path of the file as its location.
-                """
-                return file
+        locations: dict[str, Any] = {}
+        for asset_handle, resource_location in self.resource_locations.items():
+            if isinstance(resource_location, Path):
+                locations[asset_handle] = {"path": str(resource_location)}
+            elif isinstance(resource_location, ArchiveEntry):
+                locations[asset_handle] = {
+                    "archive": str(resource_location.archive.path),
+                    "entry": resource_location.handle,
+                }
+            else:
+                locations[asset_handle] = {"value": resource_location}
+        try:
+            index = json.dumps(
+                {"version": _INDEX_VERSION, "locations": locations},
+                separators=(",", ":"),
+            )
+        except TypeError as error:
+            raise TypeError(
+                f"{self} has location data that can't be saved in an index."
+            ) from error
+        Path(path).write_text(index, encoding="utf-8")
 
-        files = list(directory.iterdir())
-        for item in files:
-            if not file_filter(item):
-                # Filter first so the filter can be used to exclude specific folders.
-                continue
-            if item.is_dir():
-                if recursive:
-                    for file in item.iterdir():
-                        files.append(file)
-                continue
-            self.import_asset(name_generator(item), location_data_generator(item))
+    def load_index(self, path: os.PathLike | str) -> list[str]:
+        """
+        Imports every asset recorded in an index file made by save_index.
+
+        The index is not checked against the file system, so it should be recreated
+        whenever assets are added, removed or renamed.
+
+        :param path: Location of the index file.
+        :raises ValueError: If the file is not a valid index.
+        :return: List of the handles that were imported.
+        """
+        import json
+
+        from .archive import AssetArchive
+
+        index = json.loads(Path(path).read_text(encoding="utf-8"))
+        if not isinstance(index, dict) or index.get("version") != _INDEX_VERSION:
+            raise ValueError(f"'{path}' is not a valid resource index.")
+        archives: dict[str, AssetArchive] = {}
+        new_locations: dict[str, Any] = {}
+        for asset_handle, record in index["locations"].items():
+            if "path" in record:
+                new_locations[asset_handle] = Path(record["path"])
+            elif "archive" in record:
+                archive_path = record["archive"]
+                if archive_path not in archives:
+                    archives[archive_path] = AssetArchive(archive_path)
+                new_locations[asset_handle] = archives[archive_path][record["entry"]]
+            else:
+                new_locations[asset_handle] = record["value"]
+        self.resource_locations.update(new_locations)
+        self._forget_failures(new_locations)
+        return list(new_locations)
+
+    def import_archive(
+        self, archive: AssetArchive | os.PathLike | str, prefix: str = ""
+    ) -> list[str]:
+        """
+        Imports every entry of an asset archive into the resource manager.
+
+        The location data of each asset is an ArchiveEntry, which the loader must be
+        able to handle. Its read() and open() methods give the contents of the packed
+        file without any further file access.
+
+        :param archive: An open archive, or the path of one.
+        :param prefix: Text to prepend to every handle in the archive, defaults to ""
+        :return: List of the handles that were imported.
+        """
+        from .archive import AssetArchive
+
+        if not isinstance(archive, AssetArchive):
+            archive = AssetArchive(archive)
+        imported: list[str] = []
+        for handle, entry in archive.entries.items():
+            asset_handle = prefix + handle
+            self.import_asset(asset_handle, entry)
+            imported.append(asset_handle)
+        return imported
+
+    def preload(self, asset_handles: Iterable[str]) -> PreloadProgress:
+        """
+        Begins loading the specified assets on the manager's worker threads, without
+        waiting for them to finish.
+
+        Calling get() on an asset that is still loading will wait for that asset
+        only. Handles that are already cached are counted as loaded, and handles that
+        are unknown to the manager, or failed recently enough that they aren't due to
+        be loaded again, are counted as failures.
+
+        :param asset_handles: The names of the resources to be loaded.
+        :return: A progress object for tracking or waiting on the loads.
+        """
+        from .preload import PreloadProgress
+
+        futures: dict[str, Future] = {}
+        failures: dict[str, BaseException] = {}
+        already_loaded: list[str] = []
+        with self._lock:
+            for asset_handle in asset_handles:
+                if asset_handle in futures or asset_handle in failures:
+                    continue
+                if asset_handle not in self.resource_locations:
+                    failures[asset_handle] = KeyError(
+                        f"Resource '{asset_handle}' is not handled by {self}."
+                    )
+                    continue
+                if self.cache.get(asset_handle, None) is not None:
+                    already_loaded.append(asset_handle)
+                    continue
+                if self._in_backoff(asset_handle):
+                    failures[asset_handle] = self._backoff_error(asset_handle)
+                    continue
+                futures[asset_handle] = self._submit_load(asset_handle)
+        return PreloadProgress(futures, failures, already_loaded)
+
+    def prefetch_directory(
+        self, folder: os.PathLike | str, *args, **kwds
+    ) -> PreloadProgress:
+        """
+        Imports a directory, as with import_directory, and begins preloading all of
+        the imported assets in the background.
+
+        Takes the same parameters as import_directory.
+
+        :return: A progress object for tracking or waiting on the loads.
+        """
+        return self.preload(self.import_directory(folder, *args, **kwds))
 
     def force_load(self, asset_handle: str, resource_location: Any) -> None:
         """
         Establishes the resource in the database, and loads it immediately instead of
         deferring to when the asset is requested.
+        The asset is loaded the same way as by get(), and nothing is cached if it
+        fails to load.
 
         :param asset_handle: The name of the resource, which can be referenced by
         users of that resource.
@@ -167,8 +547,9 @@ class ResourceManager[T]:
         resource.
         """
         self.import_asset(asset_handle, resource_location)
-        asset: T = self._asset_loader(resource_location)
-        self.cache.setdefault(asset_handle, asset)
+        asset = self._load_asset(asset_handle)
+        if asset is not None and self.cache.get(asset_handle, None) is None:
+            self._cache_asset(asset_handle, asset)
 
     def update(self, asset_handle: str, asset: T) -> T | None:
         """
@@ -180,7 +561,7 @@ class ResourceManager[T]:
         :return: The old asset, or None if the asset wasn't loaded.
         """
         old_asset = self.cache.get(asset_handle, None)
-        self.cache[asset_handle] = asset
+        self._cache_asset(asset_handle, asset)
         return old_asset
 
     def force_update(self, asset_handle: str, asset: T) -> None:
@@ -200,10 +581,138 @@ class ResourceManager[T]:
         old_asset = self.cache.get(asset_handle, None)
         if old_asset is None:
             # Nothing to replace, so just fill it in
-            self.cache[asset_handle] = asset
+            self._cache_asset(asset_handle, asset)
             return
         # Otherwise, force the loaded asset to take on the new asset's attributes.
         old_asset.__dict__ = asset.__dict__
+        self._variants.pop(asset_handle, None)
+
+    def reload(self, asset_handle: str, hot_swap: bool = False) -> T | None:
+        """
+        Loads the asset again from its location data, replacing the cached asset.
+        If the new load fails, the cached asset is kept.
+
+        :param asset_handle: The name of the resource
+        :param hot_swap: If True, the new asset is applied with force_update, changing
+        the existing asset in place for all of its users. Otherwise, it is applied with
+        update, and only later requests receive the new asset. Defaults to False.
+        :raises KeyError: If the handle is not handled by the manager.
+        :return: The new asset, or None if it failed to load.
+        """
+        if asset_handle not in self.resource_locations:
+            raise KeyError(f"Resource '{asset_handle}' is not handled by {self}.")
+        if self.warm_cache is not None:
+            # Loaded again from its location data, not from a copy of the old asset.
+            self.warm_cache.discard(asset_handle)
+        asset = self._load_asset(asset_handle)
+        if asset is None:
+            return None
+        if hot_swap:
+            self.force_update(asset_handle, asset)
+        else:
+            self.update(asset_handle, asset)
+        return asset
+
+    def apply_transform(
+        self,
+        transform: Callable[[T], T],
+        asset_handles: Iterable[str] | None = None,
+    ) -> list[str]:
+        """
+        Applies a transform to assets that are already cached, replacing them with the
+        results. Useful when a transform could not do its work at the time the assets
+        were loaded.
+
+        :param transform: Function taking an asset and returning the asset to use in
+        its place. Returning the same asset leaves it as it is.
+        :param asset_handles: The names of the resources to transform. Defaults to
+        None, for every cached asset. Handles that aren't cached are skipped.
+        :return: List of the handles whose assets were replaced.
+        """
+        replaced: list[str] = []
+        with self._lock:
+            if asset_handles is None:
+                asset_handles = list(self.cache)
+            for asset_handle in asset_handles:
+                asset = self.cache.get(asset_handle, None)
+                if asset is None:
+                    continue
+                new_asset = transform(asset)
+                if new_asset is not asset and new_asset is not None:
+                    self._cache_asset(asset_handle, new_asset)
+                    replaced.append(asset_handle)
+        return replaced
+
+    def add_hook(self, event: str, callback: Callable) -> None:
+        """
+        Registers a function to be called around every load.
+
+        "pre_load" hooks are called with the handle and location data before loading.
+        "post_load" hooks are called with the handle, location data, loaded asset (or
+        None if it failed) and the load time in seconds.
+        Hooks are called from whichever thread performs the load.
+
+        :param event: Either "pre_load" or "post_load".
+        :param callback: The function to be called.
+        :raises ValueError: If the event is not recognized.
+        """
+        if event not in self._hooks:
+            raise ValueError(f"Unknown hook event '{event}'.")
+        self._hooks[event].append(callback)
+
+    def remove_hook(self, event: str, callback: Callable) -> None:
+        """
+        Unregisters a function added with add_hook. Safe to call if it isn't
+        registered.
+
+        :param event: Either "pre_load" or "post_load".
+        :param callback: The function to be removed.
+        """
+        hooks = self._hooks.get(event, [])
+        if callback in hooks:
+            hooks.remove(callback)
+
+    def stats_snapshot(self, per_handle: bool = True) -> dict[str, Any]:
+        """
+        Gives the manager's statistics along with the current state of its cache.
+
+        :param per_handle: Whether to include statistics for each handle, defaults to
+        True
+        :return: A JSON-compatible dictionary. Usage counters are only included while
+        stats are being collected.
+        """
+        snapshot: dict[str, Any] = {
+            "manager": self.handle,
+            "imported": len(self.resource_locations),
+            "cached": len(self.cache),
+            "failed": len(self._failures),
+            "cache_size": (
+                self.cache_policy.current_size
+                if self.cache_policy is not None
+                and self.cache_policy.max_size is not None
+                else None
+            ),
+        }
+        if self.warm_cache is not None:
+            snapshot["warm"] = self.warm_cache.snapshot()
+        if self.stats is not None:
+            snapshot.update(self.stats.snapshot(per_handle))
+        return snapshot
+
+    def watch(self, **kwds) -> FileWatcher:
+        """
+        Starts watching the files of this manager's assets, reloading cached assets
+        when their files change.
+
+        Takes the same keyword parameters as FileWatcher.
+
+        :return: The running watcher. Call its stop() method to stop watching.
+        """
+        from .watcher import FileWatcher
+
+        watcher = FileWatcher(self, **kwds)
+        watcher.start()
+        return watcher
 
     def get(
         self, asset_handle: str, default: T | None | NoDefault = NoDefault
@@ -225,30 +734,205 @@ class ResourceManager[T]:
             # Refer to the manager's default asset if no local default is provided.
             default = self.default_asset
         if asset_handle not in self.resource_locations:
-            if default is NoDefault:
-                closest = difflib.get_close_matches(
-                    asset_handle, self.resource_locations.keys(), n=1
-                )
-                error_msg = f"Resource '{asset_handle}' is not handled by {self}."
-                if len(closest) > 0:
-                    error_msg += f" Did you mean '{closest[0]}'?"
-                raise KeyError(error_msg)
-            return default
+            return self._handle_unknown(asset_handle, default)
         asset = self.cache.get(asset_handle, None)
         if asset is None:
-            asset = self._asset_loader(self.resource_locations.get(asset_handle))
+            self._record_miss(asset_handle)
+            asset = self._load_miss(asset_handle)
+            asset = self._handle_loaded(asset_handle, asset, default)
+        else:
+            self._record_hit(asset_handle)
+        return asset
+
+    def get_many(
+        self, asset_handles: Iterable[str], default: T | None | NoDefault = NoDefault
+    ) -> dict[str, T | None]:
+        """
+        Gets the assets of all of the requested handles, loading any that haven't been
+        already.
+        Assets that need loading are passed to the batch loader together, if one is
+        configured, and are otherwise loaded one at a time.
+        Each asset follows the same rules as get() for defaults and failures.
+
+        :param asset_handles: Names of the assets to be gotten
+        :param default: Item used for any asset that is unavailable
+        :raises KeyError: Raised if a handle is not found or fails to load,
+        and no default is given or otherwise available.
+        :return: Dictionary of each requested handle and its asset, in the order
+        requested.
+        """
+        if default is NoDefault and self.default_asset is not NoDefault:
+            default = self.default_asset
+        assets: dict[str, T | None] = {}
+        misses: list[str] = []
+        for asset_handle in asset_handles:
+            if asset_handle in assets:
+                continue
+            if asset_handle not in self.resource_locations:
+                assets[asset_handle] = self._handle_unknown(asset_handle, default)
+                continue
+            asset = self.cache.get(asset_handle, None)
             if asset is None:
-                # Last chance to get an asset
-                if default is NoDefault:
-                    raise KeyError(f"Resource '{asset_handle}' failed to load.")
-                asset = default
-            self.cache[asset_handle] = asset
+                # Placeholder, to keep the requested order.
+                assets[asset_handle] = None
+                misses.append(asset_handle)
+            else:
+                self._record_hit(asset_handle)
+                assets[asset_handle] = asset
+        if not misses:
+            return assets
+        for asset_handle in misses:
+            self._record_miss(asset_handle)
+        if self._batch_loader is None:
+            for asset_handle in misses:
+                asset = self._load_miss(asset_handle)
+                assets[asset_handle] = self._handle_loaded(asset_handle, asset, default)
+            return assets
+        loaded = self._load_batch(misses)
+        for asset_handle in misses:
+            assets[asset_handle] = self._handle_loaded(
+                asset_handle, loaded[asset_handle], default
+            )
+        return assets
+
+    def get_variant(
+        self,
+        asset_handle: str,
+        transform: Callable[..., T],
+        *args,
+        default: T | None | NoDefault = NoDefault,
+    ) -> T | None:
+        """
+        Gets a transformed version of the asset of the requested handle, such as a
+        scaled or rotated image.
+        Each variant is only made once, and is kept for as long as the asset it was
+        made from stays cached, unless it is among the least recently used once the
+        asset has more than max_variants variants. Variants are discarded when their
+        asset is updated, uncached or evicted.
+
+        :param asset_handle: Name of the asset to be gotten
+        :param transform: Function taking the asset and the given arguments, and
+        returning the transformed asset. Must not modify the original asset.
+        :param default: Item returned if the asset is unavailable. Defaults are not
+        transformed.
+        :raises KeyError: Raised if handle is not found or fails to load,
+        and no default is given or otherwise available.
+        :return: The transformed asset, or the default if the asset is unavailable.
+        """
+        asset = self.get(asset_handle, default)
+        key = (transform, args)
+        variants = self._variants.get(asset_handle)
+        if variants is not None:
+            variant = variants.get(key)
+            if variant is not None:
+                if self.max_variants is not None:
+                    with self._lock:
+                        # Moved to the end, so the least recently used are first.
+                        if variants.pop(key, None) is not None:
+                            variants[key] = variant
+                return variant
+        with self._lock:
+            if asset is None or self.cache.get(asset_handle, None) is not asset:
+                # The asset is a default, not the asset of this handle.
+                return asset
+        variant = transform(asset, *args)
+        with self._lock:
+            # Only kept if the asset wasn't replaced while transforming it.
+            if self.cache.get(asset_handle, None) is asset:
+                variants = self._variants.setdefault(asset_handle, {})
+                variants[key] = variant
+                self._trim_variants(variants)
+        return variant
+
+    def _trim_variants(self, variants: dict[tuple, T]) -> None:
+        """
+        Drops an asset's least recently used variants until it has no more than
+        max_variants.
+
+        :param variants: The variants of the asset.
+        """
+        if self.max_variants is None:
+            return
+        while len(variants) > self.max_variants:
+            del variants[next(iter(variants))]
+
+    async def aget(
+        self, asset_handle: str, default: T | None | NoDefault = NoDefault
+    ) -> T | None:
+        """
+        Asynchronous version of get(). Cache hits return immediately, while misses are
+        loaded without blocking the event loop. Asynchronous loaders are awaited
+        directly, and synchronous ones are run on the manager's worker threads.
+
+        Concurrent requests for the same asset share a single load.
+
+        :param asset_handle: Name of the asset to be gotten
+        :param default: Item returned if the asset is unavailable
+        :raises KeyError: Raised if handle is not found or fails to load,
+        and no default is given or otherwise available.
+        :return: The (loaded) instance of the asset, or the default if available.
+        """
+        if default is NoDefault and self.default_asset is not NoDefault:
+            default = self.default_asset
+        if asset_handle not in self.resource_locations:
+            return self._handle_unknown(asset_handle, default)
+        asset = self.cache.get(asset_handle, None)
+        if asset is None:
+            self._record_miss(asset_handle)
+            if self._in_backoff(asset_handle):
+                asset = None
+            else:
+                asset = await self._aload(asset_handle)
+            asset = self._handle_loaded(asset_handle, asset, default)
+        else:
+            self._record_hit(asset_handle)
         return asset
 
+    async def apreload(self, asset_handles: Iterable[str]) -> dict[str, BaseException]:
+        """
+        Asynchronously loads all of the specified assets, overlapping their loads, and
+        waits for all of them to finish.
+
+        :param asset_handles: The names of the resources to be loaded.
+        :return: Dictionary of the handles that failed to load, and the exception
+        explaining why, including handles that failed recently enough that they
+        weren't loaded again. Empty if everything loaded.
+        """
+        import asyncio
+
+        failures: dict[str, BaseException] = {}
+        to_load: list[str] = []
+        for asset_handle in dict.fromkeys(asset_handles):
+            if asset_handle not in self.resource_locations:
+                failures[asset_handle] = KeyError(
+                    f"Resource '{asset_handle}' is not handled by {self}."
+                )
+            elif self.cache.get(asset_handle, None) is not None:
+                continue
+            elif self._in_backoff(asset_handle):
+                failures[asset_handle] = self._backoff_error(asset_handle)
+            else:
+                to_load.append(asset_handle)
+        results = await asyncio.gather(
+            *(self._aload(asset_handle) for asset_handle in to_load),
+            return_exceptions=True,
+        )
+        for asset_handle, result in zip(to_load, results):
+            if isinstance(result, BaseException):
+                failures[asset_handle] = result
+            elif result is None:
+                failures[asset_handle] = KeyError(
+                    f"Resource '{asset_handle}' failed to load."
+                )
+            elif self.cache.get(asset_handle, None) is None:
+                self._cache_asset(asset_handle, result)
+        return failures
+
     def uncache(self, asset_handle: str) -> T | None:
         """
         Unloads the specified asset from the manager. Existing copies of the resource
         being used by objects will keep it in memory until they cease using it.
+        With a weak cache, this happens automatically once the asset is unused.
 
         If the asset is requested again, it will be reloaded.
 
@@ -257,7 +941,13 @@ class ResourceManager[T]:
         :param asset_handle: The name of the resource
         :return: The resource being unloaded, or None if it does not exist.
         """
-        return self.cache.pop(asset_handle, None)
+        with self._lock:
+            if self.cache_policy is not None:
+                self.cache_policy.remove(asset_handle)
+            self._variants.pop(asset_handle, None)
+            if self.warm_cache is not None:
+                self.warm_cache.discard(asset_handle)
+            return self.cache.pop(asset_handle, None)
 
     def clear(self, asset_handle: str) -> tuple[T | None, Any] | None:
         """
@@ -271,10 +961,686 @@ class ResourceManager[T]:
         """
         old_asset = self.uncache(asset_handle)
         old_location = self.resource_locations.pop(asset_handle, None)
+        self._forget_failures((asset_handle,))
         if old_location is None:
             return None
         return (old_asset, old_location)
 
+    def suggest(self, asset_handle: str, n: int = 3, cutoff: float = 0.6) -> list[str]:
+        """
+        Finds the imported handles most similar to the given one, such as when it has
+        been misspelled.
+
+        Uses an index of the imported handles, built on first use and kept up to date
+        as assets are imported and cleared, so the cost does not grow with the number
+        of handles.
+
+        :param asset_handle: The handle to find matches for.
+        :param n: Maximum number of suggestions, defaults to 3
+        :param cutoff: Minimum similarity, from 0.0 to 1.0, defaults to 0.6
+        :return: Up to n handles, most similar first.
+        """
+        return self.resource_locations.index.suggest(asset_handle, n, cutoff)
+
+    def failed_handles(self) -> dict[str, LoadFailure]:
+        """
+        Lists the assets whose most recent load failed.
+
+        :return: Dictionary of the failed handles and a record of their failure.
+        """
+        with self._lock:
+            return dict(self._failures)
+
+    def retry_failed(self, asset_handles: Iterable[str] | None = None) -> list[str]:
+        """
+        Loads failed assets again immediately, without waiting for their backoff to
+        pass.
+
+        :param asset_handles: The names of the resources to retry. Defaults to None,
+        which retries every failed asset.
+        :return: List of the handles that failed again.
+        """
+        if asset_handles is None:
+            asset_handles = list(self._failures)
+        still_failing: list[str] = []
+        for asset_handle in asset_handles:
+            if asset_handle not in self.resource_locations:
+                self._forget_failures((asset_handle,))
+                continue
+            failure = self._failures.get(asset_handle)
+            if failure is not None:
+                # Due now, while still counting toward the next backoff.
+                failure.retry_at = 0.0
+            asset = self._load_miss(asset_handle)
+            if asset is None:
+                still_failing.append(asset_handle)
+            elif self.cache.get(asset_handle, None) is None:
+                self._cache_asset(asset_handle, asset)
+        return still_failing
+
+    def _cache_asset(self, asset_handle: str, asset: T) -> None:
+        """
+        Stores the asset in the cache, evicting other assets if the cache policy's
+        budget is exceeded.
+
+        :param asset_handle: The name of the resource
+        :param asset: The asset being cached.
+        """
+        with self._lock:
+            self.cache[asset_handle] = asset
+            # Variants of whatever asset was there before no longer apply.
+            self._variants.pop(asset_handle, None)
+            if self.warm_cache is not None:
+                self.warm_cache.discard(asset_handle)
+            if self._failures:
+                self._failures.pop(asset_handle, None)
+            if self.cache_policy is not None:
+                self.cache_policy.insert(asset_handle, asset)
+                self._enforce_budget(asset_handle)
+
+    def _enforce_budget(self, protected: str | None = None) -> None:
+        """
+        Evicts assets chosen by the cache policy until it is within budget, moving
+        them to the warm cache if there is one.
+
+        :param protected: A handle that must not be evicted, defaults to None
+        """
+        policy = self.cache_policy
+        if policy is None:
+            return
+        while policy.over_budget():
+            victim = policy.pop_victim(protected)
+            if victim is None:
+                break
+            asset = self.cache.pop(victim, None)
+            self._variants.pop(victim, None)
+            if self.warm_cache is not None and asset is not None:
+                self.warm_cache.store(victim, asset)
+
+    def _on_release(self, asset_handle: str) -> None:
+        """
+        Called when a weakly cached asset is released for being unused.
+
+        :param asset_handle: The name of the released resource.
+        """
+        with self._lock:
+            self._variants.pop(asset_handle, None)
+            if self.cache_policy is not None:
+                self.cache_policy.remove(asset_handle)
+
+    def _record_hit(self, asset_handle: str) -> None:
+        """
+        Notes a cache hit with the cache policy, the stats and the trace, if there are
+        any.
+
+        :param asset_handle: The name of the requested resource.
+        """
+        if self.cache_policy is not None:
+            with self._lock:
+                self.cache_policy.access(asset_handle)
+        if self.stats is not None:
+            self.stats.record_hit(asset_handle)
+        if self.trace is not None:
+            self.trace.record_hit(asset_handle)
+
+    def _record_miss(self, asset_handle: str) -> None:
+        """
+        Notes a cache miss with the stats and the trace, if there are any.
+
+        :param asset_handle: The name of the requested resource.
+        """
+        if self.stats is not None:
+            self.stats.record_miss(asset_handle)
+        if self.trace is not None:
+            self.trace.record_miss(asset_handle)
+
+    def _handle_unknown(
+        self, asset_handle: str, default: T | None | NoDefault
+    ) -> T | None:
+        """
+        Deals with a request for a handle the manager does not know about.
+
+        :param asset_handle: The name of the requested resource.
+        :param default: The default to fall back on, if any.
+        :raises KeyError: If there is no default.
+        :return: The default.
+        """
+        if default is NoDefault:
+            closest = self.suggest(asset_handle, 1)
+            error_msg = f"Resource '{asset_handle}' is not handled by {self}."
+            if len(closest) > 0:
+                error_msg += f" Did you mean '{closest[0]}'?"
+            raise KeyError(error_msg)
+        if self.stats is not None:
+            self.stats.record_default(asset_handle)
+        return default
+
+    def _handle_loaded(
+        self, asset_handle: str, asset: T | None, default: T | None | NoDefault
+    ) -> T | None:
+        """
+        Caches a freshly loaded asset, falling back on the default if it failed.
+        Defaults are not cached.
+
+        :param asset_handle: The name of the resource
+        :param asset: The result of the loader.
+        :param default: The default to fall back on, if any.
+        :raises KeyError: If the asset failed to load and there is no default.
+        :return: The asset to supply to the caller.
+        """
+        if asset is None:
+            # Last chance to get an asset
+            if default is NoDefault:
+                failure = self._failures.get(asset_handle)
+                raise KeyError(f"Resource '{asset_handle}' failed to load.") from (
+                    failure.error if failure is not None else None
+                )
+            if self.stats is not None:
+                self.stats.record_default(asset_handle)
+            return default
+        if self.cache.get(asset_handle, None) is not asset:
+            self._cache_asset(asset_handle, asset)
+        return asset
+
+    def _load_miss(self, asset_handle: str) -> T | None:
+        """
+        Loads an asset that was not found in the cache, or waits on a load of it that
+        is already in progress.
+
+        :param asset_handle: The name of the resource
+        :return: The loaded asset, or None if it failed to load, or failed recently
+        enough that it isn't due to be loaded again.
+        """
+        from concurrent.futures import CancelledError
+
+        pending = self._pending_load(asset_handle)
+        if pending is not None:
+            # Already being loaded in the background, so wait for that instead.
+            try:
+                return pending.result()
+            except CancelledError:
+                # The preload was cancelled before it started, so load it here.
+                pass
+        if self._in_backoff(asset_handle):
+            return None
+        if self.thread_safe:
+            return self._load_shared(asset_handle)
+        return self._load_asset(asset_handle)
+
+    def _load_batch(self, asset_handles: list[str]) -> dict[str, T | None]:
+        """
+        Loads several assets with the batch loader, and caches them.
+        Assets already being loaded elsewhere are waited on instead, and other
+        requests for the assets in the batch wait on the batch.
+
+        :param asset_handles: The names of the resources
+        :return: Dictionary of each handle and its loaded asset, or None if it failed
+        to load.
+        """
+        from concurrent.futures import CancelledError, Future
+
+        results: dict[str, T | None] = {}
+        waiting: dict[str, Future] = {}
+        futures: dict[str, Future] = {}
+        with self._lock:
+            for asset_handle in asset_handles:
+                asset = self.cache.get(asset_handle, None)
+                if asset is not None:
+                    results[asset_handle] = asset
+                elif (pending := self._pending_load(asset_handle)) is not None:
+                    waiting[asset_handle] = pending
+                elif self._in_backoff(asset_handle):
+                    results[asset_handle] = None
+                else:
+                    future: Future = Future()
+                    future.set_running_or_notify_cancel()
+                    self._pending[asset_handle] = future
+                    futures[asset_handle] = future
+        try:
+            if futures:
+                results.update(self._run_batch_loader(list(futures)))
+        except BaseException as error:
+            for future in futures.values():
+                future.set_exception(error)
+            raise
+        else:
+            for asset_handle, future in futures.items():
+                future.set_result(results[asset_handle])
+        finally:
+            with self._lock:
+                for asset_handle in futures:
+                    self._pending.pop(asset_handle, None)
+        for asset_handle, pending in waiting.items():
+            try:
+                results[asset_handle] = pending.result()
+            except CancelledError:
+                results[asset_handle] = self._load_miss(asset_handle)
+        return results
+
+    def _run_batch_loader(self, asset_handles: list[str]) -> dict[str, T | None]:
+        """
+        Runs the batch loader on the location data of the given handles, except for
+        any that can be rebuilt from the disk cache, and caches the results.
+
+        :param asset_handles: The names of the resources
+        :raises ValueError: If the batch loader returns the wrong number of assets.
+        :return: Dictionary of each handle and its loaded asset, or None if it failed
+        to load.
+        """
+        import inspect
+
+        locations = {
+            asset_handle: self.resource_locations.get(asset_handle)
+            for asset_handle in asset_handles
+        }
+        for asset_handle, resource_location in locations.items():
+            self._start_load(asset_handle, resource_location)
+        start = time.perf_counter()
+        results: dict[str, T | None] = {}
+        error: Exception | None = None
+        try:
+            to_load: list[str] = []
+            for asset_handle, resource_location in locations.items():
+                asset = self._prepare_load(asset_handle, resource_location)
+                if asset is None:
+                    to_load.append(asset_handle)
+                else:
+                    results[asset_handle] = asset
+            if to_load:
+                try:
+                    assets = self._batch_loader(
+                        [locations[asset_handle] for asset_handle in to_load]
+                    )
+                    if inspect.isawaitable(assets):
+                        assets = _run_awaitable(assets)
+                    assets = list(assets)
+                except _LoopRunningError:
+                    raise
+                except Exception as loader_error:
+                    # The whole batch failed.
+                    error = loader_error
+                    assets = [None] * len(to_load)
+                if len(assets) != len(to_load):
+                    raise ValueError(
+                        f"Batch loader returned {len(assets)} assets for "
+                        f"{len(to_load)} locations."
+                    )
+                for asset_handle, asset in zip(to_load, assets):
+                    results[asset_handle] = self._finish_load(
+                        asset_handle, locations[asset_handle], asset
+                    )
+            for asset_handle, asset in results.items():
+                self._note_result(asset_handle, asset, error)
+            with self._lock:
+                for asset_handle, asset in results.items():
+                    if asset is not None and self.cache.get(asset_handle, None) is None:
+                        self._cache_asset(asset_handle, asset)
+            return results
+        finally:
+            # The batch's time is shared evenly between its assets.
+            seconds = (time.perf_counter() - start) / len(locations)
+            for asset_handle, resource_location in locations.items():
+                self._end_load(
+                    asset_handle,
+                    resource_location,
+                    results.get(asset_handle),
+                    seconds,
+                )
+
+    def _load_asset(self, asset_handle: str) -> T | None:
+        """
+        Runs the loader on the location data of the given handle, unless the asset can
+        be rebuilt from the disk cache. The loader runs in the process loader's workers
+        if there is one.
+        Exceptions raised by the loader are recorded as a failure, the same as the
+        loader returning None.
+        Asynchronous loaders are run to completion in a new event loop, which is only
+        possible when no event loop is running in the current thread.
+
+        :param asset_handle: The name of the resource
+        :raises RuntimeError: If the loader is asynchronous, and an event loop is
+        already running in this thread.
+        :return: The loaded asset, or None if it failed to load.
+        """
+        import inspect
+
+        resource_location = self.resource_locations.get(asset_handle)
+        self._start_load(asset_handle, resource_location)
+        start = time.perf_counter()
+        asset = None
+        try:
+            asset = self._prepare_load(asset_handle, resource_location)
+            error: Exception | None = None
+            if asset is None:
+                try:
+                    if self.process_loader is not None:
+                        asset = self.process_loader.load(
+                            self._asset_loader, resource_location
+                        )
+                    else:
+                        asset = self._asset_loader(resource_location)
+                    if inspect.isawaitable(asset):
+                        asset = _run_awaitable(asset)
+                except (_LoopRunningError, _NoLoaderError):
+                    raise
+                except Exception as loader_error:
+                    error = loader_error
+                    asset = None
+                asset = self._finish_load(asset_handle, resource_location, asset)
+            self._note_result(asset_handle, asset, error)
+            return asset
+        finally:
+            self._end_load(
+                asset_handle, resource_location, asset, time.perf_counter() - start
+            )
+
+    async def _aload_asset(self, asset_handle: str) -> T | None:
+        """
+        Asynchronous version of _load_asset, for use with asynchronous loaders.
+
+        :param asset_handle: The name of the resource
+        :return: The loaded asset, or None if it failed to load.
+        """
+        resource_location = self.resource_locations.get(asset_handle)
+        self._start_load(asset_handle, resource_location)
+        start = time.perf_counter()
+        asset = None
+        try:
+            asset = self._prepare_load(asset_handle, resource_location)
+            error: Exception | None = None
+            if asset is None:
+                try:
+                    asset = await self._asset_loader(resource_location)
+                except Exception as loader_error:
+                    error = loader_error
+                    asset = None
+                asset = self._finish_load(asset_handle, resource_location, asset)
+            self._note_result(asset_handle, asset, error)
+            return asset
+        finally:
+            self._end_load(
+                asset_handle, resource_location, asset, time.perf_counter() - start
+            )
+
+    def _in_backoff(self, asset_handle: str) -> bool:
+        """
+        :param asset_handle: The name of the resource
+        :return: True if the asset failed to load recently enough that it shouldn't be
+        loaded again yet.
+        """
+        failure = self._failures.get(asset_handle)
+        return failure is not None and time.monotonic() < failure.retry_at
+
+    def _backoff_error(self, asset_handle: str) -> KeyError:
+        """
+        :param asset_handle: The name of the resource
+        :return: The error reported for an asset that isn't loaded because it is
+        backing off, caused by the loader's exception if it raised one.
+        """
+        error = KeyError(f"Resource '{asset_handle}' failed to load.")
+        failure = self._failures.get(asset_handle)
+        if failure is not None:
+            error.__cause__ = failure.error
+        return error
+
+    def _note_result(
+        self, asset_handle: str, asset: T | None, error: Exception | None = None
+    ) -> None:
+        """
+        Records the outcome of a load, starting or extending the asset's backoff if it
+        failed, and ending it if it succeeded.
+
+        :param asset_handle: The name of the resource
+        :param asset: The loaded asset, or None if it failed to load.
+        :param error: The exception raised by the loader, if any.
+        """
+        if asset is not None:
+            if self._failures:
+                self._failures.pop(asset_handle, None)
+            return
+        with self._lock:
+            previous = self._failures.get(asset_handle)
+            attempts = previous.attempts + 1 if previous is not None else 1
+            delay = min(
+                self.failure_ttl * 2 ** (attempts - 1), self.max_failure_ttl
+            )
+            self._failures[asset_handle] = LoadFailure(
+                asset_handle, error, attempts, time.monotonic() + delay
+            )
+
+    def _forget_failures(self, asset_handles: Iterable[str]) -> None:
+        """
+        Discards the failure records of the given handles, such as when they are given
+        new location data.
+        """
+        if not self._failures:
+            return
+        with self._lock:
+            for asset_handle in asset_handles:
+                self._failures.pop(asset_handle, None)
+
+    def _start_load(self, asset_handle: str, resource_location: Any) -> None:
+        """
+        Calls the pre-load hooks.
+        """
+        for hook in self._hooks["pre_load"]:
+            hook(asset_handle, resource_location)
+
+    def _end_load(
+        self,
+        asset_handle: str,
+        resource_location: Any,
+        asset: T | None,
+        seconds: float,
+    ) -> None:
+        """
+        Records the load in the manager's statistics and trace, and calls the post-load
+        hooks.
+        """
+        if self.stats is not None:
+            self.stats.record_load(asset_handle, seconds, asset is not None)
+        if self.trace is not None:
+            self.trace.record_load(asset_handle, seconds, asset is not None)
+        for hook in self._hooks["post_load"]:
+            hook(asset_handle, resource_location, asset, seconds)
+
+    def _prepare_load(self, asset_handle: str, resource_location: Any) -> T | None:
+        """
+        Runs before the loader, and may supply the asset so the loader is skipped.
+        Supplied assets have already been transformed.
+
+        :param asset_handle: The name of the resource
+        :param resource_location: The location data of the resource.
+        :return: The asset, or None if the loader must be run.
+        """
+        if self.warm_cache is not None:
+            # Rebuilt as it was when cached, after its transforms, so they aren't run
+            # again.
+            asset = self.warm_cache.take(asset_handle)
+            if asset is not None:
+                return asset
+        if self.disk_cache is not None:
+            asset = self.disk_cache.load(resource_location)
+            if asset is not None:
+                return self._transform(asset)
+        return None
+
+    def _finish_load(
+        self, asset_handle: str, resource_location: Any, asset: T | None
+    ) -> T | None:
+        """
+        Runs on the result of the loader, storing it in the disk cache and applying
+        the transforms.
+
+        :param asset_handle: The name of the resource
+        :param resource_location: The location data of the resource.
+        :param asset: The output of the loader.
+        :return: The asset to be cached, or None if loading failed.
+        """
+        if asset is None:
+            return None
+        if self.disk_cache is not None:
+            self.disk_cache.store(resource_location, asset)
+        return self._transform(asset)
+
+    def _transform(self, asset: T) -> T | None:
+        """
+        Runs the manager's transforms on a newly loaded asset.
+
+        :param asset: The loaded asset.
+        :return: The asset to be cached, or None if a transform rejected it.
+        """
+        for transform in self.transforms:
+            asset = transform(asset)
+            if asset is None:
+                return None
+        return asset
+
+    def _load_shared(self, asset_handle: str) -> T | None:
+        """
+        Loads the asset in the calling thread, unless another thread is already loading
+        it, in which case that load's result is waited for instead.
+
+        :param asset_handle: The name of the resource
+        :return: The loaded asset, or None if it failed to load.
+        """
+        from concurrent.futures import CancelledError, Future
+
+        with self._lock:
+            asset = self.cache.get(asset_handle, None)
+            if asset is not None:
+                # Another thread finished loading it since our first look.
+                return asset
+            future = self._pending_load(asset_handle)
+            if future is not None:
+                waiting = True
+            else:
+                waiting = False
+                future = Future()
+                future.set_running_or_notify_cancel()
+                self._pending[asset_handle] = future
+        if waiting:
+            try:
+                return future.result()
+            except CancelledError:
+                return self._load_shared(asset_handle)
+        try:
+            asset = self._load_asset(asset_handle)
+            if asset is not None:
+                self._cache_asset(asset_handle, asset)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(asset)
+        finally:
+            with self._lock:
+                self._pending.pop(asset_handle, None)
+        return asset
+
+    async def _aload(self, asset_handle: str) -> T | None:
+        """
+        Loads the asset without blocking the running event loop, sharing the load with
+        any other request for the same handle that is already in progress.
+
+        :param asset_handle: The name of the resource
+        :return: The loaded asset, or None if it failed to load.
+        """
+        import asyncio
+        import inspect
+
+        pending = self._pending_load(asset_handle)
+        if pending is not None:
+            return await asyncio.wrap_future(pending)
+        if not inspect.iscoroutinefunction(self._asset_loader):
+            # Synchronous loaders go to the worker threads, so they can overlap.
+            return await asyncio.wrap_future(self._submit_load(asset_handle))
+        loop = asyncio.get_running_loop()
+        task = self._async_pending.get(asset_handle)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._aload_asset(asset_handle))
+            self._async_pending[asset_handle] = task
+            task.add_done_callback(
+                lambda task: self._async_pending.pop(asset_handle, None)
+            )
+        # Shielded so one cancelled request doesn't cancel the load for the others.
+        return await asyncio.shield(task)
+
+    def _submit_load(self, asset_handle: str) -> Future:
+        """
+        Schedules the asset to be loaded on a worker thread, unless it already is.
+
+        :param asset_handle: The name of the resource
+        :return: The future of the load.
+        """
+        with self._lock:
+            future = self._pending_load(asset_handle)
+            if future is None:
+                future = self._get_executor().submit(
+                    self._background_load, asset_handle
+                )
+                self._pending[asset_handle] = future
+                # Cancelled loads never run, so they must be forgotten here instead.
+                future.add_done_callback(
+                    lambda future: self._forget_pending(asset_handle, future)
+                )
+            return future
+
+    def _pending_load(self, asset_handle: str) -> Future | None:
+        """
+        :param asset_handle: The name of the resource
+        :return: The future of a load of the asset that is in progress or scheduled,
+        or None if there isn't one, or it was cancelled.
+        """
+        future = self._pending.get(asset_handle)
+        if future is None or future.cancelled():
+            return None
+        return future
+
+    def _forget_pending(self, asset_handle: str, future: Future) -> None:
+        """
+        Removes a finished load from the pending loads, unless it has been replaced.
+
+        :param asset_handle: The name of the resource
+        :param future: The future of the finished load.
+        """
+        with self._lock:
+            if self._pending.get(asset_handle) is future:
+                del self._pending[asset_handle]
+
+    def _background_load(self, asset_handle: str) -> T | None:
+        """
+        Loads and caches an asset on a worker thread.
+
+        :param asset_handle: The name of the resource
+        :return: The loaded asset, or None if it failed to load, or failed recently
+        enough that it isn't due to be loaded again.
+        """
+        try:
+            if self._in_backoff(asset_handle):
+                return None
+            asset = self._load_asset(asset_handle)
+            if asset is not None:
+                with self._lock:
+                    if self.cache.get(asset_handle, None) is None:
+                        self._cache_asset(asset_handle, asset)
+            return asset
+        finally:
+            with self._lock:
+                self._pending.pop(asset_handle, None)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Gives the worker pool used for preloading, creating it if needed.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix=f"resourceful-{self.handle}"
+            )
+        return self._executor
+
     @staticmethod
     def _asset_loader(*args, **kwds):
         """
@@ -282,11 +1648,55 @@ class ResourceManager[T]:
 
         :raises AttributeError: If asset_loader is not supplied via config.
         """
-        raise AttributeError(
+        raise _NoLoaderError(
             "No loader function assigned. You must assign a loader to run."
         )
 
 
+class _NoLoaderError(AttributeError):
+    """
+    Raised when an asset is loaded before a loader is configured. A usage error
+    rather than a load failure, so it is never recorded as one.
+    """
+
+
+class _LoopRunningError(RuntimeError):
+    """
+    Raised when an asynchronous loader is used from synchronous code inside a running
+    event loop. A usage error rather than a load failure, so it is never recorded as
+    one.
+    """
+
+
+def _run_awaitable(awaitable: Awaitable[T]) -> T:
+    """
+    Runs an awaitable to completion from synchronous code.
+
+    :param awaitable: The awaitable to be run.
+    :raises RuntimeError: If an event loop is already running in this thread.
+    :return: The result of the awaitable.
+    """
+    import asyncio
+    import inspect
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise _LoopRunningError(
+            "Cannot run an asynchronous loader from synchronous code while an event "
+            "loop is running. Use aget() instead."
+        )
+
+    async def wrapper() -> T:
+        return await awaitable
+
+    return asyncio.run(wrapper())
+
+
 def getResourceManager(asset_type: type[T], handle: str = "") -> ResourceManager[T]:
     """
     Provides a Resource Manager of the specified type and handle.
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections import deque
+import json
+import math
+import os
+import threading
+from typing import Any
+
+
+class HandleStats:
+    """
+    Usage counters for a single asset handle.
+    """
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "loads",
+        "failures",
+        "defaults",
+        "load_time",
+        "latencies",
+    )
+
+    def __init__(self, sample_size: int) -> None:
+        self.hits: int = 0
+        """
+        Requests answered from the cache.
+        """
+        self.misses: int = 0
+        """
+        Requests that required the asset to be loaded.
+        """
+        self.loads: int = 0
+        """
+        Times the asset was loaded, successfully or not.
+        """
+        self.failures: int = 0
+        """
+        Loads that returned None or raised an exception.
+        """
+        self.defaults: int = 0
+        """
+        Requests answered with a default asset.
+        """
+        self.load_time: float = 0.0
+        """
+        Total seconds spent loading.
+        """
+        self.latencies: deque[float] = deque(maxlen=sample_size)
+        """
+        Durations of the most recent loads, in seconds.
+        """
+
+    def snapshot(self, latencies: list[float] | None = None) -> dict[str, Any]:
+        """
+        :param latencies: A copy of the recent load times to compute the percentiles
+        from, defaults to None, reading them directly.
+        :return: The counters as a JSON-compatible dictionary.
+        """
+        if latencies is None:
+            latencies = list(self.latencies)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "failures": self.failures,
+            "defaults": self.defaults,
+            "load_time": self.load_time,
+            "p50": percentile(latencies, 50),
+            "p99": percentile(latencies, 99),
+        }
+
+
+class ManagerStats:
+    """
+    Usage counters for a resource manager, in total and per handle.
+
+    Load latency percentiles are computed over a rolling window of the most recent
+    loads.
+    """
+
+    def __init__(self, sample_size: int = 1024, handle_sample_size: int = 64) -> None:
+        """
+        :param sample_size: Number of recent load times kept for the whole manager,
+        defaults to 1024
+        :param handle_sample_size: Number of recent load times kept for each handle,
+        defaults to 64
+        """
+        self.sample_size = sample_size
+        self.handle_sample_size = handle_sample_size
+        self.total = HandleStats(sample_size)
+        """
+        Counters summed over every handle.
+        """
+        self.handles: dict[str, HandleStats] = {}
+        """
+        Counters for each handle that has been requested.
+        """
+        self._lock = threading.Lock()
+
+    def __getitem__(self, asset_handle: str) -> HandleStats:
+        return self.handles[asset_handle]
+
+    def record_hit(self, asset_handle: str) -> None:
+        """
+        Counts a request answered from the cache.
+        """
+        self.total.hits += 1
+        self._for_handle(asset_handle).hits += 1
+
+    def record_miss(self, asset_handle: str) -> None:
+        """
+        Counts a request that required a load.
+        """
+        self.total.misses += 1
+        self._for_handle(asset_handle).misses += 1
+
+    def record_default(self, asset_handle: str) -> None:
+        """
+        Counts a request answered with a default asset.
+        """
+        self.total.defaults += 1
+        self._for_handle(asset_handle).defaults += 1
+
+    def record_load(self, asset_handle: str, seconds: float, success: bool) -> None:
+        """
+        Counts a load, and its duration.
+        """
+        with self._lock:
+            for stats in (self.total, self._for_handle(asset_handle)):
+                stats.loads += 1
+                stats.load_time += seconds
+                stats.latencies.append(seconds)
+                if not success:
+                    stats.failures += 1
+
+    def reset(self) -> None:
+        """
+        Sets every counter back to zero.
+        """
+        with self._lock:
+            self.total = HandleStats(self.sample_size)
+            self.handles = {}
+
+    def slowest(self, count: int = 10) -> list[tuple[str, float]]:
+        """
+        :param count: Number of handles to list, defaults to 10
+        :return: The handles with the most total load time, and that time in seconds.
+        """
+        ranked = sorted(
+            self.handles.items(), key=lambda item: item[1].load_time, reverse=True
+        )
+        return [(handle, stats.load_time) for handle, stats in ranked[:count]]
+
+    def snapshot(self, per_handle: bool = True) -> dict[str, Any]:
+        """
+        :param per_handle: Whether to include the counters of each handle, defaults to
+        True
+        :return: All of the counters as a JSON-compatible dictionary.
+        """
+        # The load times are copied while no loads are being recorded, and sorted
+        # after.
+        with self._lock:
+            total = self.total
+            total_latencies = list(total.latencies)
+            handles = list(self.handles.items()) if per_handle else []
+            handle_latencies = [list(stats.latencies) for _, stats in handles]
+        snapshot: dict[str, Any] = {"total": total.snapshot(total_latencies)}
+        if per_handle:
+            snapshot["handles"] = {
+                handle: stats.snapshot(latencies)
+                for (handle, stats), latencies in zip(handles, handle_latencies)
+            }
+        return snapshot
+
+    def export(self, path: os.PathLike | str, per_handle: bool = True) -> None:
+        """
+        Writes a snapshot of the counters to a JSON file.
+
+        :param path: Location of the file to write.
+        :param per_handle: Whether to include the counters of each handle, defaults to
+        True
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(per_handle), file, indent=2)
+
+    def _for_handle(self, asset_handle: str) -> HandleStats:
+        stats = self.handles.get(asset_handle)
+        if stats is None:
+            stats = self.handles.setdefault(
+                asset_handle, HandleStats(self.handle_sample_size)
+            )
+        return stats
+
+
+def percentile(samples: deque[float] | list[float], percent: float) -> float | None:
+    """
+    Finds the given percentile of the samples, using the nearest-rank method.
+
+    :param samples: The values to examine.
+    :param percent: The percentile to find, from 0 to 100.
+    :return: The percentile, or None if there are no samples.
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+import heapq
+from itertools import islice
+from operator import itemgetter
+from typing import Any
+
+
+class SuggestionIndex:
+    """
+    A trigram index of handles, for quickly finding handles similar to a misspelled
+    one.
+
+    Candidates are gathered from the handles sharing the rarest trigrams with the
+    query, up to a fixed amount of work, and only the best of them are compared in
+    full. The cost of a suggestion therefore stays roughly constant as the number of
+    handles grows, at the price of occasionally missing a match that a full scan
+    would find.
+    """
+
+    def __init__(
+        self,
+        handles: Iterable[str] = (),
+        scan_budget: int = 2_000,
+        candidates: int = 16,
+    ) -> None:
+        """
+        :param handles: Handles to index, defaults to none.
+        :param scan_budget: Rough number of index entries examined per suggestion,
+        defaults to 2,000
+        :param candidates: Number of candidates compared in full, defaults to 16
+        """
+        self.scan_budget = scan_budget
+        self.candidates = candidates
+        self._postings: dict[str, set[str]] = {}
+        self._handles: set[str] = set()
+        for handle in handles:
+            self.add(handle)
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self._handles
+
+    def add(self, handle: str) -> None:
+        """
+        Adds a handle to the index. Adding a handle twice has no effect.
+        """
+        if handle in self._handles:
+            return
+        self._handles.add(handle)
+        postings = self._postings
+        for gram in _trigrams(handle):
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = {handle}
+            else:
+                posting.add(handle)
+
+    def remove(self, handle: str) -> None:
+        """
+        Removes a handle from the index. Safe to call with handles not in the index.
+        """
+        if handle not in self._handles:
+            return
+        self._handles.discard(handle)
+        for gram in _trigrams(handle):
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(handle)
+            if not posting:
+                del self._postings[gram]
+
+    def clear(self) -> None:
+        """
+        Removes every handle from the index.
+        """
+        self._postings.clear()
+        self._handles.clear()
+
+    def suggest(self, query: str, n: int = 3, cutoff: float = 0.6) -> list[str]:
+        """
+        Finds the handles most similar to the query.
+
+        :param query: The misspelled handle.
+        :param n: Maximum number of suggestions, defaults to 3
+        :param cutoff: Minimum similarity, from 0.0 to 1.0, using the same measure as
+        difflib.get_close_matches, defaults to 0.6
+        :return: Up to n handles, most similar first.
+        """
+        if n <= 0 or not self._handles:
+            return []
+        # Only needed once something is misspelled.
+        import difflib
+
+        postings = [
+            posting
+            for gram in _trigrams(query)
+            if (posting := self._postings.get(gram)) is not None
+        ]
+        postings.sort(key=len)
+        counts: Counter[str] = Counter()
+        remaining = self.scan_budget
+        for posting in postings:
+            if len(posting) > remaining:
+                # Only part of a common trigram fits in the budget. Its handles are
+                # poor evidence anyway, so a sample of them is enough.
+                counts.update(islice(posting, remaining))
+                break
+            remaining -= len(posting)
+            counts.update(posting)
+        shortlist = heapq.nlargest(self.candidates, counts.items(), key=itemgetter(1))
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(query)
+        scored: list[tuple[float, str]] = []
+        threshold = cutoff
+        for handle, _ in shortlist:
+            matcher.set_seq1(handle)
+            if (
+                matcher.real_quick_ratio() >= threshold
+                and matcher.quick_ratio() >= threshold
+                and (ratio := matcher.ratio()) >= threshold
+            ):
+                scored.append((ratio, handle))
+                if len(scored) >= n:
+                    # Candidates that can't beat the current n best need no full
+                    # comparison.
+                    scored.sort(reverse=True)
+                    del scored[n:]
+                    threshold = max(cutoff, scored[-1][0])
+        # Same ordering as difflib.get_close_matches, ties included.
+        scored.sort(reverse=True)
+        return [handle for _, handle in scored[:n]]
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class IndexedLocations(dict):
+    """
+    A dictionary of asset handles and location data that keeps a SuggestionIndex of
+    its keys up to date.
+
+    The index is only built the first time it is needed, so managers that never
+    need suggestions pay nothing for it.
+    """
+
+    def __init__(self, *args, **kwds) -> None:
+        super().__init__(*args, **kwds)
+        self._index: SuggestionIndex | None = None
+
+    @property
+    def index(self) -> SuggestionIndex:
+        """
+        The suggestion index of the dictionary's keys.
+        """
+        if self._index is None:
+            self._index = SuggestionIndex(self.keys())
+        return self._index
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        if self._index is not None:
+            self._index.add(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        if self._index is not None:
+            self._index.remove(key)
+
+    def __ior__(self, other) -> IndexedLocations:
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwds) -> None:
+        if self._index is None:
+            super().update(*args, **kwds)
+            return
+        for key, value in dict(*args, **kwds).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default) -> Any:
+        had_key = key in self
+        value = super().pop(key, *default)
+        if had_key and self._index is not None:
+            self._index.remove(key)
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        key, value = super().popitem()
+        if self._index is not None:
+            self._index.remove(key)
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        if self._index is not None:
+            self._index.clear()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import pickle
+import threading
+from typing import Any
+import zlib
+
+from .codec import AssetCodec, PickleCodec
+
+
+class WarmCache:
+    """
+    A second cache tier, holding assets evicted from a manager's cache in encoded and
+    compressed form. An asset found here is rebuilt by decompressing and decoding it,
+    which is usually far cheaper than loading it again, while taking much less memory
+    than keeping it cached as it is.
+
+    The assets are encoded with a codec, such as SurfaceCodec or SoundCodec to store
+    only their raw pixels or samples, and compressed with zlib. Assets are stored as
+    they were cached, after the manager's transforms, so the codec must rebuild them
+    exactly as they were.
+    """
+
+    def __init__(
+        self,
+        codec: AssetCodec | None = None,
+        max_size: int | None = None,
+        max_items: int | None = None,
+        level: int = 1,
+    ) -> None:
+        """
+        Create an empty warm cache.
+
+        :param codec: Codec used to encode the assets, defaults to a PickleCodec.
+        :param max_size: Maximum total size of the compressed assets, in bytes,
+        defaults to None (unlimited).
+        :param max_items: Maximum number of assets to hold, defaults to None
+        (unlimited).
+        :param level: zlib compression level, from 0 (none) to 9 (smallest), defaults
+        to 1, the fastest.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be at least 1.")
+        if max_size is not None and max_size < 0:
+            raise ValueError("max_size cannot be negative.")
+        self.codec: AssetCodec = codec if codec is not None else PickleCodec()
+        self.max_size = max_size
+        """
+        Maximum total size of the compressed assets, or None for no limit.
+        """
+        self.max_items = max_items
+        """
+        Maximum number of assets held, or None for no limit.
+        """
+        self.level = level
+        self.current_size: int = 0
+        """
+        Total size of the compressed assets, in bytes.
+        """
+        self.raw_size: int = 0
+        """
+        Total size of the held assets' encoded data before compression, in bytes.
+        """
+        self.demotions: int = 0
+        """
+        Number of assets taken in from the manager's cache.
+        """
+        self.promotions: int = 0
+        """
+        Number of assets rebuilt and handed back to the manager's cache.
+        """
+        self.evictions: int = 0
+        """
+        Number of assets dropped entirely to stay within budget.
+        """
+        self._entries: OrderedDict[str, tuple[dict[str, Any], bytes, int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, asset_handle: str) -> bool:
+        return asset_handle in self._entries
+
+    def store(self, asset_handle: str, asset: Any) -> bool:
+        """
+        Compresses an asset leaving the manager's cache, and holds on to it. The least
+        recently stored assets are dropped if this goes over budget.
+
+        :param asset_handle: The name of the asset.
+        :param asset: The asset.
+        :return: True if the asset was stored, False if the codec can't encode it, or
+        it doesn't fit in the budget at all.
+        """
+        try:
+            metadata, data = self.codec.encode(asset)
+        except (TypeError, AttributeError, pickle.PicklingError):
+            # Dropping the asset is better than failing the request that evicted it.
+            return False
+        raw_size = memoryview(data).nbytes
+        compressed = zlib.compress(data, self.level)
+        del data
+        with self._lock:
+            self._discard(asset_handle)
+            if self.max_size is not None and len(compressed) > self.max_size:
+                return False
+            self._entries[asset_handle] = (metadata, compressed, raw_size)
+            self.current_size += len(compressed)
+            self.raw_size += raw_size
+            self.demotions += 1
+            while self._over_budget():
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+        return True
+
+    def take(self, asset_handle: str) -> Any | None:
+        """
+        Removes an asset from the warm cache, and rebuilds it.
+
+        :param asset_handle: The name of the asset.
+        :return: The rebuilt asset, or None if it isn't held, or can't be rebuilt.
+        """
+        with self._lock:
+            entry = self._entries.get(asset_handle)
+            if entry is None:
+                return None
+            self._discard(asset_handle)
+        metadata, compressed, _ = entry
+        asset = self.codec.decode(metadata, memoryview(zlib.decompress(compressed)))
+        if asset is not None:
+            with self._lock:
+                self.promotions += 1
+        return asset
+
+    def discard(self, asset_handle: str) -> None:
+        """
+        Drops an asset without rebuilding it. Safe to call with handles that aren't
+        held.
+
+        :param asset_handle: The name of the asset.
+        """
+        with self._lock:
+            self._discard(asset_handle)
+
+    def clear(self) -> None:
+        """
+        Drops every asset.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_size = 0
+            self.raw_size = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        :return: A JSON-compatible dictionary of the warm cache's state and counters.
+        """
+        with self._lock:
+            return {
+                "items": len(self._entries),
+                "size": self.current_size,
+                "raw_size": self.raw_size,
+                "demotions": self.demotions,
+                "promotions": self.promotions,
+                "evictions": self.evictions,
+            }
+
+    def _discard(self, asset_handle: str) -> None:
+        entry = self._entries.pop(asset_handle, None)
+        if entry is not None:
+            self.current_size -= len(entry[1])
+            self.raw_size -= entry[2]
+
+    def _over_budget(self) -> bool:
+        if self.max_items is not None and len(self._entries) > self.max_items:
+            return True
+        return self.max_size is not None and self.current_size > self.max_size
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import ctypes
+import ctypes.util
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .resource_manager import ResourceManager
+
+
+class FileWatcher:
+    """
+    Watches the files behind a resource manager's assets, and reloads cached assets
+    when their files change.
+
+    Only assets whose location data is a path are watched. Assets that are not
+    currently cached are not reloaded, as they will be loaded fresh when next
+    requested anyway.
+
+    On Linux, changes are detected with inotify. Elsewhere, or if inotify is
+    unavailable, files are polled, one directory listing at a time.
+    """
+
+    def __init__(
+        self,
+        manager: ResourceManager,
+        callback: Callable[[str, Any], None] | None = None,
+        debounce: float = 0.2,
+        interval: float = 0.5,
+        hot_swap: bool = False,
+        use_inotify: bool | None = None,
+    ) -> None:
+        """
+        Create a watcher for the given manager. The watcher does nothing until started.
+
+        :param manager: The resource manager whose assets are watched.
+        :param callback: Function called with the handle and new asset after each
+        reload, defaults to None. Called from the watcher's thread.
+        :param debounce: Seconds a file must go without changing before it is
+        reloaded, so that a file being written is only reloaded once, defaults to 0.2
+        :param interval: Seconds between checks for newly imported assets, and between
+        polls when polling, defaults to 0.5
+        :param hot_swap: Whether to apply reloads with force_update instead of update,
+        defaults to False. See ResourceManager.reload.
+        :param use_inotify: Whether to use inotify. Defaults to None, which uses it
+        when available.
+        """
+        self.manager = manager
+        """
+        The resource manager whose assets are watched.
+        """
+        self.callback = callback
+        """
+        Function called with the handle and new asset after each reload.
+        """
+        self.debounce = debounce
+        self.interval = interval
+        self.hot_swap = hot_swap
+        if use_inotify is None:
+            use_inotify = _inotify_available()
+        self.use_inotify = use_inotify
+        """
+        Whether changes are detected with inotify rather than polling.
+        """
+        self._backend: _PollingBackend | _InotifyBackend | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._changed: dict[str, float] = {}
+
+    def __enter__(self) -> FileWatcher:
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the watcher's thread is running.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Starts watching in a background thread.
+        """
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._changed.clear()
+        self._backend = _InotifyBackend() if self.use_inotify else _PollingBackend()
+        self._backend.sync(self._watched_paths())
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"resourceful-watcher-{self.manager.handle}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stops watching, and waits for the watcher's thread to finish.
+
+        :param timeout: Maximum number of seconds to wait, defaults to None (forever).
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+
+    def _run(self) -> None:
+        backend = self._backend
+        if backend is None:
+            return
+        next_sync = time.monotonic() + self.interval
+        while not self._stop_event.is_set():
+            timeout = self.interval
+            if self._changed:
+                timeout = min(timeout, self.debounce)
+            for path in backend.wait(timeout, self._stop_event):
+                self._changed[path] = time.monotonic()
+            now = time.monotonic()
+            settled = [
+                path
+                for path, changed_at in self._changed.items()
+                if now - changed_at >= self.debounce
+            ]
+            if settled:
+                self._reload(settled)
+            if now >= next_sync:
+                backend.sync(self._watched_paths())
+                next_sync = now + self.interval
+
+    def _reload(self, paths: list[str]) -> None:
+        watched = self._watched_paths()
+        for path in paths:
+            del self._changed[path]
+            for asset_handle in watched.get(path, ()):
+                if self.manager.cache.get(asset_handle, None) is None:
+                    # Loaded fresh when next requested, once any compressed copy of
+                    # the old version is dropped.
+                    self.manager.uncache(asset_handle)
+                    continue
+                try:
+                    asset = self.manager.reload(asset_handle, self.hot_swap)
+                except Exception:
+                    # The file may be mid-save or deleted; keep the old asset, and
+                    # try again on the next change.
+                    continue
+                if asset is not None and self.callback is not None:
+                    self.callback(asset_handle, asset)
+
+    def _watched_paths(self) -> dict[str, list[str]]:
+        """
+        Maps the absolute path of each watched file to the handles using it.
+        """
+        watched: dict[str, list[str]] = {}
+        for asset_handle, location in list(self.manager.resource_locations.items()):
+            if isinstance(location, (str, Path)):
+                path = os.path.abspath(location)
+                watched.setdefault(path, []).append(asset_handle)
+        return watched
+
+
+class _PollingBackend:
+    """
+    Detects changes by comparing modification times and sizes, listing each directory
+    once per poll rather than checking every file separately.
+    """
+
+    def __init__(self) -> None:
+        self._directories: dict[str, set[str]] = {}
+        self._states: dict[str, tuple[int, int] | None] = {}
+
+    def sync(self, watched: dict[str, list[str]]) -> None:
+        directories: dict[str, set[str]] = {}
+        for path in watched:
+            directory, name = os.path.split(path)
+            directories.setdefault(directory, set()).add(name)
+        self._directories = directories
+        for path in list(self._states):
+            if path not in watched:
+                del self._states[path]
+        # Newly watched files start from their current state.
+        for path in watched:
+            if path not in self._states:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    self._states[path] = None
+                else:
+                    self._states[path] = (stat.st_mtime_ns, stat.st_size)
+
+    def wait(self, timeout: float, stop_event: threading.Event) -> list[str]:
+        if stop_event.wait(timeout):
+            return []
+        changed: list[str] = []
+        for path, state in self._poll().items():
+            if self._states.get(path, state) != state:
+                changed.append(path)
+            self._states[path] = state
+        return changed
+
+    def close(self) -> None:
+        pass
+
+    def _poll(self) -> dict[str, tuple[int, int] | None]:
+        states: dict[str, tuple[int, int] | None] = {}
+        for directory, names in self._directories.items():
+            for name in names:
+                states[os.path.join(directory, name)] = None
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name not in names:
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        states[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return states
+
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_EVENT = struct.Struct("iIII")
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+)
+
+_libc: Any = None
+
+
+def _inotify_available() -> bool:
+    global _libc
+    if not sys.platform.startswith("linux"):
+        return False
+    if _libc is None:
+        library = ctypes.util.find_library("c")
+        try:
+            _libc = ctypes.CDLL(library or "libc.so.6", use_errno=True)
+        except OSError:
+            _libc = False
+    return bool(_libc) and hasattr(_libc, "inotify_init1")
+
+
+class _InotifyBackend:
+    """
+    Detects changes with Linux's inotify, watching the directory of each file.
+    """
+
+    def __init__(self) -> None:
+        if not _inotify_available():
+            raise OSError("inotify is not available on this system.")
+        self._fd = _libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed.")
+        self._watches: dict[int, str] = {}
+        self._directories: dict[str, int] = {}
+        self._files: set[str] = set()
+
+    def sync(self, watched: dict[str, list[str]]) -> None:
+        self._files = set(watched)
+        for path in self._files:
+            directory = os.path.dirname(path)
+            if directory in self._directories:
+                continue
+            descriptor = _libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), _WATCH_MASK
+            )
+            if descriptor < 0:
+                # Missing directory, most likely. Retried on the next sync.
+                continue
+            self._watches[descriptor] = directory
+            self._directories[directory] = descriptor
+
+    def wait(self, timeout: float, stop_event: threading.Event) -> list[str]:
+        if self._fd < 0:
+            stop_event.wait(timeout)
+            return []
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changed: list[str] = []
+        offset = 0
+        while offset + _IN_EVENT.size <= len(data):
+            descriptor, _, _, length = _IN_EVENT.unpack_from(data, offset)
+            offset += _IN_EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            directory = self._watches.get(descriptor)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            if path in self._files:
+                changed.append(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
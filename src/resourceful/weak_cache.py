@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+import threading
+import time
+from typing import Any
+import weakref
+
+
+class WeakCache(MutableMapping):
+    """
+    A cache that only holds its assets weakly, so an asset drops out of it once
+    nothing else is using it.
+
+    Each asset is also held strongly for a grace period after it is stored or last
+    requested, so an asset that is briefly unused isn't released and then reloaded
+    straight away. Grace periods are checked whenever the cache is used, or when
+    sweep() is called.
+
+    Assets that can't be weakly referenced, such as ints and strings, are held
+    strongly, as in a regular cache.
+    """
+
+    def __init__(
+        self,
+        grace_period: float = 0.0,
+        on_release: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        :param grace_period: Seconds an asset is kept after it was last requested,
+        even if nothing else is using it, defaults to 0.0
+        :param on_release: Function called with the handle of each asset released
+        because nothing was using it, defaults to None. May be called from any thread.
+        """
+        self.grace_period = grace_period
+        self.on_release = on_release
+        self._refs: dict[str, Callable[[], Any]] = {}
+        self._recent: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: str) -> Any:
+        asset = self._refs[key]()
+        if asset is None:
+            raise KeyError(key)
+        self._touch(key, asset)
+        return asset
+
+    def get(self, key: str, default: Any = None) -> Any:
+        ref = self._refs.get(key)
+        if ref is None:
+            return default
+        asset = ref()
+        if asset is None:
+            return default
+        self._touch(key, asset)
+        return asset
+
+    def __setitem__(self, key: str, asset: Any) -> None:
+        with self._lock:
+            self._refs[key] = self._make_ref(key, asset)
+        self._touch(key, asset)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._refs[key]
+            self._recent.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        ref = self._refs.get(key)  # type: ignore[call-overload]
+        return ref is not None and ref() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([key for key, ref in list(self._refs.items()) if ref() is not None])
+
+    def __len__(self) -> int:
+        return sum(1 for ref in list(self._refs.values()) if ref() is not None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._refs.clear()
+            self._recent.clear()
+
+    def sweep(self) -> None:
+        """
+        Stops holding any assets whose grace period has passed, releasing those that
+        nothing else is using.
+        """
+        with self._lock:
+            expired = self._expire(time.monotonic())
+        # Only dropped once the lock is released, as dropping the last reference to
+        # an asset calls on_release, which may wait on locks of its own.
+        del expired
+
+    def _touch(self, key: str, asset: Any) -> None:
+        """
+        Restarts the asset's grace period.
+        """
+        if self.grace_period <= 0:
+            if self._recent:
+                # Left over from before the grace period was turned off.
+                self.sweep()
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._recent[key] = (asset, now)
+            self._recent.move_to_end(key)
+            expired = self._expire(now)
+        # Dropped outside the lock, as in sweep().
+        del expired
+
+    def _expire(self, now: float) -> list[Any]:
+        """
+        Stops holding the assets whose grace period has passed.
+
+        :return: The assets no longer held. They must be dropped by the caller once
+        the lock is released.
+        """
+        recent = self._recent
+        expired: list[Any] = []
+        # Ordered by last access, so only the oldest entries need checking.
+        while recent:
+            key, (asset, accessed) = next(iter(recent.items()))
+            if now - accessed < self.grace_period:
+                break
+            del recent[key]
+            expired.append(asset)
+        return expired
+
+    def _make_ref(self, key: str, asset: Any) -> Callable[[], Any]:
+        def release(ref: weakref.ref) -> None:
+            with self._lock:
+                if self._refs.get(key) is not ref:
+                    # Replaced by a newer asset since.
+                    return
+                del self._refs[key]
+            if self.on_release is not None:
+                self.on_release(key)
+
+        try:
+            return weakref.ref(asset, release)
+        except TypeError:
+            return _StrongRef(asset)
+
+
+class _StrongRef:
+    """
+    Stands in for a weak reference to an asset that can't be weakly referenced.
+    """
+
+    __slots__ = ("asset",)
+
+    def __init__(self, asset: Any) -> None:
+        self.asset = asset
+
+    def __call__(self) -> Any:
+        return self.asset
@@ -0,0 +1,129 @@
+from array import array
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import access_trace as at  # noqa: E402
+from src.resourceful import resource_manager as rm  # noqa: E402
+
+
+def int_loader(resource_location: int) -> int | None:
+    """
+    Simply returns the location data as the resource
+    Returns None if the data is negative
+    """
+    if resource_location < 0:
+        return None
+    return resource_location
+
+
+class TestAccessTrace(unittest.TestCase):
+
+    def setUp(self):
+        self.test_manager = rm.ResourceManager[int]("Test")
+        self.test_manager.config(loader_helper=int_loader, record_trace=True)
+        for i in range(3):
+            self.test_manager.import_asset(f"test_num{i}", i)
+
+    def test_record(self):
+        self.test_manager.get("test_num0")
+        self.test_manager.get("test_num0")
+        self.test_manager.get_many(["test_num1", "test_num2"])
+
+        events = list(self.test_manager.trace)
+        self.assertEqual(
+            [(handle, hit) for _, handle, hit, _ in events],
+            [
+                ("test_num0", False),
+                ("test_num0", True),
+                ("test_num1", False),
+                ("test_num2", False),
+            ],
+        )
+        times = [timestamp for timestamp, *_ in events]
+        self.assertEqual(times, sorted(times))
+        self.assertIsNotNone(events[0][3])
+        self.assertIsNone(events[1][3])
+        self.assertIn("test_num2", self.test_manager.trace.load_times)
+
+    def test_max_events(self):
+        trace = at.AccessTrace(max_events=2)
+        for _ in range(3):
+            trace.record_hit("test_num0")
+        self.assertEqual(len(trace), 2)
+        self.assertEqual(trace.dropped, 1)
+
+    def test_save_read(self):
+        self.test_manager.get("test_num0")
+        self.test_manager.get("test_num1")
+        self.test_manager.get("test_num0")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "trace.json"
+            self.test_manager.trace.save(path)
+            trace = at.AccessTrace.read(path)
+
+        original = list(self.test_manager.trace)
+        self.assertEqual(len(trace), 3)
+        for (time_a, handle_a, hit_a, load_a), (time_b, handle_b, hit_b, load_b) in zip(
+            original, trace
+        ):
+            self.assertAlmostEqual(time_a, time_b, places=5)
+            self.assertEqual((handle_a, hit_a), (handle_b, hit_b))
+            self.assertEqual(load_a is None, load_b is None)
+
+    def test_config_off(self):
+        self.test_manager.config(record_trace=False)
+        self.assertIsNone(self.test_manager.trace)
+        self.test_manager.get("test_num0")
+
+
+class TestPrefetchPlanner(unittest.TestCase):
+
+    def setUp(self):
+        self.test_manager = rm.ResourceManager[int]("Test")
+        self.test_manager.config(loader_helper=int_loader)
+        for i in range(4):
+            self.test_manager.import_asset(f"test_num{i}", i)
+        self.trace = at.AccessTrace()
+        self.trace.load_times = {"test_num1": 0.5, "test_num2": 0.1}
+
+    def test_plan(self):
+        self.trace._append("test_num0", False)
+        self.trace._append("test_num1", False)
+        self.trace._append("test_num0", True)
+        self.trace._append("test_num2", False)
+        self.trace._append("unknown", False)
+        # One second apart
+        self.trace._times = array("d", range(5))
+
+        planner = at.PrefetchPlanner(self.test_manager, self.trace, lead=0.25)
+        self.assertEqual(
+            [asset_handle for _, asset_handle in planner.plan],
+            ["test_num0", "test_num1", "test_num2", "unknown"],
+        )
+        for (timestamp, _), expected in zip(planner.plan, [0.0, 0.25, 2.65, 3.75]):
+            self.assertAlmostEqual(timestamp, expected)
+
+        progress = planner.start()
+        progress.wait()
+        self.assertEqual(set(self.test_manager.cache), {"test_num0"})
+        self.assertIsNone(planner.update(0.1))
+
+        planner.update(3).wait()
+        self.assertEqual(
+            set(self.test_manager.cache), {"test_num0", "test_num1", "test_num2"}
+        )
+        # Handles unknown to the manager are skipped.
+        self.assertEqual(planner.update(10).total, 0)
+        self.assertTrue(planner.done())
+
+    def test_update_before_start(self):
+        planner = at.PrefetchPlanner(self.test_manager, self.trace)
+        with self.assertRaises(RuntimeError):
+            planner.update()
+
+
+if __name__ == "__main__":
+    unittest.main()
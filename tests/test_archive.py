@@ -0,0 +1,79 @@
+import io
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import archive as ar  # noqa: E402
+from src.resourceful import resource_manager as rm  # noqa: E402
+
+
+def bytes_loader(resource_location: ar.ArchiveEntry) -> bytes:
+    return resource_location.read().tobytes()
+
+
+class TestAssetArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.temp_dir.name)
+        directory = self.root / "assets"
+        (directory / "subfolder").mkdir(parents=True)
+        for i in range(3):
+            (directory / f"item{i}.file").write_bytes(f"item{i}".encode() * (i + 1))
+        (directory / "subfolder" / "subitem.file.gz").write_bytes(b"sub" * 100)
+        self.directory = directory
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_pack_directory(self):
+        archive = ar.pack_directory(self.directory, self.root / "assets.pack")
+
+        self.assertEqual(
+            set(archive), {"item0", "item1", "item2", "subfolder/subitem"}
+        )
+        self.assertEqual(archive.read("item2").tobytes(), b"item2" * 3)
+        self.assertEqual(archive["subfolder/subitem"].name, "subitem.file.gz")
+
+        reader = archive.open("item1")
+        self.assertEqual(reader.read(5), b"item1")
+        reader.seek(-2, io.SEEK_END)
+        self.assertEqual(reader.read(), b"m1")
+
+        # Reopening from disk gives the same index
+        reopened = ar.AssetArchive(self.root / "assets.pack")
+        self.assertEqual(reopened.read("item0").tobytes(), b"item0")
+
+    def test_compress(self):
+        archive = ar.pack_directory(
+            self.directory,
+            self.root / "assets.pack",
+            compress=lambda path: path.suffix == ".gz",
+        )
+
+        self.assertEqual(archive["subfolder/subitem"].codec, "zlib")
+        self.assertEqual(archive["item0"].codec, "raw")
+        self.assertEqual(archive.read("subfolder/subitem").tobytes(), b"sub" * 100)
+
+    def test_invalid_archive(self):
+        bad_file = self.root / "bad.pack"
+        bad_file.write_bytes(b"not an archive at all, really")
+
+        with self.assertRaises(ValueError):
+            ar.AssetArchive(bad_file)
+
+    def test_import_archive(self):
+        ar.pack_directory(self.directory, self.root / "assets.pack")
+        test_manager = rm.ResourceManager[bytes]("Test")
+        test_manager.config(loader_helper=bytes_loader)
+
+        imported = test_manager.import_archive(self.root / "assets.pack", "pack/")
+
+        self.assertEqual(len(imported), 4)
+        self.assertEqual(test_manager.get("pack/item1"), b"item1item1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import os
+import pathlib
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+
+try:
+    import pygame
+    from src.resourceful.pygame import pygame_atlas
+    from src.resourceful.pygame import pygame_prebuilt
+except ImportError:
+    pygame = None
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestSkylinePacker(unittest.TestCase):
+
+    def test_no_overlap(self):
+        packer = pygame_atlas.SkylinePacker(256, 256)
+        generator = random.Random(4)
+        placed: list[pygame.Rect] = []
+        while True:
+            size = (generator.randint(4, 40), generator.randint(4, 40))
+            position = packer.insert(*size)
+            if position is None:
+                break
+            rect = pygame.Rect(position, size)
+            self.assertTrue(pygame.Rect(0, 0, 256, 256).contains(rect))
+            self.assertEqual(rect.collidelist(placed), -1)
+            placed.append(rect)
+        # Reasonably dense before running out of room
+        self.assertGreater(sum(rect.w * rect.h for rect in placed), 256 * 256 * 0.7)
+
+    def test_resume(self):
+        packer = pygame_atlas.SkylinePacker(64, 64)
+        first = pygame.Rect(packer.insert(30, 20), (30, 20))
+        resumed = pygame_atlas.SkylinePacker(64, 64, packer.skyline)
+        second = pygame.Rect(resumed.insert(30, 20), (30, 20))
+        self.assertFalse(first.colliderect(second))
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestTextureAtlas(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.temp_dir.name)
+        self.loads: list[str] = []
+        for i in range(20):
+            image = pygame.Surface((10 + i, 12), pygame.SRCALPHA)
+            image.fill((i * 10, 100, 200, 150))
+            pygame.image.save(image, self.root / f"sprite_{i}.png")
+        big = pygame.Surface((100, 100))
+        pygame.image.save(big, self.root / "big.png")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def loader(self, resource_location: os.PathLike | str) -> pygame.Surface:
+        self.loads.append(str(resource_location))
+        return pygame.image.load(resource_location)
+
+    def test_add(self):
+        atlas = pygame_atlas.TextureAtlas(page_size=(64, 64), max_image_size=(32, 32))
+        atlas_loader = atlas.wrap_loader(self.loader)
+        images = [atlas_loader(self.root / f"sprite_{i}.png") for i in range(20)]
+
+        self.assertEqual(len(atlas), 20)
+        self.assertGreater(len(atlas.pages), 1)
+        for i, image in enumerate(images):
+            self.assertEqual(image.get_size(), (10 + i, 12))
+            self.assertIn(image.get_parent(), atlas.pages)
+            self.assertEqual(image.get_at((0, 0)), pygame.Color(i * 10, 100, 200, 150))
+
+        # Found in the atlas without loading again
+        atlas_loader(self.root / "sprite_3.png")
+        self.assertEqual(len(self.loads), 20)
+
+        # Too large for the atlas
+        big = atlas_loader(self.root / "big.png")
+        self.assertIsNone(big.get_parent())
+        self.assertNotIn(self.root / "big.png", atlas)
+
+    def test_save_load(self):
+        atlas = pygame_atlas.TextureAtlas(page_size=(64, 64), max_image_size=(32, 32))
+        atlas_loader = atlas.wrap_loader(self.loader)
+        for i in range(20):
+            atlas_loader(self.root / f"sprite_{i}.png")
+        atlas.save(self.root / "atlas.json")
+
+        loaded = pygame_atlas.TextureAtlas.load(self.root / "atlas.json")
+        self.assertEqual(len(loaded.pages), len(atlas.pages))
+        self.loads.clear()
+        loaded_loader = loaded.wrap_loader(self.loader)
+        image = loaded_loader(self.root / "sprite_7.png")
+        self.assertEqual(self.loads, [])
+        self.assertEqual(image.get_size(), (17, 12))
+        self.assertEqual(image.get_at((16, 11)), pygame.Color(70, 100, 200, 150))
+
+        # Changed files are loaded again
+        changed = pygame.Surface((5, 5))
+        changed.fill((1, 2, 3))
+        pygame.image.save(changed, self.root / "sprite_7.png")
+        os.utime(self.root / "sprite_7.png", ns=(0, 0))
+        image = loaded_loader(self.root / "sprite_7.png")
+        self.assertEqual(len(self.loads), 1)
+        self.assertEqual(image.get_size(), (5, 5))
+
+    def test_image_manager(self):
+        # The pre-built loader converts images, which needs a display.
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        atlas = pygame_atlas.TextureAtlas(page_size=(64, 64), max_image_size=(32, 32))
+        manager = pygame_prebuilt.getImageManager()
+        pygame_prebuilt.setImageAtlas(atlas)
+        self.addCleanup(pygame_prebuilt.setImageAtlas, None)
+        manager.import_asset("atlas_test_sprite", self.root / "sprite_0.png")
+        self.addCleanup(manager.clear, "atlas_test_sprite")
+
+        image = manager.get("atlas_test_sprite")
+        self.assertIn(image.get_parent(), atlas.pages)
+
+
+if __name__ == "__main__":
+    unittest.main()
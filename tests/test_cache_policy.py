@@ -0,0 +1,120 @@
+import pathlib
+import sys
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import cache_policy as cp  # noqa: E402
+from src.resourceful import resource_manager as rm  # noqa: E402
+
+
+def int_loader(resource_location: int) -> int | None:
+    """
+    Simply returns the location data as the resource
+    Returns None if the data is negative
+    """
+    if resource_location < 0:
+        return None
+    return resource_location
+
+
+class TestLRUPolicy(unittest.TestCase):
+
+    def test_evicts_least_recent(self):
+        policy = cp.LRUPolicy(max_items=2)
+        policy.insert("a", 1)
+        policy.insert("b", 2)
+        policy.access("a")
+        policy.insert("c", 3)
+
+        self.assertTrue(policy.over_budget())
+        self.assertEqual(policy.pop_victim(), "b")
+        self.assertFalse(policy.over_budget())
+
+    def test_protected(self):
+        policy = cp.LRUPolicy(max_items=1)
+        policy.insert("a", 1)
+
+        self.assertIsNone(policy.pop_victim("a"))
+
+    def test_size_budget(self):
+        policy = cp.LRUPolicy(max_size=10, sizer=lambda asset: asset)
+        policy.insert("a", 4)
+        policy.insert("b", 4)
+        self.assertFalse(policy.over_budget())
+
+        policy.insert("c", 4)
+        self.assertEqual(policy.current_size, 12)
+        self.assertTrue(policy.over_budget())
+
+        policy.pop_victim("c")
+        self.assertEqual(policy.current_size, 8)
+
+        # Replacing an asset updates its size
+        policy.insert("b", 1)
+        self.assertEqual(policy.current_size, 5)
+
+
+class TestLFUPolicy(unittest.TestCase):
+
+    def test_evicts_least_frequent(self):
+        policy = cp.LFUPolicy(max_items=2)
+        policy.insert("a", 1)
+        policy.insert("b", 2)
+        policy.access("a")
+        policy.access("a")
+        policy.access("b")
+        policy.insert("c", 3)
+
+        self.assertEqual(policy.pop_victim("c"), "b")
+
+    def test_ties_break_by_recency(self):
+        policy = cp.LFUPolicy(max_items=2)
+        policy.insert("a", 1)
+        policy.insert("b", 2)
+
+        self.assertEqual(policy.pop_victim(), "a")
+        policy.remove("b")
+        self.assertEqual(len(policy), 0)
+
+
+class TestManagerEviction(unittest.TestCase):
+
+    def setUp(self):
+        self.test_manager = rm.ResourceManager[int]("Test")
+        self.test_manager.config(
+            loader_helper=int_loader, cache_policy=cp.LRUPolicy(max_items=2)
+        )
+        for i in range(3):
+            self.test_manager.import_asset(f"test_num{i}", i)
+
+    def test_get_evicts(self):
+        self.test_manager.get("test_num0")
+        self.test_manager.get("test_num1")
+        self.test_manager.get("test_num0")
+        self.test_manager.get("test_num2")
+
+        self.assertEqual(len(self.test_manager.cache), 2)
+        self.assertNotIn("test_num1", self.test_manager.cache)
+
+        # Evicted assets are reloaded on demand
+        self.assertEqual(self.test_manager.get("test_num1"), 1)
+        self.assertNotIn("test_num0", self.test_manager.cache)
+
+    def test_uncache_forgets(self):
+        self.test_manager.get("test_num0")
+        self.test_manager.uncache("test_num0")
+
+        self.assertEqual(len(self.test_manager.cache_policy), 0)
+
+    def test_config_adopts_existing(self):
+        test_manager = rm.ResourceManager[int]("Test")
+        test_manager.config(loader_helper=int_loader)
+        for i in range(3):
+            test_manager.force_load(f"test_num{i}", i)
+
+        test_manager.config(cache_policy=cp.LFUPolicy(max_items=1))
+        self.assertEqual(len(test_manager.cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import pathlib
+import sys
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import directory_scan as ds  # noqa: E402
+
+
+def expected_handle(file: pathlib.Path, folder: str) -> str:
+    """
+    The original, pathlib-based default handle.
+    """
+    file = file.relative_to(folder)
+    while file.suffix != "":
+        file = file.with_suffix("")
+    return str(file.as_posix())
+
+
+class TestDefaultHandle(unittest.TestCase):
+
+    def test_matches_pathlib(self):
+        folder = os.path.join("root", "directory")
+        names = [
+            "item.png",
+            "archive.tar.gz",
+            ".hidden",
+            ".hidden.png",
+            "no_suffix",
+            "trailing.",
+            os.path.join("sub", "item.png"),
+            os.path.join("sub.dir", "item"),
+        ]
+        for name in names:
+            path = os.path.join(folder, name)
+            with self.subTest(name=name):
+                self.assertEqual(
+                    ds.default_handle(path, len(folder) + 1),
+                    expected_handle(pathlib.Path(path), folder),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import disk_cache as dc  # noqa: E402
+from src.resourceful import resource_manager as rm  # noqa: E402
+
+try:
+    import pygame
+    from src.resourceful.pygame import pygame_codecs
+except ImportError:
+    pygame = None
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.temp_dir.name)
+        self.source = self.root / "asset.txt"
+        self.source.write_text("hello")
+        self.disk_cache = dc.DiskCache(self.root / "cache")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        self.assertIsNone(self.disk_cache.load(self.source))
+        self.assertTrue(self.disk_cache.store(self.source, {"value": 1}))
+        self.assertEqual(self.disk_cache.load(self.source), {"value": 1})
+        self.assertEqual(self.disk_cache.load(str(self.source)), {"value": 1})
+
+    def test_stale_entry(self):
+        self.disk_cache.store(self.source, "old")
+        self.source.write_text("changed!")
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertIsNone(self.disk_cache.load(self.source))
+
+    def test_version_and_invalidate(self):
+        self.disk_cache.store(self.source, "value")
+        other_version = dc.DiskCache(self.root / "cache", version="2")
+        self.assertIsNone(other_version.load(self.source))
+
+        self.disk_cache.invalidate(self.source)
+        self.assertIsNone(self.disk_cache.load(self.source))
+
+    def test_uncacheable_locations(self):
+        self.assertFalse(self.disk_cache.store(1, "value"))
+        self.assertFalse(self.disk_cache.store(self.root / "missing", "value"))
+        self.assertIsNone(self.disk_cache.load(1))
+
+    def test_damaged_entry(self):
+        self.disk_cache.store(self.source, "value")
+        entry = self.disk_cache._entry_path(self.source)
+        entry.write_bytes(b"garbage")
+
+        self.assertIsNone(self.disk_cache.load(self.source))
+
+    def test_corrupted_data(self):
+        self.disk_cache.store(self.source, {"value": list(range(100))})
+        entry = self.disk_cache._entry_path(self.source)
+        data = entry.read_bytes()
+        entry.write_bytes(data[:-8] + b"\xff" * 8)
+        self.assertIsNone(self.disk_cache.load(self.source))
+
+        manager = rm.ResourceManager[str]("Test")
+        manager.config(
+            loader_helper=lambda location: location.read_text(),
+            disk_cache=self.disk_cache,
+        )
+        manager.import_asset("asset", self.source)
+        self.assertEqual(manager.get("asset"), "hello")
+
+    def test_unpicklable_asset(self):
+        class LocalAsset:
+            pass
+
+        manager = rm.ResourceManager[LocalAsset]("Test")
+        manager.config(
+            loader_helper=lambda location: LocalAsset(),
+            disk_cache=self.disk_cache,
+        )
+        manager.import_asset("asset", self.source)
+        asset = manager.get("asset", None)
+        self.assertIsInstance(asset, LocalAsset)
+        self.assertIs(manager.get("asset"), asset)
+        self.assertIsNone(self.disk_cache.load(self.source))
+
+    def test_unreadable_source(self):
+        disk_cache = dc.DiskCache(self.root / "cache", hash_contents=True)
+        # Such as the file being deleted or locked after it was loaded.
+        with mock.patch.object(dc, "open", side_effect=PermissionError, create=True):
+            self.assertFalse(disk_cache.store(self.source, "value"))
+            self.assertIsNone(disk_cache.load(self.source))
+        self.assertTrue(disk_cache.store(self.source, "value"))
+        self.assertEqual(disk_cache.load(self.source), "value")
+
+    def test_manager(self):
+        calls = []
+
+        def text_loader(resource_location: pathlib.Path) -> str:
+            calls.append(resource_location)
+            return resource_location.read_text()
+
+        first = rm.ResourceManager[str]("Test")
+        first.config(loader_helper=text_loader, disk_cache=self.disk_cache)
+        first.import_asset("asset", self.source)
+        self.assertEqual(first.get("asset"), "hello")
+
+        second = rm.ResourceManager[str]("Test")
+        second.config(loader_helper=text_loader, disk_cache=self.disk_cache)
+        second.import_asset("asset", self.source)
+        self.assertEqual(second.get("asset"), "hello")
+
+        self.assertEqual(len(calls), 1)
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestPygameCodecs(unittest.TestCase):
+
+    def test_surface_codec(self):
+        codec = pygame_codecs.SurfaceCodec()
+        surface = pygame.Surface((4, 3), pygame.SRCALPHA)
+        surface.fill((10, 20, 30, 40))
+
+        metadata, data = codec.encode(surface)
+        rebuilt = codec.decode(metadata, memoryview(bytearray(data)))
+
+        self.assertEqual(rebuilt.get_size(), (4, 3))
+        self.assertEqual(rebuilt.get_at((3, 2)), pygame.Color(10, 20, 30, 40))
+
+    def test_surface_codec_colorkey(self):
+        codec = pygame_codecs.SurfaceCodec()
+        surface = pygame.Surface((2, 2))
+        surface.set_colorkey((255, 0, 255))
+
+        metadata, data = codec.encode(surface)
+        rebuilt = codec.decode(metadata, memoryview(bytearray(data)))
+
+        self.assertEqual(rebuilt.get_colorkey(), (255, 0, 255, 255))
+
+    def test_surface_codec_keeps_format(self):
+        codec = pygame_codecs.SurfaceCodec()
+        # The usual format of opaque images converted for the display.
+        surface = pygame.Surface((4, 3), 0, 32, (0xFF0000, 0xFF00, 0xFF, 0))
+        surface.fill((10, 20, 30))
+
+        metadata, data = codec.encode(surface)
+        rebuilt = codec.decode(metadata, memoryview(bytearray(data)))
+
+        self.assertEqual(rebuilt.get_bitsize(), 32)
+        self.assertEqual(rebuilt.get_masks(), surface.get_masks())
+        self.assertFalse(rebuilt.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(rebuilt.get_at((3, 2)), pygame.Color(10, 20, 30))
+
+
+if __name__ == "__main__":
+    unittest.main()
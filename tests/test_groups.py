@@ -0,0 +1,109 @@
+import pathlib
+import sys
+import threading
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import groups  # noqa: E402
+from src.resourceful import resource_manager as rm  # noqa: E402
+
+
+def int_loader(resource_location: int) -> int | None:
+    if resource_location < 0:
+        return None
+    return resource_location
+
+
+class TestResourceGroup(unittest.TestCase):
+
+    def setUp(self):
+        self.numbers = rm.ResourceManager[int]("group_numbers")
+        self.words = rm.ResourceManager[str]("group_words")
+        self.numbers.config(loader_helper=int_loader)
+        self.words.config(loader_helper=lambda location: location.upper())
+        for i in range(6):
+            self.numbers.import_asset(f"num{i}", i)
+        self.words.import_asset("hello", "hello")
+        self.words.import_asset("bye", "bye")
+
+        self.level_1 = groups.ResourceGroup("level_1")
+        self.level_1.add(self.numbers, ["num0", "num1", "num2"])
+        self.level_1.add(self.words, ["hello"])
+        self.level_2 = groups.ResourceGroup("level_2")
+        self.level_2.add(self.numbers, ["num2", "num3"])
+        self.level_2.add(self.words, ["bye"])
+        self.addCleanup(self.level_1.release)
+        self.addCleanup(self.level_2.release)
+
+    def test_load(self):
+        progress = self.level_1.load()
+        self.assertTrue(progress.wait(5))
+        self.assertEqual(progress.total, 4)
+        self.assertEqual(progress.loaded, 4)
+        self.assertEqual(progress.fraction, 1.0)
+        self.assertEqual(set(self.numbers.cache), {"num0", "num1", "num2"})
+        self.assertEqual(self.words.cache["hello"], "HELLO")
+
+    def test_shared_assets(self):
+        self.level_1.load().wait()
+        self.level_2.load().wait()
+        self.assertEqual(self.level_1.release(), 3)
+        # num2 is still used by level 2
+        self.assertEqual(set(self.numbers.cache), {"num2", "num3"})
+        self.assertEqual(self.level_1.release(), 0)
+
+        self.assertEqual(self.level_2.release(), 3)
+        self.assertEqual(len(self.numbers.cache), 0)
+        self.assertEqual(len(self.words.cache), 0)
+
+    def test_add_remove_live(self):
+        with self.level_1:
+            self.level_1.add(self.numbers, ["num4"])
+            self.numbers.get("num4")
+            self.level_1.remove(self.numbers, ["num0"])
+            self.assertNotIn("num0", self.numbers.cache)
+        self.assertFalse(self.level_1.live)
+        self.assertEqual(len(self.numbers.cache), 0)
+
+    def test_failures(self):
+        self.numbers.import_asset("broken", -1)
+        self.level_1.add(self.numbers, ["broken", "unknown"])
+        progress = self.level_1.load()
+        progress.wait()
+        self.assertEqual(
+            set(progress.failures),
+            {(self.numbers, "broken"), (self.numbers, "unknown")},
+        )
+        finished = []
+        progress.add_done_callback(finished.append)
+        self.assertEqual(finished, [progress])
+
+    def test_release_while_loading(self):
+        started = threading.Event()
+        resume = threading.Event()
+
+        def slow_loader(resource_location: int) -> int:
+            started.set()
+            resume.wait(5)
+            return resource_location
+
+        self.numbers.config(loader_helper=slow_loader, max_workers=1)
+        self.level_1.load()
+        started.wait(5)
+        threading.Timer(0.05, resume.set).start()
+        self.level_1.release()
+
+        # Loads that never started were cancelled, and don't break later requests.
+        self.assertEqual(self.numbers.get("num2"), 2)
+        self.numbers.uncache("num2")
+        self.assertTrue(self.level_1.load().wait(5))
+        self.assertEqual(set(self.numbers.cache), {"num0", "num1", "num2"})
+
+    def test_get_resource_group(self):
+        group = groups.getResourceGroup("shared_group")
+        self.assertIs(groups.getResourceGroup("shared_group"), group)
+        self.assertIsNot(groups.getResourceGroup("other_group"), group)
+
+
+if __name__ == "__main__":
+    unittest.main()
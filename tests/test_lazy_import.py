@@ -0,0 +1,55 @@
+import pathlib
+import subprocess
+import sys
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+
+def run(statement: str) -> str:
+    output = subprocess.run(
+        [sys.executable, "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=pathlib.Path.cwd(),
+    ).stdout.strip()
+    # Only the last line, pygame may print its greeting first.
+    return output.splitlines()[-1] if output else output
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_heavy_modules_deferred(self):
+        loaded = run(
+            "import sys\n"
+            "import src.resourceful\n"
+            "heavy = ['pygame', 'asyncio', 'concurrent.futures', 'difflib']\n"
+            "print(','.join(name for name in heavy if name in sys.modules))"
+        )
+        self.assertEqual(loaded, "")
+
+    def test_lazy_names(self):
+        result = run(
+            "import src.resourceful as resourceful\n"
+            "print(resourceful.LRUPolicy.__name__, 'LRUPolicy' in dir(resourceful))"
+        )
+        self.assertEqual(result, "LRUPolicy True")
+
+    @unittest.skipIf(pygame is None, "pygame is not installed")
+    def test_pygame_names(self):
+        result = run(
+            "import src.resourceful as resourceful\n"
+            "manager = resourceful.getImageManager()\n"
+            "print(manager.default_asset is resourceful.DEFAULT_SURFACE)"
+        )
+        self.assertEqual(result, "True")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import process_loader as pl  # noqa: E402
+from src.resourceful import resource_manager as rm  # noqa: E402
+
+try:
+    import pygame
+    from src.resourceful.pygame import pygame_codecs
+except ImportError:
+    pygame = None
+
+
+# Loaders run in other processes, so they must be defined at the top level.
+def load_numbers(resource_location: int) -> dict:
+    if resource_location < 0:
+        raise ValueError(f"Can't load {resource_location}")
+    return {"location": resource_location, "pid": os.getpid()}
+
+
+def load_nothing(resource_location: int) -> None:
+    return None
+
+
+def load_image(resource_location: str) -> "pygame.Surface":
+    return pygame.image.load(resource_location)
+
+
+class TestProcessLoader(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.process_loader = pl.ProcessLoader(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.process_loader.shutdown()
+
+    def test_load(self):
+        asset = self.process_loader.load(load_numbers, 5)
+        self.assertEqual(asset["location"], 5)
+        self.assertNotEqual(asset["pid"], os.getpid())
+        self.assertIsNone(self.process_loader.load(load_nothing, 5))
+        with self.assertRaises(ValueError):
+            self.process_loader.load(load_numbers, -5)
+
+    def test_shared_memory_freed(self):
+        if not pl._SHARED_HANDOFF:
+            self.skipTest("Data isn't handed off through shared memory.")
+        name, size = pl._send(memoryview(b"abc"))
+        self.assertEqual(pl._receive(name, size), bytearray(b"abc"))
+        with self.assertRaises(FileNotFoundError):
+            pl._receive(name, size)
+
+    def test_resource_manager(self):
+        manager = rm.ResourceManager[dict]("process_test")
+        manager.config(loader_helper=load_numbers, process_loader=self.process_loader)
+        manager.import_asset("numbers", 7)
+        manager.import_asset("broken", -8)
+        self.assertEqual(manager.get("numbers")["location"], 7)
+        self.assertIsNone(manager.get("broken", None))
+
+        manager.config(process_loader=None)
+        manager.uncache("numbers")
+        self.assertEqual(manager.get("numbers")["pid"], os.getpid())
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestProcessLoaderSurfaces(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.temp_dir.name)
+        self.process_loader = pl.ProcessLoader(pygame_codecs.SurfaceCodec(), 1)
+
+    def tearDown(self):
+        self.process_loader.shutdown()
+        self.temp_dir.cleanup()
+
+    def test_surface(self):
+        image = pygame.Surface((12, 7), pygame.SRCALPHA)
+        image.fill((10, 20, 30, 40))
+        pygame.image.save(image, self.root / "image.png")
+
+        surface = self.process_loader.load(load_image, str(self.root / "image.png"))
+        self.assertEqual(surface.get_size(), (12, 7))
+        self.assertEqual(surface.get_at((11, 6)), pygame.Color(10, 20, 30, 40))
+
+
+if __name__ == "__main__":
+    unittest.main()
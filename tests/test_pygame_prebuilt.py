@@ -0,0 +1,107 @@
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+
+try:
+    import pygame
+    from src.resourceful.pygame import pygame_prebuilt
+except ImportError:
+    pygame = None
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestImageVariants(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        image = pygame.Surface((8, 4))
+        image.fill((0, 0, 0))
+        image.set_at((0, 0), (255, 0, 0))
+        self.path = pathlib.Path(self.temp_dir.name) / "variant.bmp"
+        pygame.image.save(image, self.path)
+        self.manager = pygame_prebuilt.getImageManager()
+        self.manager.import_asset("variant_test", self.path)
+        self.addCleanup(self.manager.clear, "variant_test")
+
+    def test_transforms(self):
+        scaled = pygame_prebuilt.getImageVariant("variant_test", scale=2)
+        self.assertEqual(scaled.get_size(), (16, 8))
+        self.assertIs(pygame_prebuilt.getImageVariant("variant_test", scale=2), scaled)
+        self.assertEqual(
+            pygame_prebuilt.getImageVariant("variant_test", scale=(4, 4)).get_size(),
+            (4, 4),
+        )
+
+        flipped = pygame_prebuilt.getImageVariant("variant_test", flip_x=True)
+        self.assertEqual(flipped.get_at((7, 0)), pygame.Color(255, 0, 0))
+        rotated = pygame_prebuilt.getImageVariant("variant_test", rotate=90)
+        self.assertEqual(rotated.get_size(), (4, 8))
+
+        # No transforms is just the image
+        self.assertIs(
+            pygame_prebuilt.getImageVariant("variant_test"),
+            self.manager.get("variant_test"),
+        )
+
+    def test_update_invalidates(self):
+        scaled = pygame_prebuilt.getImageVariant("variant_test", scale=2)
+        self.manager.update("variant_test", pygame.Surface((2, 2)))
+        rescaled = pygame_prebuilt.getImageVariant("variant_test", scale=2)
+        self.assertIsNot(rescaled, scaled)
+        self.assertEqual(rescaled.get_size(), (4, 4))
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestImageConversion(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.quit()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.manager = pygame_prebuilt.getImageManager()
+        root = pathlib.Path(self.temp_dir.name)
+        for name, flags in (("opaque", 0), ("alpha", pygame.SRCALPHA)):
+            image = pygame.Surface((4, 4), flags, 24 if not flags else 32)
+            image.fill((10, 20, 30))
+            pygame.image.save(image, root / f"{name}.png")
+            self.manager.import_asset(f"convert_{name}", root / f"{name}.png")
+            self.addCleanup(self.manager.clear, f"convert_{name}")
+
+    def test_deferred_conversion(self):
+        # Loading works without a display, and leaves the images as they are.
+        opaque = self.manager.get("convert_opaque")
+        self.assertEqual(opaque.get_bitsize(), 24)
+
+        pygame.display.init()
+        display = pygame.display.set_mode((1, 1))
+        self.assertEqual(pygame_prebuilt.convertImages(), ["convert_opaque"])
+        converted = self.manager.get("convert_opaque")
+        self.assertEqual(converted.get_bitsize(), display.get_bitsize())
+        self.assertEqual(converted.get_at((0, 0)), pygame.Color(10, 20, 30))
+        self.assertEqual(pygame_prebuilt.convertImages(), [])
+
+        # Images loaded with a display are converted right away.
+        alpha = self.manager.get("convert_alpha")
+        self.assertTrue(alpha.get_flags() & pygame.SRCALPHA)
+        self.assertIn(alpha, pygame_prebuilt._converted)
+
+    def test_converted_with_next_load(self):
+        self.manager.get("convert_opaque")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        self.manager.get("convert_alpha")
+        self.assertIn(self.manager.get("convert_opaque"), pygame_prebuilt._converted)
+
+    def test_no_display(self):
+        with self.assertRaises(pygame.error):
+            pygame_prebuilt.convertImages()
+
+
+if __name__ == "__main__":
+    unittest.main()
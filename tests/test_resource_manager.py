@@ -1,5 +1,8 @@
+import asyncio
 import pathlib
 import sys
+import threading
+import time
 import unittest
 
 import pyfakefs
@@ -7,6 +10,7 @@ import pyfakefs.fake_filesystem
 import pyfakefs.fake_filesystem_unittest
 
 sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import cache_policy as cp  # noqa: E402
 from src.resourceful import resource_manager as rm  # noqa: E402
 
 
@@ -107,6 +111,43 @@ class TestResourceManager(unittest.TestCase):
             pathlib.Path("subfolder/subitem0.file"),
         )
 
+    @pyfakefs.fake_filesystem_unittest.patchfs
+    def test_import_directory_workers(
+        self, fs: pyfakefs.fake_filesystem.FakeFilesystem
+    ):
+        for i in range(3):
+            for j in range(3):
+                fs.create_file(pathlib.Path(f"root/folder{i}/sub{j}/item{j}.tar.gz"))
+
+        serial = self.test_manager.import_directory("root", recursive=True)
+        self.test_manager.resource_locations.clear()
+        parallel = self.test_manager.import_directory("root", recursive=True, workers=4)
+
+        self.assertEqual(len(serial), 9)
+        self.assertEqual(serial, parallel)
+        self.assertIn("folder1/sub2/item2", parallel)
+
+    @pyfakefs.fake_filesystem_unittest.patchfs
+    def test_save_load_index(self, fs: pyfakefs.fake_filesystem.FakeFilesystem):
+        for i in range(3):
+            fs.create_file(pathlib.Path(f"root/item{i}.file"))
+        self.test_manager.import_directory("root")
+        self.test_manager.import_asset("test_num", 1)
+
+        self.test_manager.save_index("index.json")
+
+        test_manager = rm.ResourceManager[int]("Test")
+        imported = test_manager.load_index("index.json")
+
+        self.assertEqual(len(imported), 4)
+        self.assertEqual(
+            test_manager.resource_locations, self.test_manager.resource_locations
+        )
+
+        self.test_manager.import_asset("test_object", object())
+        with self.assertRaises(TypeError):
+            self.test_manager.save_index("index.json")
+
     def test_force_load(self):
         self.test_manager.force_load("test_num", 1)
 
@@ -114,6 +155,16 @@ class TestResourceManager(unittest.TestCase):
         self.assertTrue(len(self.test_manager.resource_locations) == 1)
         self.assertEqual(self.test_manager.cache.get("test_num"), 1)
 
+    def test_force_load_transforms(self):
+        self.test_manager.config(transforms=[lambda asset: asset * 10])
+        self.test_manager.force_load("test_num", 2)
+        self.assertEqual(self.test_manager.cache.get("test_num"), 20)
+
+        # Fails to load, so nothing is cached.
+        self.test_manager.force_load("test_negative", -1)
+        self.assertNotIn("test_negative", self.test_manager.cache)
+        self.assertIn("test_negative", self.test_manager.failed_handles())
+
     def test_update(self):
         self.test_manager.force_load("test_num", 1)
 
@@ -178,6 +229,329 @@ class TestResourceManager(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.test_manager.get("test_num4")
 
+    def test_get_many(self):
+        self.test_manager.import_asset("test_num", 1)
+        self.test_manager.import_asset("test_num2", 2)
+        self.test_manager.import_asset("test_fail", -1)
+        self.test_manager.force_load("test_num3", 3)
+
+        self.assertEqual(
+            self.test_manager.get_many(["test_num3", "test_num", "test_num2"]),
+            {"test_num3": 3, "test_num": 1, "test_num2": 2},
+        )
+        self.assertEqual(len(self.test_manager.cache), 3)
+
+        # Unknown and failed assets, with default
+        self.assertEqual(
+            self.test_manager.get_many(["test_num", "test_fail", "missing"], 0),
+            {"test_num": 1, "test_fail": 0, "missing": 0},
+        )
+
+        # Unknown and failed assets, without default
+        with self.assertRaises(KeyError):
+            self.test_manager.get_many(["test_num", "missing"])
+        self.test_manager.uncache("test_fail")
+        with self.assertRaises(KeyError):
+            self.test_manager.get_many(["test_num", "test_fail"])
+
+    def test_get_many_batch_loader(self):
+        batches: list[list[int]] = []
+
+        def batch_loader(resource_locations: list[int]) -> list[int | None]:
+            batches.append(resource_locations)
+            return [test_loader(location) for location in resource_locations]
+
+        self.test_manager.config(batch_loader=batch_loader)
+        for i in range(5):
+            self.test_manager.import_asset(f"test_num{i}", i)
+        self.test_manager.import_asset("test_fail", -1)
+        self.test_manager.get("test_num0")
+
+        handles = [f"test_num{i}" for i in range(5)]
+        self.assertEqual(
+            self.test_manager.get_many(handles),
+            {handle: i for i, handle in enumerate(handles)},
+        )
+        # Only the misses are loaded, together
+        self.assertEqual(batches, [[1, 2, 3, 4]])
+        self.assertEqual(len(self.test_manager.cache), 5)
+
+        # Failures in a batch still leave the rest cached
+        self.test_manager.import_asset("test_num5", 5)
+        with self.assertRaises(KeyError):
+            self.test_manager.get_many(["test_fail", "test_num5"])
+        self.assertEqual(self.test_manager.cache.get("test_num5"), 5)
+        self.assertNotIn("test_fail", self.test_manager.cache)
+
+        self.test_manager.config(batch_loader=lambda locations: [])
+        self.test_manager.import_asset("test_num6", 6)
+        with self.assertRaises(ValueError):
+            self.test_manager.get_many(["test_num6"])
+        self.assertNotIn("test_num6", self.test_manager._pending)
+
+    def test_get_variant(self):
+        calls: list[tuple[int, int]] = []
+
+        def multiply(asset: int, factor: int) -> int:
+            calls.append((asset, factor))
+            return asset * factor
+
+        self.test_manager.import_asset("test_num", 2)
+        self.assertEqual(self.test_manager.get_variant("test_num", multiply, 3), 6)
+        self.assertEqual(self.test_manager.get_variant("test_num", multiply, 3), 6)
+        self.assertEqual(self.test_manager.get_variant("test_num", multiply, 4), 8)
+        self.assertEqual(calls, [(2, 3), (2, 4)])
+
+        # Replaced assets get new variants
+        self.test_manager.update("test_num", 5)
+        self.assertEqual(self.test_manager.get_variant("test_num", multiply, 3), 15)
+        self.test_manager.uncache("test_num")
+        self.assertEqual(self.test_manager.get_variant("test_num", multiply, 3), 6)
+        self.assertEqual(len(calls), 4)
+
+    def test_max_variants(self):
+        def multiply(asset: int, factor: int) -> int:
+            return asset * factor
+
+        self.test_manager.import_asset("test_num", 2)
+        self.test_manager.config(max_variants=3)
+        for factor in range(10):
+            self.test_manager.get_variant("test_num", multiply, factor)
+            # Kept as the most recently used.
+            self.test_manager.get_variant("test_num", multiply, 0)
+        variants = self.test_manager._variants["test_num"]
+        self.assertEqual([args for _, args in variants], [(8,), (9,), (0,)])
+
+        self.test_manager.config(max_variants=1)
+        self.assertEqual(len(variants), 1)
+
+        # Defaults are not transformed
+        self.assertEqual(
+            self.test_manager.get_variant("missing", multiply, 3, default=1), 1
+        )
+
+    def test_get_variant_eviction(self):
+        self.test_manager.config(cache_policy=cp.LRUPolicy(max_items=1))
+        self.test_manager.import_asset("test_num", 2)
+        self.test_manager.import_asset("test_num2", 3)
+
+        self.test_manager.get_variant("test_num", lambda asset: -asset)
+        self.assertIn("test_num", self.test_manager._variants)
+        self.test_manager.get("test_num2")
+        self.assertNotIn("test_num", self.test_manager._variants)
+
+    def test_failure_backoff(self):
+        calls: list[int] = []
+
+        def counting_loader(resource_location: int) -> int | None:
+            calls.append(resource_location)
+            if resource_location == 0:
+                raise OSError("Broken file")
+            return test_loader(resource_location)
+
+        self.test_manager.config(
+            loader_helper=counting_loader, failure_ttl=60, max_failure_ttl=600
+        )
+        self.test_manager.import_asset("test_fail", -1)
+
+        # Failures are not retried while backing off, and defaults aren't cached
+        for _ in range(3):
+            self.assertEqual(self.test_manager.get("test_fail", 2), 2)
+        with self.assertRaises(KeyError):
+            self.test_manager.get("test_fail")
+        self.assertEqual(calls, [-1])
+        self.assertNotIn("test_fail", self.test_manager.cache)
+
+        # Loader exceptions are captured the same way
+        self.test_manager.import_asset("test_error", 0)
+        with self.assertRaises(KeyError) as context:
+            self.test_manager.get("test_error")
+        self.assertIsInstance(context.exception.__cause__, OSError)
+        self.assertEqual(self.test_manager.get("test_error", 3), 3)
+        self.assertEqual(calls, [-1, 0])
+
+        failures = self.test_manager.failed_handles()
+        self.assertEqual(set(failures), {"test_fail", "test_error"})
+        self.assertIsNone(failures["test_fail"].error)
+        self.assertEqual(failures["test_fail"].attempts, 1)
+
+        # Retrying ignores the backoff, and doubles it on another failure
+        self.assertEqual(self.test_manager.retry_failed(["test_fail"]), ["test_fail"])
+        failure = self.test_manager.failed_handles()["test_fail"]
+        self.assertEqual(failure.attempts, 2)
+        self.assertGreater(failure.retry_at - time.monotonic(), 60)
+
+        # Fixed assets load on retry, or when given new location data
+        self.test_manager.resource_locations["test_fail"] = 4
+        self.assertEqual(self.test_manager.retry_failed(), ["test_error"])
+        self.assertEqual(self.test_manager.get("test_fail"), 4)
+        self.test_manager.import_asset("test_error", 5)
+        self.assertEqual(self.test_manager.get("test_error"), 5)
+        self.assertEqual(self.test_manager.failed_handles(), {})
+
+    def test_failure_no_backoff(self):
+        self.test_manager.config(failure_ttl=0)
+        self.test_manager.import_asset("test_fail", -1)
+        self.test_manager.get("test_fail", 2)
+        self.test_manager.resource_locations["test_fail"] = 1
+        self.assertEqual(self.test_manager.get("test_fail"), 1)
+
+    def test_failure_new_loader(self):
+        test_manager = rm.ResourceManager[int]("Test")
+        test_manager.import_asset("test_num", 1)
+
+        # A missing loader is a usage error, not a failure of the asset.
+        with self.assertRaises(AttributeError):
+            test_manager.get("test_num", 2)
+        self.assertEqual(test_manager.failed_handles(), {})
+
+        test_manager.config(loader_helper=lambda location: None, failure_ttl=60)
+        self.assertEqual(test_manager.get("test_num", 2), 2)
+        test_manager.config(loader_helper=test_loader)
+        self.assertEqual(test_manager.get("test_num"), 1)
+
+    def test_failure_preload(self):
+        calls: list[int] = []
+
+        def counting_loader(resource_location: int) -> int | None:
+            calls.append(resource_location)
+            return test_loader(resource_location)
+
+        self.test_manager.config(loader_helper=counting_loader, failure_ttl=60)
+        self.test_manager.import_asset("test_fail", -1)
+        self.test_manager.get("test_fail", 2)
+
+        # Preloading doesn't retry the asset while backing off
+        progress = self.test_manager.preload(["test_fail"])
+        progress.wait()
+        self.assertIn("test_fail", progress.failures)
+        self.assertEqual(calls, [-1])
+        self.assertEqual(self.test_manager.failed_handles()["test_fail"].attempts, 1)
+
+    def test_transforms(self):
+        self.test_manager.config(
+            transforms=[lambda asset: asset * 10, lambda asset: asset + 1]
+        )
+        self.test_manager.import_asset("test_num", 2)
+        self.test_manager.import_asset("test_zero", 0)
+        self.assertEqual(self.test_manager.get("test_num"), 21)
+
+        # Transforms rejecting an asset fail its load.
+        self.test_manager.config(transforms=[lambda asset: asset or None])
+        self.assertIsNone(self.test_manager.get("test_zero", None))
+
+        replaced = self.test_manager.apply_transform(lambda asset: -asset)
+        self.assertEqual(replaced, ["test_num"])
+        self.assertEqual(self.test_manager.get("test_num"), -21)
+        self.assertEqual(self.test_manager.apply_transform(lambda asset: asset), [])
+
+    def test_preload(self):
+        for i in range(5):
+            self.test_manager.import_asset(f"test_num{i}", i)
+        self.test_manager.import_asset("test_fail", -1)
+        self.test_manager.force_load("test_cached", 7)
+
+        progress = self.test_manager.preload(
+            [f"test_num{i}" for i in range(5)]
+            + ["test_fail", "test_cached", "test_missing"]
+        )
+        self.assertTrue(progress.wait(5))
+
+        self.assertEqual(progress.total, 8)
+        self.assertEqual(progress.loaded, 6)
+        self.assertEqual(set(progress.failures), {"test_fail", "test_missing"})
+        self.assertEqual(self.test_manager.cache.get("test_num4"), 4)
+        self.assertEqual(len(self.test_manager._pending), 0)
+
+    def test_get_waits_for_preload(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_loader(resource_location: int) -> int:
+            calls.append(resource_location)
+            started.set()
+            release.wait(5)
+            return resource_location
+
+        self.test_manager.config(loader_helper=slow_loader)
+        self.test_manager.import_asset("test_num", 1)
+        progress = self.test_manager.preload(["test_num"])
+        started.wait(5)
+
+        threading.Timer(0.05, release.set).start()
+        self.assertEqual(self.test_manager.get("test_num"), 1)
+        self.assertTrue(progress.wait(5))
+        self.assertEqual(calls, [1])
+
+    def test_cancelled_preload(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_loader(resource_location: int) -> int:
+            started.set()
+            release.wait(5)
+            return resource_location
+
+        self.test_manager.config(loader_helper=slow_loader, max_workers=1)
+        for i in range(3):
+            self.test_manager.import_asset(f"test_num{i}", i)
+        progress = self.test_manager.preload([f"test_num{i}" for i in range(3)])
+        started.wait(5)
+        self.assertEqual(progress.cancel(), 2)
+        release.set()
+        self.assertTrue(progress.wait(5))
+
+        # Cancelled loads don't linger, so the assets load normally afterwards.
+        self.assertEqual(self.test_manager.get("test_num2"), 2)
+        self.assertTrue(self.test_manager.preload(["test_num1"]).wait(5))
+        self.assertEqual(self.test_manager.cache.get("test_num1"), 1)
+        self.assertEqual(len(self.test_manager._pending), 0)
+
+    def test_thread_safe_single_flight(self):
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def slow_loader(resource_location: int) -> int:
+            calls.append(resource_location)
+            time.sleep(0.05)
+            return resource_location
+
+        self.test_manager.config(loader_helper=slow_loader, thread_safe=True)
+        self.test_manager.import_asset("test_num", 1)
+        results = []
+
+        def worker():
+            barrier.wait(5)
+            results.append(self.test_manager.get("test_num"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(results, [1] * 8)
+        self.assertEqual(calls, [1])
+        self.assertEqual(len(self.test_manager._pending), 0)
+
+    def test_thread_safe_failure(self):
+        self.test_manager.config(thread_safe=True)
+        self.test_manager.import_asset("test_num", -1)
+
+        with self.assertRaises(KeyError):
+            self.test_manager.get("test_num")
+        self.assertEqual(self.test_manager.get("test_num", 2), 2)
+
+    def test_async_loader_sync_get(self):
+        async def async_loader(resource_location: int) -> int:
+            return resource_location
+
+        self.test_manager.config(loader_helper=async_loader)
+        self.test_manager.import_asset("test_num", 1)
+
+        self.assertEqual(self.test_manager.get("test_num"), 1)
+
     def test_uncache(self):
         self.test_manager.force_load("test_num", 1)
 
@@ -200,6 +574,93 @@ class TestResourceManager(unittest.TestCase):
 
         self.assertEqual(self.test_manager.get("test_num", 1), 1)
 
+    def test_suggest(self):
+        self.test_manager.import_asset("player_idle", 1)
+        self.test_manager.import_asset("player_walk", 2)
+        self.test_manager.import_asset("enemy_idle", 3)
+
+        self.assertEqual(self.test_manager.suggest("player_ilde", 1), ["player_idle"])
+        with self.assertRaisesRegex(KeyError, "Did you mean 'player_idle'"):
+            self.test_manager.get("player_ilde")
+
+        # Index follows imports and clears made after it was built
+        self.test_manager.import_asset("player_jump", 4)
+        self.assertEqual(self.test_manager.suggest("player_jmup", 1), ["player_jump"])
+        self.test_manager.clear("player_jump")
+        self.assertNotIn("player_jump", self.test_manager.suggest("player_jmup"))
+        self.test_manager.resource_locations.clear()
+        self.assertEqual(self.test_manager.suggest("player_idle"), [])
+
+
+class TestAsyncResourceManager(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.test_manager = rm.ResourceManager[int]("Test")
+        self.test_manager.config(loader_helper=test_loader)
+
+    async def test_aget(self):
+        self.test_manager.import_asset("test_num", 1)
+
+        self.assertEqual(await self.test_manager.aget("test_num"), 1)
+        self.assertEqual(self.test_manager.cache.get("test_num"), 1)
+
+        self.assertEqual(await self.test_manager.aget("test_num2", 2), 2)
+        with self.assertRaises(KeyError):
+            await self.test_manager.aget("test_num2")
+
+        self.test_manager.import_asset("test_num3", -1)
+        with self.assertRaises(KeyError):
+            await self.test_manager.aget("test_num3")
+
+    async def test_async_loader(self):
+        calls = []
+
+        async def async_loader(resource_location: int) -> int:
+            calls.append(resource_location)
+            await asyncio.sleep(0.01)
+            return resource_location
+
+        self.test_manager.config(loader_helper=async_loader)
+        self.test_manager.import_asset("test_num", 1)
+
+        results = await asyncio.gather(
+            *(self.test_manager.aget("test_num") for _ in range(5))
+        )
+        self.assertEqual(results, [1] * 5)
+        self.assertEqual(calls, [1])
+
+        # Sync access is refused while the loop is running
+        self.test_manager.import_asset("test_num2", 2)
+        with self.assertRaises(RuntimeError):
+            self.test_manager.get("test_num2")
+
+    async def test_apreload(self):
+        for i in range(5):
+            self.test_manager.import_asset(f"test_num{i}", i)
+        self.test_manager.import_asset("test_fail", -1)
+
+        failures = await self.test_manager.apreload(
+            [f"test_num{i}" for i in range(5)] + ["test_fail", "test_missing"]
+        )
+
+        self.assertEqual(set(failures), {"test_fail", "test_missing"})
+        self.assertEqual(len(self.test_manager.cache), 5)
+
+    async def test_apreload_backoff(self):
+        calls: list[int] = []
+
+        def counting_loader(resource_location: int) -> int | None:
+            calls.append(resource_location)
+            return test_loader(resource_location)
+
+        self.test_manager.config(loader_helper=counting_loader, failure_ttl=60)
+        self.test_manager.import_asset("test_fail", -1)
+        self.assertIsNone(await self.test_manager.aget("test_fail", None))
+
+        failures = await self.test_manager.apreload(["test_fail"])
+        self.assertIn("test_fail", failures)
+        self.assertEqual(calls, [-1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,110 @@
+import json
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import resource_manager as rm  # noqa: E402
+from src.resourceful import stats as st  # noqa: E402
+
+
+def int_loader(resource_location: int) -> int | None:
+    """
+    Simply returns the location data as the resource
+    Returns None if the data is negative
+    """
+    if resource_location < 0:
+        return None
+    return resource_location
+
+
+class TestPercentile(unittest.TestCase):
+
+    def test_percentile(self):
+        samples = [float(i) for i in range(1, 101)]
+
+        self.assertEqual(st.percentile(samples, 50), 50.0)
+        self.assertEqual(st.percentile(samples, 99), 99.0)
+        self.assertEqual(st.percentile(samples, 100), 100.0)
+        self.assertEqual(st.percentile(samples, 0), 1.0)
+        self.assertIsNone(st.percentile([], 50))
+
+
+class TestManagerStats(unittest.TestCase):
+
+    def setUp(self):
+        self.test_manager = rm.ResourceManager[int]("Test")
+        self.test_manager.config(loader_helper=int_loader, collect_stats=True)
+        self.test_manager.import_asset("test_num", 1)
+        self.test_manager.import_asset("test_fail", -1)
+
+    def test_counters(self):
+        self.test_manager.get("test_num")
+        self.test_manager.get("test_num")
+        self.test_manager.get("test_fail", 2)
+        self.test_manager.get("test_missing", 3)
+
+        stats = self.test_manager.stats
+        self.assertEqual(stats.total.hits, 1)
+        self.assertEqual(stats.total.misses, 2)
+        self.assertEqual(stats.total.loads, 2)
+        self.assertEqual(stats.total.failures, 1)
+        self.assertEqual(stats.total.defaults, 2)
+        self.assertEqual(stats["test_num"].hits, 1)
+        self.assertEqual(stats["test_fail"].failures, 1)
+
+        snapshot = self.test_manager.stats_snapshot()
+        # Defaults aren't cached
+        self.assertEqual(snapshot["cached"], 1)
+        self.assertEqual(snapshot["failed"], 1)
+        self.assertEqual(snapshot["total"]["loads"], 2)
+        self.assertIsNotNone(snapshot["handles"]["test_num"]["p99"])
+        json.dumps(snapshot)
+
+    def test_export(self):
+        self.test_manager.get("test_num")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "stats.json"
+            self.test_manager.stats.export(path, per_handle=False)
+            exported = json.loads(path.read_text())
+
+        self.assertEqual(exported["total"]["misses"], 1)
+        self.assertNotIn("handles", exported)
+
+    def test_disable(self):
+        self.test_manager.config(collect_stats=False)
+        self.test_manager.get("test_num")
+
+        self.assertIsNone(self.test_manager.stats)
+        self.assertNotIn("total", self.test_manager.stats_snapshot())
+
+    def test_hooks(self):
+        events = []
+
+        def pre_load(asset_handle, resource_location):
+            events.append(("pre", asset_handle, resource_location))
+
+        def post_load(asset_handle, resource_location, asset, seconds):
+            events.append(("post", asset_handle, asset))
+
+        self.test_manager.add_hook("pre_load", pre_load)
+        self.test_manager.add_hook("post_load", post_load)
+        self.test_manager.get("test_num")
+        self.test_manager.get("test_num")
+
+        self.assertEqual(
+            events, [("pre", "test_num", 1), ("post", "test_num", 1)]
+        )
+
+        self.test_manager.remove_hook("pre_load", pre_load)
+        self.test_manager.uncache("test_num")
+        self.test_manager.get("test_num")
+        self.assertEqual(len(events), 3)
+
+        with self.assertRaises(ValueError):
+            self.test_manager.add_hook("sometime", pre_load)
+
+
+if __name__ == "__main__":
+    unittest.main()
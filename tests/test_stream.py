@@ -0,0 +1,107 @@
+import pathlib
+import sys
+import tempfile
+import time
+import unittest
+import wave
+
+sys.path.append(str(pathlib.Path.cwd()))
+
+try:
+    import pygame
+    from src.resourceful.pygame import pygame_prebuilt
+    from src.resourceful.pygame import pygame_stream
+except ImportError:
+    pygame = None
+
+
+def write_wave(
+    path: pathlib.Path, seconds: float, rate: int, channels: int, width: int = 2
+) -> None:
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(channels)
+        file.setsampwidth(width)
+        file.setframerate(rate)
+        file.writeframes(bytes(int(rate * seconds) * channels * width))
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestStreamedSound(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            pygame.mixer.init(44100, -16, 2)
+        except pygame.error:
+            self.skipTest("No audio device available.")
+        self.addCleanup(pygame.mixer.quit)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = pathlib.Path(self.temp_dir.name)
+
+    def test_channel_stream(self):
+        write_wave(self.root / "long.wav", 0.5, 44100, 2)
+        sound = pygame_stream.StreamedSound(
+            self.root / "long.wav", chunk_seconds=0.05, ring_size=2
+        )
+        self.assertAlmostEqual(sound.get_length(), 0.5)
+
+        channel = sound.play(loops=1)
+        self.assertIsNotNone(channel)
+        self.assertTrue(sound.get_busy())
+        self.assertLessEqual(len(sound._ring), 2)
+        start = time.monotonic()
+        self.assertTrue(wait_until(lambda: not sound.get_busy()))
+        # Played twice, chunk by chunk
+        self.assertGreater(time.monotonic() - start, 0.8)
+        self.assertIsNone(sound._reader)
+
+    def test_stop(self):
+        write_wave(self.root / "long.wav", 2, 44100, 2)
+        sound = pygame_stream.StreamedSound(self.root / "long.wav", chunk_seconds=0.05)
+        channel = sound.play(loops=-1)
+        sound.stop()
+        self.assertFalse(sound.get_busy())
+        self.assertFalse(channel.get_busy())
+        self.assertIsNone(sound._file)
+
+    def test_music_fallback(self):
+        # Doesn't match the mixer's format, so it can't be fed to a channel.
+        write_wave(self.root / "mono.wav", 0.5, 22050, 1)
+        sound = pygame_stream.StreamedSound(self.root / "mono.wav")
+        self.assertIsNone(sound.play())
+        self.assertTrue(sound.get_busy())
+        sound.stop()
+        self.assertFalse(pygame.mixer.music.get_busy())
+
+    def test_threshold(self):
+        write_wave(self.root / "short.wav", 0.1, 44100, 2)
+        write_wave(self.root / "long.wav", 1, 44100, 2)
+        self.addCleanup(pygame_prebuilt.setStreamThreshold, None)
+        pygame_prebuilt.setStreamThreshold(50_000)
+
+        self.assertIsInstance(
+            pygame_prebuilt._load_pygame_sounds(self.root / "short.wav"),
+            pygame.mixer.Sound,
+        )
+        self.assertIsInstance(
+            pygame_prebuilt._load_pygame_sounds(self.root / "long.wav"),
+            pygame_stream.StreamedSound,
+        )
+        pygame_prebuilt.setStreamThreshold(None)
+        self.assertIsInstance(
+            pygame_prebuilt._load_pygame_sounds(self.root / "long.wav"),
+            pygame.mixer.Sound,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
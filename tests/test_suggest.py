@@ -0,0 +1,72 @@
+import difflib
+import pathlib
+import sys
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import suggest  # noqa: E402
+
+
+class TestSuggestionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.handles = [f"tiles/grass/grass_{i:04d}" for i in range(2000)]
+        self.handles += ["player/idle", "player/walk", "enemy/idle"]
+        self.index = suggest.SuggestionIndex(self.handles)
+
+    def test_suggest(self):
+        self.assertEqual(self.index.suggest("player/wlak", 1), ["player/walk"])
+        self.assertEqual(
+            self.index.suggest("tiles/grass/grass_0042x", 1), ["tiles/grass/grass_0042"]
+        )
+        self.assertEqual(self.index.suggest("xyz"), [])
+        self.assertEqual(self.index.suggest("player/idle", 0), [])
+
+    def test_matches_difflib(self):
+        for query in ("player/idel", "enemy_idle", "tiles/grass/grass_1999", "plyer"):
+            self.assertEqual(
+                self.index.suggest(query, 1),
+                difflib.get_close_matches(query, self.handles, n=1),
+            )
+
+    def test_add_remove(self):
+        self.index.add("player/jump")
+        self.index.add("player/jump")
+        self.assertIn("player/jump", self.index)
+        self.assertEqual(self.index.suggest("player/jmup", 1), ["player/jump"])
+
+        self.index.remove("player/jump")
+        self.index.remove("player/jump")
+        self.assertNotIn("player/jump", self.index)
+        self.assertNotIn("player/jump", self.index.suggest("player/jmup"))
+
+        self.index.clear()
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.suggest("player/walk"), [])
+
+
+class TestIndexedLocations(unittest.TestCase):
+
+    def test_index_follows_changes(self):
+        locations = suggest.IndexedLocations({"a_handle": 1})
+        locations["b_handle"] = 2
+        self.assertEqual(set(locations.index._handles), {"a_handle", "b_handle"})
+
+        locations["c_handle"] = 3
+        locations.update({"d_handle": 4}, e_handle=5)
+        locations |= {"f_handle": 6}
+        locations.setdefault("g_handle", 7)
+        del locations["a_handle"]
+        locations.pop("b_handle")
+        locations.pop("missing", None)
+        self.assertEqual(set(locations.index._handles), set(locations))
+
+        locations.popitem()
+        self.assertEqual(set(locations.index._handles), set(locations))
+
+        locations.clear()
+        self.assertEqual(len(locations.index), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import cache_policy as cp  # noqa: E402
+from src.resourceful import resource_manager as rm  # noqa: E402
+from src.resourceful import warm_cache as wc  # noqa: E402
+from src.resourceful import watcher  # noqa: E402
+
+
+class TestWarmCache(unittest.TestCase):
+
+    def test_store_take(self):
+        warm = wc.WarmCache()
+        asset = list(range(1000))
+        self.assertTrue(warm.store("numbers", asset))
+        self.assertIn("numbers", warm)
+        self.assertLess(warm.current_size, warm.raw_size)
+
+        self.assertEqual(warm.take("numbers"), asset)
+        self.assertNotIn("numbers", warm)
+        self.assertIsNone(warm.take("numbers"))
+        self.assertEqual(warm.current_size, 0)
+        self.assertEqual(warm.demotions, 1)
+        self.assertEqual(warm.promotions, 1)
+
+    def test_budget(self):
+        warm = wc.WarmCache(max_items=2)
+        for i in range(3):
+            warm.store(f"num{i}", i)
+        self.assertNotIn("num0", warm)
+        self.assertEqual(len(warm), 2)
+        self.assertEqual(warm.evictions, 1)
+
+        warm = wc.WarmCache(max_size=10)
+        self.assertFalse(warm.store("big", bytes(range(256))))
+        self.assertEqual(len(warm), 0)
+
+    def test_unencodable(self):
+        warm = wc.WarmCache()
+        self.assertFalse(warm.store("lambda", lambda: None))
+        self.assertEqual(warm.snapshot()["items"], 0)
+
+
+class TestManagerWarmCache(unittest.TestCase):
+
+    def setUp(self):
+        self.loads: list[int] = []
+        self.test_manager = rm.ResourceManager[list]("Test")
+        self.warm = wc.WarmCache()
+        self.test_manager.config(
+            loader_helper=self.loader,
+            cache_policy=cp.LRUPolicy(max_items=1),
+            warm_cache=self.warm,
+        )
+        for i in range(2):
+            self.test_manager.import_asset(f"test_list{i}", i)
+
+    def loader(self, resource_location: int) -> list:
+        self.loads.append(resource_location)
+        return [resource_location] * 100
+
+    def test_demote_promote(self):
+        self.test_manager.get("test_list0")
+        self.test_manager.get("test_list1")
+        self.assertIn("test_list0", self.warm)
+
+        # Rebuilt from the warm cache, not loaded again
+        self.assertEqual(self.test_manager.get("test_list0"), [0] * 100)
+        self.assertEqual(self.loads, [0, 1])
+        self.assertIn("test_list1", self.warm)
+        self.assertNotIn("test_list0", self.warm)
+
+        snapshot = self.test_manager.stats_snapshot()["warm"]
+        self.assertEqual(snapshot["demotions"], 2)
+        self.assertEqual(snapshot["promotions"], 1)
+
+    def test_uncache_discards(self):
+        self.test_manager.get("test_list0")
+        self.test_manager.get("test_list1")
+        self.test_manager.uncache("test_list0")
+        self.assertEqual(len(self.warm), 0)
+
+        self.test_manager.get("test_list0")
+        self.assertEqual(self.loads, [0, 1, 0])
+
+
+class TestWarmCacheSources(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = pathlib.Path(self.temp_dir.name)
+        self.test_manager = rm.ResourceManager[str]("Test")
+        self.test_manager.config(
+            loader_helper=lambda location: pathlib.Path(location).read_text(),
+            cache_policy=cp.LRUPolicy(max_items=1),
+            warm_cache=wc.WarmCache(),
+        )
+        for name in ("a", "b"):
+            (self.root / f"{name}.txt").write_text(f"old {name}")
+            self.test_manager.import_asset(name, str(self.root / f"{name}.txt"))
+        # Leaves "a" in the warm cache.
+        self.test_manager.get("a")
+        self.test_manager.get("b")
+        (self.root / "a.txt").write_text("new a")
+
+    def test_reload(self):
+        self.assertEqual(self.test_manager.reload("a"), "new a")
+        self.assertEqual(self.test_manager.get("a"), "new a")
+
+    def test_watcher(self):
+        file_watcher = watcher.FileWatcher(self.test_manager, use_inotify=False)
+        path = os.path.abspath(self.root / "a.txt")
+        file_watcher._changed[path] = 0.0
+        file_watcher._reload([path])
+        self.assertNotIn("a", self.test_manager.warm_cache)
+        self.assertEqual(self.test_manager.get("a"), "new a")
+
+
+if __name__ == "__main__":
+    unittest.main()
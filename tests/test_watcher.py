@@ -0,0 +1,100 @@
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import resource_manager as rm  # noqa: E402
+from src.resourceful import watcher as wt  # noqa: E402
+
+
+def text_loader(resource_location: pathlib.Path) -> str:
+    return resource_location.read_text()
+
+
+class WatcherTests:
+
+    use_inotify = False
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.temp_dir.name)
+        self.test_manager = rm.ResourceManager[str]("Test")
+        self.test_manager.config(loader_helper=text_loader)
+        for name in ("first", "second"):
+            (self.root / f"{name}.txt").write_text(f"{name} v1")
+            self.test_manager.import_asset(name, self.root / f"{name}.txt")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def rewrite(self, name: str, text: str):
+        path = self.root / f"{name}.txt"
+        path.write_text(text)
+        # Make sure the change is visible even on coarse timestamp file systems.
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_reloads_changed(self):
+        self.test_manager.get("first")
+        reloaded = threading.Event()
+        calls = []
+
+        def callback(asset_handle: str, asset: str):
+            calls.append((asset_handle, asset))
+            reloaded.set()
+
+        with wt.FileWatcher(
+            self.test_manager,
+            callback=callback,
+            debounce=0.05,
+            interval=0.05,
+            use_inotify=self.use_inotify,
+        ):
+            self.rewrite("first", "first v2")
+            # Uncached assets are left alone.
+            self.rewrite("second", "second v2")
+            self.assertTrue(reloaded.wait(5))
+
+        self.assertEqual(calls, [("first", "first v2")])
+        self.assertEqual(self.test_manager.get("first"), "first v2")
+        self.assertEqual(self.test_manager.get("second"), "second v2")
+
+
+class TestPollingWatcher(WatcherTests, unittest.TestCase):
+
+    use_inotify = False
+
+
+@unittest.skipUnless(wt._inotify_available(), "inotify is not available")
+class TestInotifyWatcher(WatcherTests, unittest.TestCase):
+
+    use_inotify = True
+
+
+class TestReload(unittest.TestCase):
+
+    def test_reload(self):
+        locations = {"test_num": 1}
+        test_manager = rm.ResourceManager[int]("Test")
+        test_manager.config(loader_helper=lambda key: locations.get(key))
+        test_manager.import_asset("test_num", "test_num")
+        test_manager.get("test_num")
+
+        locations["test_num"] = 2
+        self.assertEqual(test_manager.reload("test_num"), 2)
+        self.assertEqual(test_manager.get("test_num"), 2)
+
+        # Failed reloads keep the old asset
+        del locations["test_num"]
+        self.assertIsNone(test_manager.reload("test_num"))
+        self.assertEqual(test_manager.get("test_num"), 2)
+
+        with self.assertRaises(KeyError):
+            test_manager.reload("test_missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import gc
+import pathlib
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(str(pathlib.Path.cwd()))
+from src.resourceful import resource_manager as rm  # noqa: E402
+from src.resourceful import weak_cache as wc  # noqa: E402
+
+
+class Asset:
+    """
+    Stand-in for a resource that supports weak references.
+    """
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+def int_loader(resource_location: int) -> Asset | None:
+    if resource_location < 0:
+        return None
+    return Asset(resource_location)
+
+
+class TestWeakCache(unittest.TestCase):
+
+    def test_release(self):
+        released: list[str] = []
+        cache = wc.WeakCache(on_release=released.append)
+        asset = Asset(1)
+        cache["asset"] = asset
+        cache["number"] = 2
+
+        self.assertIs(cache.get("asset"), asset)
+        self.assertIn("asset", cache)
+        self.assertEqual(len(cache), 2)
+
+        del asset
+        gc.collect()
+        self.assertIsNone(cache.get("asset"))
+        self.assertNotIn("asset", cache)
+        self.assertEqual(released, ["asset"])
+        # Not weakly referenceable, so held normally
+        self.assertEqual(cache.get("number"), 2)
+        self.assertEqual(list(cache), ["number"])
+
+    def test_replaced(self):
+        released: list[str] = []
+        cache = wc.WeakCache(on_release=released.append)
+        old_asset = Asset(1)
+        cache["asset"] = old_asset
+        new_asset = Asset(2)
+        cache["asset"] = new_asset
+
+        del old_asset
+        gc.collect()
+        self.assertIs(cache.get("asset"), new_asset)
+        self.assertEqual(released, [])
+
+    def test_grace_period(self):
+        cache = wc.WeakCache(grace_period=0.05)
+        cache["asset"] = Asset(1)
+        gc.collect()
+        self.assertIsNotNone(cache.get("asset"))
+
+        time.sleep(0.06)
+        cache.sweep()
+        gc.collect()
+        self.assertIsNone(cache.get("asset"))
+
+    def test_release_outside_lock(self):
+        lock_free: list[bool] = []
+
+        def on_release(key: str) -> None:
+            # Another thread, such as one caching an asset while holding the
+            # manager's lock, must be able to use the cache meanwhile.
+            def try_lock() -> None:
+                acquired = cache._lock.acquire(timeout=1)
+                if acquired:
+                    cache._lock.release()
+                lock_free.append(acquired)
+
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+
+        cache = wc.WeakCache(grace_period=0.01, on_release=on_release)
+        cache["asset"] = Asset(1)
+        gc.collect()
+        time.sleep(0.02)
+        # Expires the first asset, releasing it.
+        cache["other"] = Asset(2)
+        self.assertEqual(lock_free, [True])
+
+
+class TestWeakResourceManager(unittest.TestCase):
+
+    def setUp(self):
+        self.test_manager = rm.ResourceManager[Asset]("Test")
+        self.test_manager.config(loader_helper=int_loader, weak_cache=True)
+        self.test_manager.import_asset("test_asset", 1)
+
+    def test_get(self):
+        asset = self.test_manager.get("test_asset")
+        self.assertIs(self.test_manager.get("test_asset"), asset)
+
+        del asset
+        gc.collect()
+        self.assertEqual(len(self.test_manager.cache), 0)
+        # Reloaded on demand
+        self.assertEqual(self.test_manager.get("test_asset").value, 1)
+
+    def test_switch_modes(self):
+        self.test_manager.config(weak_cache=False)
+        self.test_manager.get("test_asset")
+        gc.collect()
+        self.assertEqual(len(self.test_manager.cache), 1)
+
+        self.test_manager.config(weak_cache=True, grace_period=60)
+        gc.collect()
+        self.assertEqual(len(self.test_manager.cache), 1)
+        self.test_manager.config(grace_period=0)
+        self.test_manager.cache.sweep()
+        gc.collect()
+        self.assertEqual(len(self.test_manager.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()